@@ -0,0 +1,127 @@
+"""
+Motor de reglas de alerta declarativas
+Cada regla de ALERT_RULES (config.py) se compila una vez a una evaluación
+vectorizada sobre una serie mensual. La ingesta la aplica a la historia
+completa al crear la base de datos y después solo a los meses nuevos (con el
+contexto mínimo que la regla necesita); el estado se guarda en alert_state.
+
+Tipos de regla:
+    threshold       el valor está por encima/debajo del umbral
+    crossing        el valor cruza el umbral ese mes
+    streak          la condición se cumple `months` meses seguidos
+    rate_of_change  el cambio (o cambio % si `percent`) en `months` meses cruza el umbral
+"""
+
+import numpy as np
+
+# Meses recientes que se vuelven a evaluar en cada ingesta (revisiones de BLS)
+RESCORE_MONTHS = 3
+
+
+def _base_transform(rule):
+    """
+    Transformación (nombre, rezago) sobre la que se evalúa la condición, o None para niveles
+    """
+    if rule['type'] == 'rate_of_change':
+        return ('pct_change' if rule.get('percent') else 'change', rule['months'])
+    transform = rule.get('transform')
+    return (transform['name'], transform['lag']) if transform else None
+
+
+def rule_lookback(rule):
+    """
+    Meses previos que necesita la regla para evaluar un mes
+    """
+    transform = _base_transform(rule)
+    lookback = transform[1] if transform else 0
+    if rule['type'] == 'streak':
+        lookback += rule['months'] - 1
+    elif rule['type'] == 'crossing':
+        lookback += 1
+    return lookback
+
+
+def compile_rule(rule):
+    """
+    Compila una regla a una función vectorizada
+
+    Args:
+        rule (dict): Regla con la estructura de ALERT_RULES
+
+    Returns:
+        callable: f(meses, valores) -> (valor evaluado, activa) alineados con los meses
+    """
+    transform = _base_transform(rule)
+    threshold = rule['threshold']
+    above = rule['direction'] == 'above'
+    kind = rule['type']
+    streak = rule['months'] if kind == 'streak' else 1
+
+    def evaluate(months, values):
+        months = np.asarray(months)
+        if len(months) == 0:
+            return np.array([]), np.array([], dtype=bool)
+
+        # Calendario contiguo: los rezagos se miden en meses, no en posiciones
+        positions = months - months[0]
+        grid = np.full(int(positions[-1]) + 1, np.nan)
+        grid[positions] = values
+
+        signal = grid
+        if transform is not None:
+            name, lag = transform
+            lagged = np.full_like(grid, np.nan)
+            lagged[lag:] = grid[:-lag]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                signal = grid - lagged if name == 'change' else (grid / lagged - 1) * 100
+
+        with np.errstate(invalid='ignore'):
+            hit = signal > threshold if above else signal < threshold
+
+        if kind == 'crossing':
+            previous_valid = np.concatenate([[False], ~np.isnan(signal[:-1])])
+            previous_hit = np.concatenate([[False], hit[:-1]])
+            active = hit & previous_valid & ~previous_hit
+        elif kind == 'streak':
+            counts = np.concatenate([[0], np.cumsum(hit)])
+            active = np.zeros(len(hit), dtype=bool)
+            active[streak - 1:] = counts[streak:] - counts[:-streak] == streak
+        else:
+            active = hit
+
+        return signal[positions], active[positions]
+
+    return evaluate
+
+
+def compile_rules(rules):
+    """
+    Compila todas las reglas {nombre: función}
+    """
+    return {name: compile_rule(rule) for name, rule in rules.items()}
+
+
+def format_message(rule, value):
+    """
+    Mensaje de la regla activa con su valor y umbral
+    """
+    return rule['message'].format(value=value, threshold=rule['threshold'], months=rule.get('months'))
+
+
+def firing_episodes(months):
+    """
+    Agrupa los meses en que una regla estuvo activa en episodios consecutivos
+
+    Args:
+        months (np.ndarray): Ordinales de mes ordenados
+
+    Returns:
+        list: Tuplas (primer mes, último mes)
+    """
+    months = np.asarray(months)
+    if len(months) == 0:
+        return []
+    breaks = np.nonzero(np.diff(months) != 1)[0]
+    starts = np.concatenate([[0], breaks + 1])
+    ends = np.concatenate([breaks, [len(months) - 1]])
+    return [(int(months[start]), int(months[end])) for start, end in zip(starts, ends)]
@@ -0,0 +1,124 @@
+"""
+Detección de anomalías en la ingesta
+Cada observación nueva se compara con estadísticas robustas de los meses
+previos, para todas las series a la vez sobre el panel alineado:
+    - mad_z: cambio mensual frente a la mediana y MAD de los cambios recientes
+    - seasonal_z: residuo de la descomposición estacional frente a su MAD reciente
+"""
+
+import warnings
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from seasonal import decompose
+
+# Factor que convierte la MAD en un estimador de la desviación estándar (normal)
+MAD_SCALE = 1.4826
+
+
+def rolling_robust_z(matrix, window, min_periods, start=0):
+    """
+    Z robusto de cada celda frente a la mediana y MAD de los `window` meses previos
+
+    Args:
+        matrix (np.ndarray): Matriz (series × meses) con NaN donde no hay dato
+        window (int): Meses previos usados como referencia
+        min_periods (int): Mínimo de datos válidos en la ventana
+        start (int): Primera columna a calcular (las anteriores quedan en NaN)
+
+    Returns:
+        np.ndarray: Matriz de z robustos con la forma de `matrix`
+    """
+    n_series, n_months = matrix.shape
+    z = np.full(matrix.shape, np.nan)
+    if start >= n_months:
+        return z
+
+    # La ventana de la columna t cubre los meses t-window..t-1
+    padded = np.concatenate([np.full((n_series, window), np.nan), matrix], axis=1)
+    windows = sliding_window_view(padded[:, start:n_months + window - 1], window, axis=1)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # Ventanas sin datos (All-NaN slice)
+        median = np.nanmedian(windows, axis=2)
+        mad = np.nanmedian(np.abs(windows - median[..., None]), axis=2)
+    count = (~np.isnan(windows)).sum(axis=2)
+    scale = MAD_SCALE * mad
+
+    current = matrix[:, start:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z[:, start:] = np.where((count >= min_periods) & (scale > 0), (current - median) / scale, np.nan)
+    return z
+
+
+def seasonal_residuals(panel, log_keys=(), min_months=36):
+    """
+    Residuo de la descomposición estacional de cada serie, alineado con el panel
+
+    Args:
+        panel (MonthlyPanel): Panel de las series a evaluar
+        log_keys (iterable): Series en niveles que se descomponen en logaritmos
+        min_months (int): Historia mínima para estimar la estacionalidad
+
+    Returns:
+        np.ndarray: Matriz (series × meses) de residuos (NaN donde no hay dato)
+    """
+    residuals = np.full(panel.values.shape, np.nan)
+    log_keys = set(log_keys)
+
+    for row, key in enumerate(panel.keys):
+        valid = np.nonzero(panel.mask[row])[0]
+        if len(valid) < min_months:
+            continue
+        # Calendario contiguo entre el primer y el último dato (huecos interpolados)
+        first, last = valid[0], valid[-1]
+        values = np.interp(np.arange(first, last + 1), valid, panel.values[row, valid])
+        if key in log_keys and np.all(values > 0):
+            values = np.log(values)
+        residual = decompose(values)['residual']
+        residuals[row, valid] = residual[valid - first]
+    return residuals
+
+
+def score_panel(panel, start_months, config, log_keys=()):
+    """
+    Evalúa las observaciones nuevas de todas las series del panel
+
+    Args:
+        panel (MonthlyPanel): Panel con la historia completa de las series escritas
+        start_months (dict): {clave: primer ordinal de mes a evaluar}
+        config (dict): Configuración con la estructura de ANOMALY_CONFIG
+        log_keys (iterable): Series en niveles (residuo estacional en logaritmos)
+
+    Returns:
+        list: Diccionarios key, month, value, change, mad_z y seasonal_z de los puntos marcados
+    """
+    if not len(panel) or not len(panel.months):
+        return []
+
+    first_month = int(panel.months[0])
+    starts = np.array([start_months.get(key, first_month) - first_month for key in panel.keys])
+    # Las columnas anteriores a la primera evaluada no se calculan
+    start_col = int(max(starts.min(), 0))
+
+    changes = panel.transform('change', 1)
+    mad_z = rolling_robust_z(changes, config['window'], config['min_periods'], start_col)
+    seasonal_z = rolling_robust_z(seasonal_residuals(panel, log_keys), config['window'],
+                                  config['min_periods'], start_col)
+
+    columns = np.arange(len(panel.months))
+    to_score = panel.mask & (columns[None, :] >= starts[:, None])
+    with np.errstate(invalid='ignore'):
+        flagged = to_score & ((np.abs(mad_z) >= config['threshold']) |
+                              (np.abs(seasonal_z) >= config['seasonal_threshold']))
+
+    results = []
+    for row, col in zip(*np.nonzero(flagged)):
+        results.append({
+            'key': panel.keys[row],
+            'month': first_month + int(col),
+            'value': float(panel.values[row, col]),
+            'change': float(changes[row, col]) if not np.isnan(changes[row, col]) else None,
+            'mad_z': float(mad_z[row, col]) if not np.isnan(mad_z[row, col]) else None,
+            'seasonal_z': float(seasonal_z[row, col]) if not np.isnan(seasonal_z[row, col]) else None
+        })
+    return results
@@ -0,0 +1,113 @@
+"""
+Actualización de datos en segundo plano para el dashboard
+Ejecuta refresh_all_data en un hilo de trabajo y expone el progreso por serie,
+mientras las sesiones siguen sirviendo el snapshot publicado anteriormente.
+"""
+
+import threading
+import logging
+from datetime import datetime
+from data_collector import LaborMarketDataCollector
+
+
+class BackgroundRefresher:
+    """
+    Ejecuta una actualización completa desde las APIs en un hilo de fondo.
+    Una única instancia se comparte por proceso (ver get_refresher).
+    """
+
+    def __init__(self, collector_factory=LaborMarketDataCollector):
+        self.collector_factory = collector_factory
+        self._lock = threading.Lock()
+        self._thread = None
+        self._state = self._initial_state()
+
+    def _initial_state(self):
+        return {
+            'status': 'idle',          # idle | running | done | error
+            'series': {},              # {series_id: running | done | error}
+            'completed': 0,
+            'total': 0,
+            'started_at': None,
+            'finished_at': None,
+            'snapshot_id': None,
+            'error': None
+        }
+
+    def is_running(self):
+        """
+        Indica si hay una actualización en curso
+        """
+        with self._lock:
+            return self._state['status'] == 'running'
+
+    def start(self):
+        """
+        Inicia una actualización en segundo plano si no hay otra en curso
+
+        Returns:
+            bool: True si se inició una nueva actualización
+        """
+        with self._lock:
+            if self._state['status'] == 'running':
+                return False
+
+            self._state = self._initial_state()
+            self._state['status'] = 'running'
+            self._state['started_at'] = datetime.now()
+
+            self._thread = threading.Thread(target=self._run, name='labor-data-refresh', daemon=True)
+            self._thread.start()
+            return True
+
+    def get_progress(self):
+        """
+        Obtiene una copia del estado actual de la actualización
+
+        Returns:
+            dict: Estado, progreso por serie y resultado
+        """
+        with self._lock:
+            state = dict(self._state)
+            state['series'] = dict(self._state['series'])
+            return state
+
+    def _on_progress(self, series_id, status, completed, total):
+        with self._lock:
+            self._state['series'][series_id] = status
+            self._state['completed'] = completed
+            self._state['total'] = total
+
+    def _run(self):
+        try:
+            collector = self.collector_factory()
+            snapshot_id = collector.refresh_all_data(progress_callback=self._on_progress)
+
+            with self._lock:
+                self._state['status'] = 'done'
+                self._state['snapshot_id'] = snapshot_id
+
+        except Exception as e:
+            logging.error(f"Error en actualización en segundo plano: {e}")
+            with self._lock:
+                self._state['status'] = 'error'
+                self._state['error'] = str(e)
+
+        finally:
+            with self._lock:
+                self._state['finished_at'] = datetime.now()
+
+
+_refresher = None
+_refresher_lock = threading.Lock()
+
+
+def get_refresher():
+    """
+    Obtiene la instancia de BackgroundRefresher compartida por todo el proceso
+    """
+    global _refresher
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher = BackgroundRefresher()
+        return _refresher
@@ -0,0 +1,138 @@
+"""
+Caché negativa con backoff exponencial para fuentes y series que fallan
+Registra los fallos por fuente (p. ej. 'source:FRED') y por serie
+(p. ej. 'series:UNRATE') en SQLite, de modo que todas las sesiones y procesos
+respeten la misma ventana de espera en lugar de repetir el intento fallido.
+"""
+
+import sqlite3
+import time
+import logging
+from config import BACKOFF_CONFIG
+
+
+class BackoffTracker:
+    """
+    Estado de backoff persistido en la tabla refresh_backoff
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def get_delay_seconds(self, failures):
+        """
+        Calcula la ventana de espera para un número de fallos consecutivos
+        """
+        delay = BACKOFF_CONFIG['base_seconds'] * BACKOFF_CONFIG['multiplier'] ** max(failures - 1, 0)
+        return min(delay, BACKOFF_CONFIG['max_seconds'])
+
+    def blocked_for(self, key):
+        """
+        Segundos restantes de la ventana de backoff para una clave
+
+        Returns:
+            float: 0 si se puede intentar de nuevo
+        """
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                'SELECT next_attempt_at FROM refresh_backoff WHERE key = ?', (key,)
+            ).fetchone()
+            conn.close()
+        except sqlite3.Error as e:
+            logging.error(f"Error leyendo estado de backoff para {key}: {e}")
+            return 0
+
+        if not row:
+            return 0
+        return max(0.0, row[0] - time.time())
+
+    def is_blocked(self, key):
+        """
+        Indica si la clave está dentro de su ventana de backoff
+        """
+        return self.blocked_for(key) > 0
+
+    def record_failure(self, key, error):
+        """
+        Registra un fallo y amplía la ventana de backoff exponencialmente
+
+        Returns:
+            float: Segundos hasta el próximo intento permitido
+        """
+        now = time.time()
+        try:
+            conn = self._connect()
+            row = conn.execute('SELECT failures FROM refresh_backoff WHERE key = ?', (key,)).fetchone()
+            failures = (row[0] if row else 0) + 1
+            delay = self.get_delay_seconds(failures)
+
+            conn.execute('''
+                INSERT OR REPLACE INTO refresh_backoff
+                (key, failures, last_error, last_failure_at, next_attempt_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (key, failures, str(error)[:500], now, now + delay))
+            conn.commit()
+            conn.close()
+
+            logging.warning(f"Backoff {key}: {failures} fallo(s), próximo intento en {delay / 60:.0f} min")
+            return delay
+
+        except sqlite3.Error as e:
+            logging.error(f"Error registrando backoff para {key}: {e}")
+            return 0
+
+    def record_success(self, key):
+        """
+        Limpia el estado de backoff de una clave tras un intento exitoso
+        """
+        try:
+            conn = self._connect()
+            conn.execute('DELETE FROM refresh_backoff WHERE key = ?', (key,))
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logging.error(f"Error limpiando backoff para {key}: {e}")
+
+    def reset(self):
+        """
+        Elimina todo el estado de backoff (reintento manual)
+        """
+        try:
+            conn = self._connect()
+            conn.execute('DELETE FROM refresh_backoff')
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logging.error(f"Error reiniciando backoff: {e}")
+
+    def get_state(self):
+        """
+        Obtiene las claves con fallos registrados
+
+        Returns:
+            list: Diccionarios con clave, fallos, último error y segundos restantes
+        """
+        try:
+            conn = self._connect()
+            rows = conn.execute('''
+                SELECT key, failures, last_error, last_failure_at, next_attempt_at
+                FROM refresh_backoff
+                ORDER BY key
+            ''').fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            logging.error(f"Error leyendo estado de backoff: {e}")
+            return []
+
+        now = time.time()
+        return [{
+            'key': key,
+            'failures': failures,
+            'last_error': last_error,
+            'last_failure_at': last_failure_at,
+            'retry_in_seconds': max(0.0, next_attempt_at - now)
+        } for key, failures, last_error, last_failure_at, next_attempt_at in rows]
@@ -0,0 +1,69 @@
+"""
+Curva de Beveridge precalculada sobre el panel mensual
+Tasa de vacantes (vacantes / (nóminas + vacantes)) frente a tasa de desempleo,
+alineadas una sola vez por snapshot. La selección de períodos solo recorta
+vistas de los arreglos, sin uniones ni conversiones por renderizado.
+"""
+
+import numpy as np
+from monthly_series import month_ordinal, month_ceil_ordinal
+
+
+class BeveridgeCurve:
+    """
+    Trayectoria mensual vacantes/desempleo con arreglos de solo lectura
+    """
+
+    # Series del panel necesarias para la curva
+    required_keys = ('job_openings', 'payroll_employment', 'unemployment_rate')
+
+    def __init__(self, panel):
+        """
+        Args:
+            panel (MonthlyPanel): Panel alineado del snapshot
+        """
+        if all(key in panel for key in self.required_keys):
+            rows = [panel.row_index(key) for key in self.required_keys]
+            valid = panel.mask[rows].all(axis=0)
+            openings, payroll, unemployment = panel.values[rows][:, valid]
+            self.months = panel.months[valid]
+            self.unemployment_rate = unemployment
+            self.vacancy_rate = openings / (payroll + openings) * 100
+        else:
+            self.months = np.array([], dtype=np.int32)
+            self.unemployment_rate = np.array([])
+            self.vacancy_rate = np.array([])
+
+        # Año fraccionario (escala de color temporal) y etiqueta 'YYYY-MM' de cada punto
+        self.years = 1970 + self.months / 12
+        self.labels = np.datetime_as_string(self.months.astype('datetime64[M]'), unit='M')
+
+        for array in (self.months, self.unemployment_rate, self.vacancy_rate, self.years, self.labels):
+            array.flags.writeable = False
+
+    def __len__(self):
+        return len(self.months)
+
+    def window(self, start=None, end=None):
+        """
+        Posiciones de los puntos entre dos fechas (mismo criterio que MonthlySeries.window)
+
+        Returns:
+            slice: Rango para indexar months, unemployment_rate, vacancy_rate y years
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.months, month_ceil_ordinal(start), side='left'))
+        hi = len(self.months) if end is None else int(np.searchsorted(self.months, month_ordinal(end), side='right'))
+        return slice(lo, hi)
+
+    def coverage(self, start, end):
+        """
+        Cobertura de un período por la curva (None = sin límite en ese extremo)
+
+        Returns:
+            tuple: (número de puntos en el período, True si la curva cubre todo el período)
+        """
+        period = self.window(start, end)
+        points = period.stop - period.start
+        complete = bool(points and (start is None or self.months[0] <= month_ceil_ordinal(start))
+                        and (end is None or self.months[-1] >= month_ordinal(end)))
+        return points, complete
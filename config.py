@@ -33,7 +33,7 @@ SERIES_MAPPING = {
 
 # Series IDs para empleo por sector (BLS)
 SECTOR_EMPLOYMENT_SERIES = {
-    'Goods-Producing': 'CES1000000001',
+    'Mining and Logging': 'CES1000000001',
     'Construction': 'CES2000000001',
     'Manufacturing': 'CES3000000001',
     'Trade, Transportation, and Utilities': 'CES4000000001',
@@ -46,6 +46,74 @@ SECTOR_EMPLOYMENT_SERIES = {
     'Government': 'CES9000000001',
 }
 
+# Series IDs de empleo por industria CES (BLS) para el índice de difusión
+CES_INDUSTRY_SERIES = {
+    # Recursos naturales y construcción
+    'Logging': 'CES1011330001',
+    'Oil and Gas Extraction': 'CES1021100001',
+    'Mining, except Oil and Gas': 'CES1021200001',
+    'Support Activities for Mining': 'CES1021300001',
+    'Construction of Buildings': 'CES2023600001',
+    'Heavy and Civil Engineering Construction': 'CES2023700001',
+    'Specialty Trade Contractors': 'CES2023800001',
+    # Manufactura de bienes durables
+    'Wood Products': 'CES3132100001',
+    'Nonmetallic Mineral Products': 'CES3132700001',
+    'Primary Metals': 'CES3133100001',
+    'Fabricated Metal Products': 'CES3133200001',
+    'Machinery': 'CES3133300001',
+    'Computer and Electronic Products': 'CES3133400001',
+    'Electrical Equipment and Appliances': 'CES3133500001',
+    'Transportation Equipment': 'CES3133600001',
+    'Furniture and Related Products': 'CES3133700001',
+    'Miscellaneous Durable Goods Manufacturing': 'CES3133900001',
+    # Manufactura de bienes no durables
+    'Food Manufacturing': 'CES3231100001',
+    'Textile Mills': 'CES3231300001',
+    'Textile Product Mills': 'CES3231400001',
+    'Apparel': 'CES3231500001',
+    'Paper and Paper Products': 'CES3232200001',
+    'Printing and Related Support Activities': 'CES3232300001',
+    'Petroleum and Coal Products': 'CES3232400001',
+    'Chemicals': 'CES3232500001',
+    'Plastics and Rubber Products': 'CES3232600001',
+    'Miscellaneous Nondurable Goods Manufacturing': 'CES3232900001',
+    # Comercio, transporte y servicios públicos
+    'Wholesale Trade': 'CES4142000001',
+    'Retail Trade': 'CES4200000001',
+    'Transportation and Warehousing': 'CES4300000001',
+    'Utilities': 'CES4422000001',
+    # Información
+    'Motion Picture and Sound Recording': 'CES5051200001',
+    'Publishing Industries': 'CES5051300001',
+    'Telecommunications': 'CES5051700001',
+    # Actividades financieras
+    'Finance and Insurance': 'CES5552000001',
+    'Real Estate and Rental and Leasing': 'CES5553000001',
+    # Servicios profesionales y empresariales
+    'Professional, Scientific, and Technical Services': 'CES6054000001',
+    'Management of Companies and Enterprises': 'CES6055000001',
+    'Administrative and Waste Services': 'CES6056000001',
+    # Educación y salud
+    'Private Educational Services': 'CES6561000001',
+    'Ambulatory Health Care Services': 'CES6562100001',
+    'Hospitals': 'CES6562200001',
+    'Nursing and Residential Care Facilities': 'CES6562300001',
+    'Social Assistance': 'CES6562400001',
+    # Ocio y hostelería
+    'Arts, Entertainment, and Recreation': 'CES7071000001',
+    'Accommodation': 'CES7072100001',
+    'Food Services and Drinking Places': 'CES7072200001',
+    # Otros servicios
+    'Repair and Maintenance': 'CES8081100001',
+    'Personal and Laundry Services': 'CES8081200001',
+    'Membership Associations and Organizations': 'CES8081300001',
+    # Gobierno
+    'Federal Government': 'CES9091000001',
+    'State Government': 'CES9092000001',
+    'Local Government': 'CES9093000001',
+}
+
 # Configuración de datos y base de datos
 DATA_UPDATE_HOUR = int(os.getenv('DATA_UPDATE_HOUR', 9))
 CACHE_DURATION_HOURS = int(os.getenv('CACHE_DURATION_HOURS', 24))
@@ -64,6 +132,32 @@ DATA_SYSTEM_CONFIG = {
     'min_series_required': 5
 }
 
+# Coordinación de actualizaciones concurrentes (single-flight entre sesiones y procesos)
+REFRESH_LEASE_CONFIG = {
+    'ttl_seconds': 900,              # Expiración del lease si el proceso líder muere
+    'renew_interval_seconds': 60,    # Heartbeat del líder mientras la actualización sigue en curso
+    'wait_timeout_seconds': 600,     # Espera máxima de los seguidores
+    'poll_interval_seconds': 1.0     # Intervalo de sondeo del lease entre procesos
+}
+
+# Backoff exponencial ante fallos de credenciales o de las APIs (caché negativa)
+BACKOFF_CONFIG = {
+    'base_seconds': 60,              # Espera tras el primer fallo
+    'multiplier': 2,                 # Factor de crecimiento por fallo consecutivo
+    'max_seconds': 6 * 3600          # Espera máxima entre intentos
+}
+
+# Presupuesto de arranque del dashboard (verificado con startup_profile.py --check)
+STARTUP_BUDGET = {
+    'import_ms': 2000,                         # Importación completa de dashboard.py
+    'deferred_modules': ['plotly.express', 'requests'],  # No deben importarse al arrancar
+    'phases': {
+        'importaciones': 2000,                 # Módulos del dashboard
+        'primer_render': 1000,                 # Hasta mostrar KPIs y alertas
+        'render_completo': 4000                # Hasta completar todos los paneles
+    }
+}
+
 # Configuración de Streamlit
 STREAMLIT_CONFIG = {
     'page_title': "Dashboard Mercado Laboral USA",
@@ -88,6 +182,16 @@ COLOR_PALETTE = {
     'chart_bg': 'rgba(0,0,0,0)' # Fondo gráficos
 }
 
+# Configuración de renderizado de gráficos (downsampling y WebGL)
+CHART_RENDER_CONFIG = {
+    'default_width_px': 1200,      # Ancho estimado de un gráfico a ancho completo
+    'half_width_px': 600,          # Ancho estimado de un gráfico en media columna
+    'points_per_pixel': 1.0,       # Máximo de puntos enviados por píxel horizontal
+    'webgl_threshold': 2000,       # A partir de este número de puntos usar Scattergl
+    'markers_threshold': 240,      # Ocultar marcadores por encima de este número de puntos
+    'resolution_levels': [2000, 1000, 500, 250]  # Niveles precalculados al guardar datos
+}
+
 # Límites para alertas (thresholds)
 ALERT_THRESHOLDS = {
     'unemployment_rate_high': 5.0,        # % - Alerta si sube mucho
@@ -98,6 +202,182 @@ ALERT_THRESHOLDS = {
     'participation_rate_low': 62.0        # % - Participación laboral baja
 }
 
+# Reglas de alerta declarativas (ver alert_rules.py); se evalúan en la ingesta
+ALERT_RULES = {
+    'unemployment_rate_high': {
+        'label': 'Desempleo alto',
+        'metric': 'unemployment_rate',
+        'type': 'threshold',
+        'direction': 'above',
+        'threshold': ALERT_THRESHOLDS['unemployment_rate_high'],
+        'message': "Tasa de desempleo alta: {value:.1f}% (umbral: {threshold}%)"
+    },
+    'unemployment_rising': {
+        'label': 'Desempleo al alza',
+        'metric': 'unemployment_rate',
+        'type': 'streak',
+        'transform': {'name': 'change', 'lag': 1},
+        'direction': 'above',
+        'threshold': 0.0,
+        'months': 3,
+        'message': "Desempleo al alza {months} meses seguidos (último cambio: {value:+.1f} pp)"
+    },
+    'job_openings_low': {
+        'label': 'Vacantes bajas',
+        'metric': 'job_openings',
+        'type': 'threshold',
+        'direction': 'below',
+        'threshold': ALERT_THRESHOLDS['job_openings_low'],
+        'message': "Vacantes bajas: {value:,.0f} (umbral: {threshold:,.0f})"
+    },
+    'quits_rate_low': {
+        'label': 'Renuncias bajas',
+        'metric': 'quits_rate',
+        'type': 'threshold',
+        'direction': 'below',
+        'threshold': ALERT_THRESHOLDS['quits_rate_low'],
+        'message': "Confianza laboral baja: {value:.1f}% renuncias (umbral: {threshold}%)"
+    },
+    'layoffs_rate_high': {
+        'label': 'Despidos altos',
+        'metric': 'layoffs_rate',
+        'type': 'threshold',
+        'direction': 'above',
+        'threshold': ALERT_THRESHOLDS['layoffs_rate_high'],
+        'message': "Despidos altos: {value:.1f}% (umbral: {threshold}%)"
+    },
+    'layoffs_rate_crossing': {
+        'label': 'Despidos cruzan el umbral',
+        'metric': 'layoffs_rate',
+        'type': 'crossing',
+        'direction': 'above',
+        'threshold': ALERT_THRESHOLDS['layoffs_rate_high'],
+        'message': "Los despidos superaron el umbral este mes: {value:.1f}% (umbral: {threshold}%)"
+    },
+    'wage_growth_low': {
+        'label': 'Crecimiento salarial bajo',
+        'metric': 'avg_hourly_earnings',
+        'type': 'rate_of_change',
+        'percent': True,
+        'months': 12,
+        'direction': 'below',
+        'threshold': ALERT_THRESHOLDS['wage_growth_low'],
+        'message': "Crecimiento salarial bajo: {value:.1f}% interanual (umbral: {threshold}%)"
+    },
+    'payroll_decline': {
+        'label': 'Pérdida de empleo',
+        'metric': 'payroll_employment',
+        'type': 'rate_of_change',
+        'months': 3,
+        'direction': 'below',
+        'threshold': 0.0,
+        'message': "Nóminas en descenso: {value:+,.0f} mil empleos en {months} meses"
+    },
+    'participation_rate_low': {
+        'label': 'Participación baja',
+        'metric': 'labor_force_participation',
+        'type': 'threshold',
+        'direction': 'below',
+        'threshold': ALERT_THRESHOLDS['participation_rate_low'],
+        'message': "Participación laboral baja: {value:.1f}% (umbral: {threshold}%)"
+    }
+}
+
+# Reglas de salud por métrica (indicador verde/amarillo/rojo de los KPIs)
+HEALTH_RULES = {
+    'unemployment_rate': {
+        'good_threshold': 4.0,
+        'bad_threshold': 6.0,
+        'lower_is_better': True
+    },
+    'job_openings': {
+        'good_threshold': 8000000,
+        'bad_threshold': 6000000,
+        'lower_is_better': False
+    },
+    'quits_rate': {
+        'good_threshold': 2.3,
+        'bad_threshold': 1.8,
+        'lower_is_better': False
+    },
+    'avg_hourly_earnings': {
+        'good_threshold': 3.0,  # % growth
+        'bad_threshold': 1.5,
+        'lower_is_better': False
+    },
+    'payroll_employment': {
+        'good_threshold': 150000,  # monthly change
+        'bad_threshold': 50000,
+        'lower_is_better': False
+    }
+}
+
+# Señales de recesión calculadas incrementalmente en la ingesta (ver recession_signals.py)
+RECESSION_SIGNALS = {
+    'sahm_rule': {
+        'type': 'sahm',
+        'metric': 'unemployment_rate',
+        'label': 'Regla de Sahm',
+        'description': 'Promedio de 3 meses del desempleo menos su mínimo de los 12 meses previos',
+        'threshold': 0.5,        # pp - Se activa al alcanzar o superar el umbral
+        'direction': 'above',
+        'unit': 'pp'
+    },
+    'payroll_momentum': {
+        'type': 'average_change',
+        'metric': 'payroll_employment',
+        'label': 'Nóminas (prom. 3 meses)',
+        'description': 'Variación mensual promedio de las nóminas en los últimos 3 meses',
+        'window': 3,
+        'threshold': 0.0,        # miles - Se activa con pérdida neta de empleo
+        'direction': 'below',
+        'unit': 'K'
+    }
+}
+
+# Descomposición estacional por lotes (ver seasonal.py y update_data.py)
+SEASONAL_DECOMPOSITION_CONFIG = {
+    'series': None,                  # None = todas las series almacenadas
+    'multiplicative_series': [       # Series en niveles: descomposición multiplicativa
+        SERIES_MAPPING['job_openings'],
+        SERIES_MAPPING['payroll_employment'],
+        *SECTOR_EMPLOYMENT_SERIES.values()
+    ],
+    'min_years': 3,                  # Historia mínima para estimar la estacionalidad
+    'max_workers': None,             # Procesos del pool (None = número de CPUs)
+    'min_parallel_series': 8         # Lotes menores se procesan en serie
+}
+
+# Detección de anomalías en la ingesta (ver anomalies.py)
+ANOMALY_CONFIG = {
+    'window': 36,                    # Meses previos de referencia
+    'min_periods': 24,               # Datos mínimos en la ventana para evaluar
+    'threshold': 3.5,                # |z| robusto del cambio mensual
+    'seasonal_threshold': 3.5,       # |z| robusto del residuo estacional
+    'rescore_months': 3              # Meses recientes reevaluados (revisiones de BLS)
+}
+
+# Índice de difusión del empleo sobre CES_INDUSTRY_SERIES (ver diffusion.py)
+DIFFUSION_CONFIG = {
+    'series_id': 'CES_DIFFUSION',    # ID con que se guarda en derived_series
+    'spans': [1, 3, 6],              # Meses sobre los que se mide el cambio de cada industria
+    'min_industries': 25             # Industrias con dato necesarias para publicar un mes
+}
+
+# Pronósticos de corto plazo por serie (ver forecasting.py y update_data.py)
+FORECAST_CONFIG = {
+    'series': None,                  # None = todas las series almacenadas
+    'models': ['holt', 'ar'],        # Candidatos; se elige el de menor error de un paso
+    'ar_order': 3,
+    'horizon': 6,                    # Meses pronosticados
+    'confidence': 0.9,               # Intervalo mostrado (clave de forecasting.Z_SCORES)
+    'min_observations': 36,
+    'revision_window': 12,           # Meses recientes comparados para detectar revisiones
+    'refit_every': 12,               # Actualizaciones incrementales antes de reestimar
+    'max_workers': None,             # Procesos del pool (None = número de CPUs)
+    'min_parallel_series': 8
+}
+
 # Configuración de fechas (últimos N años para análisis)
 YEARS_OF_DATA = 5
 
@@ -113,7 +393,10 @@ BLS_API_CONFIG = {
     'seriesid': [],  # Se llena dinámicamente
     'startyear': str(2020),
     'endyear': str(2025),
-    'registrationkey': BLS_API_KEY if BLS_API_KEY else None
+    'registrationkey': BLS_API_KEY if BLS_API_KEY else None,
+    'max_series_per_request': 50 if BLS_API_KEY else 25,  # Límite de la API v2 por petición
+    'max_years_per_request': 20 if BLS_API_KEY else 10,   # Años por petición (v2 con/sin registro)
+    'history_start_year': 2000  # Nóminas y sectores: historia completa para señales y curva de Beveridge
 }
 
 # Textos y labels para la interfaz
@@ -205,6 +488,72 @@ FILTER_PRESETS = {
     }
 }
 
+# Curva de Beveridge: tasa de vacantes vs tasa de desempleo (pestaña Análisis Avanzado)
+BEVERIDGE_CONFIG = {
+    'default_start': '2000-12-01',  # Inicio de la encuesta JOLTS
+    'colorscale': 'Viridis',
+    'cycles': {
+        'expansion_2000s': {
+            'name': 'Expansión 2001-2007',
+            'start_date': '2001-12-01',
+            'end_date': '2007-11-30'
+        },
+        'gran_recesion': {
+            'name': 'Gran Recesión y recuperación',
+            'start_date': '2007-12-01',
+            'end_date': '2019-12-31'
+        },
+        'covid': {
+            'name': 'COVID',
+            'start_date': '2020-01-01',
+            'end_date': '2021-12-31'
+        },
+        'post_covid': {
+            'name': 'Normalización post-COVID',
+            'start_date': '2022-01-01',
+            'end_date': None  # None = hasta la fecha más reciente
+        }
+    },
+    'default_cycles': ['covid', 'post_covid']
+}
+
+# Correlación cruzada adelanto/rezago entre series (pestaña Análisis Avanzado)
+LEAD_LAG_CONFIG = {
+    'transform': 'change',           # Transformación del panel que se correlaciona
+    'transform_args': (12,),         # Variación interanual: evita correlaciones espurias de tendencia
+    'max_lag': 24,                   # Meses de adelanto/rezago evaluados
+    'min_overlap': 36,               # Meses en común mínimos para reportar una correlación
+    'default_target': 'unemployment_rate',
+    'top_n': 5                       # Indicadores adelantados mostrados
+}
+
+# Revisiones de datos ya publicados detectadas en la ingesta (pestaña Análisis Avanzado)
+REVISIONS_CONFIG = {
+    'metric': 'payroll_employment',  # Serie cuyas revisiones se muestran
+    'releases': 6,                   # Publicaciones recientes mostradas
+    'unit': 'K'                      # Nóminas en miles de empleos
+}
+
+# Contribución de cada sector al cambio mensual de las nóminas (ver contributions.py)
+SECTOR_CONTRIBUTION_CONFIG = {
+    'total': 'payroll_employment',   # Serie del panel que se descompone
+    'group': 'sector_employment',    # Grupo del panel con las series por sector (supersectores CES)
+    'default_months': 24,            # Meses mostrados por defecto
+    'max_sectors': 12                # Sectores mostrados; el resto se agrupa
+}
+
+# Comparación de métricas entre ventanas temporales (pestaña Análisis Avanzado)
+WINDOW_COMPARISON_CONFIG = {
+    'default_windows': ['pre_covid', 'post_covid', 'ultimo_ano'],  # Claves de FILTER_PRESETS
+    'default_metrics': ['unemployment_rate', 'labor_force_participation', 'quits_rate', 'avg_hourly_earnings'],
+    'statistics': {
+        'mean': 'Promedio',
+        'std': 'Desv. Estándar',
+        'min': 'Mínimo',
+        'max': 'Máximo'
+    }
+}
+
 # Opciones de filtros temporales
 FILTER_TYPES = {
     'preset': 'Períodos Predefinidos',
@@ -0,0 +1,90 @@
+"""
+Contribución de cada sector al cambio mensual de las nóminas
+Cada serie del grupo es un supersector CES publicado y sin solapamientos, así
+que los cambios de todos los sectores salen de una sola diferencia sobre la
+submatriz (sectores × meses) del panel. El coste crece con el tamaño de la
+matriz, no con bucles por sector.
+"""
+
+import numpy as np
+from monthly_series import month_ordinal, month_ceil_ordinal
+
+
+class SectorContributions:
+    """
+    Cambio mensual de cada sector y del total sobre los meses con todos los datos
+    """
+
+    def __init__(self, panel, total_key, group):
+        """
+        Args:
+            panel (MonthlyPanel): Panel alineado del snapshot
+            total_key (str): Serie del panel que se descompone (p. ej. payroll_employment)
+            group (str): Grupo del panel con las series por sector (claves 'grupo/nombre')
+        """
+        prefix = f"{group}/"
+        keys = [key for key in panel.keys if key.startswith(prefix)]
+        self.sectors = [key[len(prefix):] for key in keys]
+
+        if keys and total_key in panel:
+            # Los meses sin dato ya son NaN en el panel y se descartan abajo
+            levels = panel.values[[panel.row_index(key) for key in keys]]
+            changes = np.full(levels.shape, np.nan)
+            changes[:, 1:] = levels[:, 1:] - levels[:, :-1]
+            total_change = panel.transform('change', 1)[panel.row_index(total_key)]
+
+            # Meses con el cambio del total y de todos los sectores
+            valid = ~np.isnan(changes).any(axis=0) & ~np.isnan(total_change)
+            self.months = panel.months[valid]
+            self.contributions = changes[:, valid]
+            self.total_change = total_change[valid]
+        else:
+            self.sectors = []
+            self.months = np.array([], dtype=np.int32)
+            self.contributions = np.empty((0, 0))
+            self.total_change = np.array([])
+
+        # Diferencia entre el cambio del total y la suma de los sectores (redondeos, ajuste estacional)
+        self.discrepancy = self.total_change - self.contributions.sum(axis=0)
+        self.labels = np.datetime_as_string(self.months.astype('datetime64[M]'), unit='M')
+
+        for array in (self.months, self.contributions, self.total_change, self.discrepancy, self.labels):
+            array.flags.writeable = False
+
+    def __len__(self):
+        return len(self.months)
+
+    def window(self, start=None, end=None):
+        """
+        Posiciones de los meses entre dos fechas (mismo criterio que MonthlySeries.window)
+
+        Returns:
+            slice: Rango para indexar months, contributions (columnas), total_change y discrepancy
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.months, month_ceil_ordinal(start), side='left'))
+        hi = len(self.months) if end is None else int(np.searchsorted(self.months, month_ordinal(end), side='right'))
+        return slice(lo, hi)
+
+    def grouped(self, period, max_sectors, other_label='Otros sectores'):
+        """
+        Contribuciones del período con los sectores de menor peso agrupados
+
+        Los sectores se ordenan por la suma de sus contribuciones absolutas en el
+        período; a partir de `max_sectors` se suman en una sola fila.
+
+        Args:
+            period (slice): Meses a considerar (ver window)
+            max_sectors (int): Número máximo de filas devueltas
+            other_label (str): Nombre de la fila agrupada
+
+        Returns:
+            tuple: (lista de sectores, matriz (sectores × meses del período))
+        """
+        matrix = self.contributions[:, period]
+        order = np.argsort(-np.abs(matrix).sum(axis=1), kind='stable')
+        if len(order) <= max_sectors:
+            return [self.sectors[i] for i in order], matrix[order]
+
+        top, rest = order[:max_sectors - 1], order[max_sectors - 1:]
+        labels = [self.sectors[i] for i in top] + [other_label]
+        return labels, np.vstack([matrix[top], matrix[rest].sum(axis=0, keepdims=True)])
@@ -3,11 +3,16 @@ Dashboard Principal - Mercado Laboral USA
 Aplicación Streamlit para monitorear indicadores clave del mercado laboral
 """
 
+import time
+from startup_profile import record_phase
+
+# Inicio del arranque: se mide cuánto tardan en importarse los módulos del dashboard
+_import_started_at = time.perf_counter()
+
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import sys
 import os
@@ -17,8 +22,22 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config import *
 from data_collector import LaborMarketDataCollector
+from downsampling import downsample_frame, lttb_indices, points_for_width
+from background_refresh import get_refresher
+from series_store import SeriesStore
+from monthly_series import MonthlySeries
+from monthly_panel import MonthlyPanel
+from window_stats import WindowStatsIndex
+from beveridge import BeveridgeCurve
+from lead_lag import LeadLagMatrix
+from contributions import SectorContributions
+from metric_rules import classify_health, HEALTH_EMOJIS
+from alert_rules import firing_episodes
+from recession_signals import trigger_episodes
 from datetime import datetime, timedelta
 
+record_phase('importaciones', _import_started_at)
+
 # Configuración de la página
 st.set_page_config(
     page_title=STREAMLIT_CONFIG['page_title'],
@@ -184,11 +203,40 @@ def apply_custom_css():
         .main .block-container {{
             color: {colors['text']};
         }}
+        
+        /* Marcador de posición mientras un gráfico se carga */
+        .chart-skeleton {{
+            border-radius: 8px;
+            background: linear-gradient(90deg, {colors['card_bg']} 25%, {colors['border']} 50%, {colors['card_bg']} 75%);
+            background-size: 200% 100%;
+            animation: skeleton-shimmer 1.5s infinite;
+            margin-bottom: 1rem;
+        }}
+        
+        @keyframes skeleton-shimmer {{
+            0% {{ background-position: 200% 0; }}
+            100% {{ background-position: -200% 0; }}
+        }}
     </style>
     """
     
     st.markdown(css, unsafe_allow_html=True)
 
+def render_chart_skeleton(height=400):
+    """
+    Crea un marcador de posición con esqueleto animado para un panel de gráfico
+    
+    Args:
+        height (int): Altura en píxeles del gráfico que ocupará el panel
+    
+    Returns:
+        st.empty: Contenedor que se reemplaza cuando el gráfico está listo
+    """
+    placeholder = st.empty()
+    placeholder.markdown(f'<div class="chart-skeleton" style="height: {height}px"></div>',
+                         unsafe_allow_html=True)
+    return placeholder
+
 def get_plotly_template():
     """
     Obtiene la plantilla de Plotly para tema oscuro
@@ -218,19 +266,409 @@ def get_chart_colors():
         'grid_color': 'rgba(255,255,255,0.1)'
     }
 
-@st.cache_data(ttl=3600)  # Cache por 1 hora
-def load_labor_data(force_refresh=False):
+@st.cache_data(ttl=3600)
+def load_resolution_level(snapshot_id, series_id, max_points):
+    """
+    Carga la versión precalculada (LTTB) de una serie completa para gráficos
+    
+    El snapshot forma parte de la clave: una revisión que mantiene el rango de
+    fechas no debe seguir sirviendo el nivel calculado con los valores anteriores.
+    """
+    collector = LaborMarketDataCollector()
+    return collector.load_resolution_level(series_id, max_points)
+
+def prepare_chart_data(data, width_px=None, series_id=None, snapshot_id=None):
+    """
+    Limita los puntos de una serie al ancho del gráfico en píxeles y la convierte
+    a DataFrame (borde de pandas para Plotly)
+
+    Si la serie corresponde a la historia completa y existe un nivel precalculado
+    al guardar los datos se usa ese nivel; si no, se reduce con LTTB sobre la ventana.
+    """
+    if data is None:
+        return data
+
+    if isinstance(data, MonthlySeries):
+        max_points = points_for_width(width_px)
+        if len(data) <= max_points:
+            return data.to_frame()
+
+        if series_id:
+            level_df = load_resolution_level(snapshot_id, series_id, max_points)
+            if (not level_df.empty
+                    and level_df['date'].iloc[0] == data.dates[0]
+                    and level_df['date'].iloc[-1] == data.dates[-1]):
+                return level_df
+
+        return data.take(lttb_indices(data.months, data.values, max_points)).to_frame()
+
+    if len(data) == 0:
+        return data
+
+    return downsample_frame(data, points_for_width(width_px))
+
+def make_line_trace(data, mode='lines+markers', **kwargs):
+    """
+    Crea la traza de línea adecuada según el número de puntos
+
+    Usa Scattergl (WebGL) por encima del umbral configurado y elimina
+    los marcadores cuando hay demasiados puntos para distinguirlos.
+    """
+    n_points = len(data)
+    if n_points > CHART_RENDER_CONFIG['markers_threshold']:
+        mode = 'lines'
+        kwargs.pop('marker', None)
+
+    trace_class = go.Scattergl if n_points > CHART_RENDER_CONFIG['webgl_threshold'] else go.Scatter
+    return trace_class(x=data['date'], y=data['value'], mode=mode, **kwargs)
+
+@st.cache_resource(max_entries=4)  # Un único almacén compartido por snapshot (y fecha as-of)
+def load_labor_data(snapshot_id, as_of=None):
     """
     Carga los datos del mercado laboral desde SQLite (fuente única)
     
+    Devuelve un SeriesStore inmutable y perezoso compartido por todas las sesiones del
+    proceso (st.cache_resource no copia ni serializa el resultado): cada serie se lee
+    de SQLite la primera vez que se accede a ella y las derivadas se calculan bajo
+    demanda, así que el coste depende de lo que realmente se muestra. La clave de caché es el
+    ID del snapshot publicado: mientras una actualización corre en segundo plano se
+    sigue sirviendo el snapshot anterior, y el nuevo se intercambia en la primera
+    ejecución posterior a su publicación. Las lecturas diferidas quedan fijadas a
+    ese snapshot (vintages vigentes en su publicación), no a los valores actuales.
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado en la base de datos
+        as_of (date): Fecha de publicación consultada (None = datos vigentes)
+    
+    Returns:
+        SeriesStore: Mapeo de solo lectura con todos los DataFrames del mercado laboral
+    """
+    collector = LaborMarketDataCollector()
+    loaders, derived = collector.get_labor_data_loaders(as_of, snapshot_id)
+    return SeriesStore(snapshot_id, loaders, derived)
+
+@st.cache_resource(max_entries=12)  # Un panel (y sus transformaciones) por snapshot, fecha as-of y claves
+def load_panel(snapshot_id, as_of=None, keys=None):
+    """
+    Construye el panel mensual alineado de las series del snapshot
+    
+    Las transformaciones (MoM, YoY, tasas anualizadas, medias móviles, z-scores)
+    se memorizan dentro del panel, así que se calculan una vez por snapshot y se
+    comparten entre sesiones y ejecuciones. Cada consumidor pide solo las claves que
+    usa, de modo que las series que nadie muestra (p. ej. el grupo de sectores) no
+    se leen del almacén perezoso.
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado en la base de datos
+        as_of (date): Fecha de publicación consultada (None = datos vigentes)
+        keys (tuple): Claves del almacén a incluir (None = todas)
+    
+    Returns:
+        MonthlyPanel: Panel de solo lectura con las series pedidas
+    """
+    return MonthlyPanel.from_store(load_labor_data(snapshot_id, as_of), keys)
+
+@st.cache_resource(max_entries=4)  # Sumas prefijas y sparse tables una vez por snapshot y fecha as-of
+def load_window_stats(snapshot_id, as_of=None):
+    """
+    Construye el índice de estadísticas por ventana (media, desviación, mín, máx en O(1))
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado en la base de datos
+        as_of (date): Fecha de publicación consultada (None = datos vigentes)
+    
+    Returns:
+        WindowStatsIndex: Índice sobre el panel mensual del snapshot
+    """
+    return WindowStatsIndex(load_panel(snapshot_id, as_of, tuple(UI_LABELS)))
+
+@st.cache_resource(max_entries=4)  # Trayectoria vacantes/desempleo alineada una vez por snapshot y fecha as-of
+def load_beveridge_curve(snapshot_id, as_of=None):
+    """
+    Construye la curva de Beveridge a partir del panel mensual del snapshot
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado en la base de datos
+        as_of (date): Fecha de publicación consultada (None = datos vigentes)
+    
+    Returns:
+        BeveridgeCurve: Arreglos alineados de tasa de vacantes y de desempleo
+    """
+    return BeveridgeCurve(load_panel(snapshot_id, as_of, BeveridgeCurve.required_keys))
+
+@st.cache_resource(max_entries=4)  # Correlaciones de todos los pares una vez por snapshot y fecha as-of
+def load_lead_lag(snapshot_id, as_of=None):
+    """
+    Calcula la matriz de correlaciones cruzadas adelanto/rezago del snapshot
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado en la base de datos
+        as_of (date): Fecha de publicación consultada (None = datos vigentes)
+    
+    Returns:
+        LeadLagMatrix: Correlaciones por par y rezago sobre el panel mensual
+    """
+    return LeadLagMatrix(
+        load_panel(snapshot_id, as_of),  # Todas las series: los sectores también pueden adelantar
+        transform=LEAD_LAG_CONFIG['transform'],
+        transform_args=LEAD_LAG_CONFIG['transform_args'],
+        max_lag=LEAD_LAG_CONFIG['max_lag'],
+        min_overlap=LEAD_LAG_CONFIG['min_overlap']
+    )
+
+@st.cache_resource(max_entries=4)  # Contribuciones de todos los sectores una vez por snapshot y fecha as-of
+def load_sector_contributions(snapshot_id, as_of=None):
+    """
+    Descompone el cambio mensual de las nóminas en contribuciones por sector
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado en la base de datos
+        as_of (date): Fecha de publicación consultada (None = datos vigentes)
+    
+    Returns:
+        SectorContributions: Matriz (sectores × meses) de cambios mensuales
+    """
+    config = SECTOR_CONTRIBUTION_CONFIG
+    return SectorContributions(
+        load_panel(snapshot_id, as_of, (config['total'], config['group'])),
+        total_key=config['total'],
+        group=config['group']
+    )
+
+def get_series_label(key):
+    """
+    Etiqueta legible de una clave del panel (las series anidadas usan 'grupo/nombre')
+    """
+    return UI_LABELS.get(key, key.split('/')[-1])
+
+def get_window_mean(stats_index, metric, data):
+    """
+    Promedio de la ventana filtrada desde el índice de estadísticas
+    
+    Solo se usa el índice cuando la ventana filtrada es un rango continuo de la
+    serie (mismo número de observaciones); si no (p. ej. años no consecutivos),
+    se calcula sobre los datos filtrados.
+    """
+    if metric in stats_index and len(data) > 0:
+        stats = stats_index.stats(metric, int(data.months[0]), int(data.months[-1]))
+        if stats['count'] == len(data):
+            return stats['mean']
+    return np.nanmean(data.values)
+
+@st.cache_data(ttl=3600)
+def load_series_summary(snapshot_id):
+    """
+    Lee el resumen precalculado de KPIs y salud del snapshot publicado
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado (clave de caché)
+    
+    Returns:
+        dict: {métrica: fila de series_summary}
+    """
+    collector = LaborMarketDataCollector()
+    return collector.get_series_summary()
+
+@st.cache_data(ttl=3600)
+def load_alert_states(snapshot_id):
+    """
+    Lee el estado de las reglas de alerta evaluadas en la ingesta
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado (clave de caché)
+    
+    Returns:
+        dict: {regla: fila de alert_state}
+    """
+    collector = LaborMarketDataCollector()
+    return collector.get_alert_states()
+
+@st.cache_resource(max_entries=2)  # Historial de alertas evaluado en la ingesta
+def load_alert_history(snapshot_id):
+    """
+    Lee los meses en que cada regla de alerta estuvo activa
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado (clave de caché)
+    
+    Returns:
+        dict: {regla: MonthlySeries}
+    """
+    collector = LaborMarketDataCollector()
+    return collector.get_alert_history()
+
+@st.cache_resource(max_entries=2)  # Historial de señales precalculado en la ingesta
+def load_recession_signals(snapshot_id):
+    """
+    Lee el historial de las señales de recesión del snapshot publicado
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado (clave de caché)
+    
+    Returns:
+        dict: {señal: {'series': MonthlySeries, 'triggered': np.ndarray}}
+    """
+    collector = LaborMarketDataCollector()
+    return collector.get_recession_signals()
+
+@st.cache_resource(max_entries=2)  # Pronósticos precalculados por update_data.py
+def load_forecasts(snapshot_id, forecast_version):
+    """
+    Lee los pronósticos almacenados para el snapshot publicado
+    
+    Los pronósticos se escriben después de publicar el snapshot, así que la clave
+    de caché incluye también su versión: una ejecución que llegó antes que ellos no
+    deja un resultado vacío o desactualizado en caché.
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado (clave de caché)
+        forecast_version (str): Versión de los pronósticos guardados (clave de caché)
+    
+    Returns:
+        dict: {series_id: {'series': MonthlySeries, 'lower', 'upper', 'model'}}
+    """
+    collector = LaborMarketDataCollector()
+    return collector.get_forecasts()
+
+@st.cache_resource(max_entries=2)  # Índice de difusión recalculado en la ingesta
+def load_diffusion_index(snapshot_id):
+    """
+    Lee el índice de difusión del empleo del snapshot publicado
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado (clave de caché)
+    
+    Returns:
+        dict: {intervalo en meses: MonthlySeries}
+    """
+    collector = LaborMarketDataCollector()
+    return collector.get_diffusion_index()
+
+@st.cache_resource(max_entries=2)  # Anomalías marcadas en la ingesta
+def load_anomalies(snapshot_id):
+    """
+    Lee las observaciones anómalas detectadas en la ingesta del snapshot publicado
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado (clave de caché)
+    
+    Returns:
+        dict: {series_id: {'series': MonthlySeries, 'change', 'mad_z', 'seasonal_z'}}
+    """
+    collector = LaborMarketDataCollector()
+    return collector.get_anomalies()
+
+@st.cache_data(ttl=3600)
+def load_revisions(snapshot_id):
+    """
+    Lee las revisiones recientes de la serie configurada en REVISIONS_CONFIG
+    
     Args:
-        force_refresh (bool): Forzar actualización desde APIs
+        snapshot_id (str): ID del snapshot publicado (clave de caché)
     
     Returns:
-        dict: Diccionario con todos los DataFrames del mercado laboral
+        pd.DataFrame: Revisiones de las últimas publicaciones
+    """
+    collector = LaborMarketDataCollector()
+    config = REVISIONS_CONFIG
+    return collector.get_revisions(SERIES_MAPPING[config['metric']], config['releases'])
+
+def get_snapshot_id():
+    """
+    Obtiene el ID del snapshot de datos publicado actualmente
+    """
+    collector = LaborMarketDataCollector()
+    return collector.get_snapshot_id()
+
+def get_forecast_version():
+    """
+    Obtiene la versión de los pronósticos guardados
+    """
+    collector = LaborMarketDataCollector()
+    return collector.get_forecast_version()
+
+def get_data_status():
+    """
+    Obtiene el resumen de frescura de los datos almacenados
+    """
+    collector = LaborMarketDataCollector()
+    return collector.get_data_status()
+
+def can_auto_refresh():
+    """
+    Indica si la actualización automática está permitida (fuera de backoff)
+    """
+    collector = LaborMarketDataCollector()
+    return collector.can_auto_refresh()
+
+def get_backoff_status():
+    """
+    Obtiene el estado de backoff por fuente y por serie
     """
     collector = LaborMarketDataCollector()
-    return collector.get_all_labor_data(force_refresh=force_refresh)
+    return collector.get_backoff_status()
+
+def render_backoff_status(refresher):
+    """
+    Muestra en el sidebar las fuentes y series en backoff tras fallos recientes
+    """
+    backoff_state = get_backoff_status()
+    if not backoff_state:
+        return
+    
+    st.sidebar.markdown("**Reintentos en espera (backoff):**")
+    for entry in backoff_state:
+        if entry['retry_in_seconds'] > 0:
+            retry_str = f"próximo intento en {entry['retry_in_seconds'] / 60:.0f} min"
+        else:
+            retry_str = "se reintentará en la próxima actualización"
+        st.sidebar.caption(f"⏸️ {entry['key']}: {entry['failures']} fallo(s), {retry_str}")
+        if entry['last_error']:
+            st.sidebar.caption(f"↳ {entry['last_error'][:120]}")
+    
+    if st.sidebar.button("🔁 Reintentar ahora", help="Limpia el backoff e inicia una actualización"):
+        collector = LaborMarketDataCollector()
+        collector.backoff.reset()
+        start_background_refresh(refresher)
+
+def render_refresh_progress(refresher):
+    """
+    Muestra el progreso por serie de la actualización en segundo plano
+    """
+    progress = refresher.get_progress()
+    
+    if progress['status'] == 'running':
+        total = progress['total'] or 1
+        st.progress(progress['completed'] / total,
+                    text=f"🔄 Actualizando desde APIs: {progress['completed']}/{progress['total']} series")
+        status_icons = {'running': '⏳', 'done': '✅', 'error': '❌', 'skipped': '⏸️'}
+        with st.expander("Progreso por serie"):
+            for series_id, status in progress['series'].items():
+                st.caption(f"{status_icons.get(status, '•')} {series_id}")
+        st.caption("Se siguen mostrando los datos publicados hasta que termine la actualización")
+    elif progress['status'] == 'done' and progress['finished_at']:
+        st.caption(f"✅ Última actualización en segundo plano: {progress['finished_at'].strftime('%Y-%m-%d %H:%M')}")
+    elif progress['status'] == 'error':
+        st.error(f"❌ Error en la actualización: {progress['error']}")
+    
+    # Al publicarse un nuevo snapshot, volver a ejecutar la app para intercambiar los datos
+    if (progress['status'] in ('done', 'error')
+            and st.session_state.get('refresh_watching')):
+        st.session_state['refresh_watching'] = False
+        st.rerun()
+
+# Actualizar el panel de progreso automáticamente cuando Streamlit lo soporta
+if hasattr(st, 'fragment'):
+    render_refresh_progress_live = st.fragment(run_every=2)(render_refresh_progress)
+else:
+    render_refresh_progress_live = render_refresh_progress
+
+def start_background_refresh(refresher):
+    """
+    Inicia la actualización en segundo plano y marca la sesión para seguir su progreso
+    """
+    refresher.start()
+    st.session_state['refresh_watching'] = True
 
 def get_database_status():
     """
@@ -278,36 +716,66 @@ def create_bullet_chart(title, value, previous_value):
     )
     return fig
 
-def create_sparkline_chart(data):
-    """
-    Crea un pequeño gráfico de tendencia (sparkline).
+def create_sparkline_strip(series_list, n_points=12, width=300, height=150):
     """
-    theme_colors = get_colors()
+    Genera los sparklines de una categoría como SVG en línea en una sola pasada vectorizada.
     
-    fig = go.Figure(go.Scatter(
-        x=data['date'],
-        y=data['value'],
-        mode='lines',
-        line=dict(color=theme_colors['primary'], width=2),
-        fill='tozeroy',
-        fillcolor=hex_to_rgba(theme_colors["primary"], 0.2)  # Add transparency
-    ))
+    Args:
+        series_list (list): Lista de series (MonthlySeries)
+        n_points (int): Número de puntos finales a dibujar por serie
+        width (int): Ancho del lienzo SVG (se escala al ancho de la columna)
+        height (int): Alto del SVG en píxeles
     
-    fig.update_layout(
-        height=150,
-        showlegend=False,
-        paper_bgcolor=theme_colors['card_bg'],
-        plot_bgcolor=theme_colors['card_bg'],
-        margin=dict(l=0, r=0, t=0, b=0),
-        xaxis=dict(visible=False),
-        yaxis=dict(visible=False)
-    )
-    return fig
+    Returns:
+        list: Un string SVG por serie, en el mismo orden recibido
+    """
+    theme_colors = get_colors()
+    if not series_list:
+        return []
+    
+    # Matriz (series × puntos) alineada a la derecha, con NaN donde falten datos
+    matrix = np.full((len(series_list), n_points), np.nan)
+    for row, data in enumerate(series_list):
+        values = data.values[-n_points:]
+        if len(values):
+            matrix[row, n_points - len(values):] = values
+    
+    # Normalizar todas las series a la altura del lienzo en una sola operación
+    pad = 4
+    valid = ~np.isnan(matrix)
+    with np.errstate(all='ignore'):
+        row_min = np.nanmin(np.where(valid, matrix, np.inf), axis=1, keepdims=True)
+        row_max = np.nanmax(np.where(valid, matrix, -np.inf), axis=1, keepdims=True)
+    span = np.where(row_max > row_min, row_max - row_min, 1.0)
+    ys = height - pad - (matrix - row_min) / span * (height - 2 * pad)
+    ys = np.where(row_max > row_min, ys, height / 2)
+    xs = np.linspace(0, width, n_points)
+    
+    line_color = theme_colors['primary']
+    fill_color = hex_to_rgba(line_color, 0.2)
+    svgs = []
+    for row in range(len(series_list)):
+        mask = valid[row]
+        if not mask.any():
+            svgs.append('')
+            continue
+        points = ' '.join(f"{x:.1f},{y:.1f}" for x, y in zip(xs[mask], ys[row][mask]))
+        first_x, last_x = xs[mask][0], xs[mask][-1]
+        svgs.append(
+            f'<svg viewBox="0 0 {width} {height}" width="100%" height="{height}" '
+            f'preserveAspectRatio="none" style="background:{theme_colors["card_bg"]};display:block">'
+            f'<polygon points="{first_x:.1f},{height} {points} {last_x:.1f},{height}" fill="{fill_color}" stroke="none"/>'
+            f'<polyline points="{points}" fill="none" stroke="{line_color}" stroke-width="2" '
+            f'vector-effect="non-scaling-stroke"/></svg>'
+        )
+    return svgs
 
 def create_sunburst_chart(sector_data):
     """
     Crea un gráfico sunburst para la composición del empleo por sector.
     """
+    from plotly.colors import qualitative  # Diferido hasta dibujar el gráfico
+    
     theme_colors = get_colors()
     
     labels = ["Total Empleo Privado"]
@@ -315,13 +783,13 @@ def create_sunburst_chart(sector_data):
     values = []
 
     # Sumar el total de todos los sectores para el padre
-    total_employment = sum(df.iloc[-1]['value'] for df in sector_data.values())
+    total_employment = sum(series.latest_value for series in sector_data.values())
     values.append(total_employment)
 
-    for sector, df in sector_data.items():
+    for sector, series in sector_data.items():
         labels.append(sector)
         parents.append("Total Empleo Privado")
-        values.append(df.iloc[-1]['value'])
+        values.append(series.latest_value)
 
     fig = go.Figure(go.Sunburst(
         labels=labels,
@@ -329,7 +797,7 @@ def create_sunburst_chart(sector_data):
         values=values,
         branchvalues="total",
         hovertemplate='<b>%{label} </b> <br> Empleo: %{value:,.0f}K<br> Proporción: %{percentParent:.2%}',
-        marker=dict(colors=px.colors.qualitative.Plotly)
+        marker=dict(colors=qualitative.Plotly)
     ))
 
     fig.update_layout(
@@ -341,11 +809,13 @@ def create_sunburst_chart(sector_data):
 
     return fig
 
-def create_trend_chart(data, title, y_title, color=COLOR_PALETTE['primary']):
+def create_trend_chart(data, title, y_title, color=COLOR_PALETTE['primary'], width_px=None, series_id=None,
+                       snapshot_id=None):
     """
     Crea un gráfico de tendencia con Plotly
     """
     fig = go.Figure()
+    data = prepare_chart_data(data, width_px, series_id, snapshot_id)
     
     # Obtener colores del tema
     theme_colors = get_colors()
@@ -356,9 +826,8 @@ def create_trend_chart(data, title, y_title, color=COLOR_PALETTE['primary']):
     if color == COLOR_PALETTE['primary']:
         color = theme_colors['primary']
     
-    fig.add_trace(go.Scatter(
-        x=data['date'],
-        y=data['value'],
+    fig.add_trace(make_line_trace(
+        data,
         mode='lines+markers',
         line=dict(color=color, width=3),
         marker=dict(size=6, color=color),
@@ -389,10 +858,15 @@ def create_trend_chart(data, title, y_title, color=COLOR_PALETTE['primary']):
     
     return fig
 
-def create_combined_chart(data_dict, title_suffix=""):
+def create_combined_chart(data_dict, title_suffix="", width_px=None):
     """
     Crea un gráfico combinado con múltiples métricas
     """
+    from plotly.subplots import make_subplots  # Diferido hasta dibujar el gráfico
+    
+    # Cada subgráfico ocupa la mitad del ancho disponible
+    subplot_width = (width_px or CHART_RENDER_CONFIG['default_width_px']) // 2
+
     # Obtener colores del tema
     theme_colors = get_colors()
     chart_colors = get_chart_colors()
@@ -407,8 +881,8 @@ def create_combined_chart(data_dict, title_suffix=""):
     # Tasa de desempleo
     if 'unemployment_rate' in data_dict:
         fig.add_trace(
-            go.Scatter(x=data_dict['unemployment_rate']['date'], 
-                      y=data_dict['unemployment_rate']['value'],
+            make_line_trace(prepare_chart_data(data_dict['unemployment_rate'], subplot_width),
+                      mode='lines',
                       name='Desempleo (%)',
                       line=dict(color=theme_colors['warning'])),
             row=1, col=1
@@ -417,8 +891,8 @@ def create_combined_chart(data_dict, title_suffix=""):
     # Vacantes de trabajo
     if 'job_openings' in data_dict:
         fig.add_trace(
-            go.Scatter(x=data_dict['job_openings']['date'], 
-                      y=data_dict['job_openings']['value'],
+            make_line_trace(prepare_chart_data(data_dict['job_openings'], subplot_width),
+                      mode='lines',
                       name='Vacantes (Miles)',
                       line=dict(color=theme_colors['primary'])),
             row=1, col=2
@@ -427,8 +901,8 @@ def create_combined_chart(data_dict, title_suffix=""):
     # Tasa de renuncias
     if 'quits_rate' in data_dict:
         fig.add_trace(
-            go.Scatter(x=data_dict['quits_rate']['date'], 
-                      y=data_dict['quits_rate']['value'],
+            make_line_trace(prepare_chart_data(data_dict['quits_rate'], subplot_width),
+                      mode='lines',
                       name='Renuncias (%)',
                       line=dict(color=theme_colors['success'])),
             row=2, col=1
@@ -437,8 +911,8 @@ def create_combined_chart(data_dict, title_suffix=""):
     # Ratio vacantes/desempleo
     if 'vacancy_unemployment_ratio' in data_dict:
         fig.add_trace(
-            go.Scatter(x=data_dict['vacancy_unemployment_ratio']['date'], 
-                      y=data_dict['vacancy_unemployment_ratio']['value'],
+            make_line_trace(prepare_chart_data(data_dict['vacancy_unemployment_ratio'], subplot_width),
+                      mode='lines',
                       name='Ratio V/D',
                       line=dict(color=theme_colors['info'])),
             row=2, col=2
@@ -462,15 +936,13 @@ def create_combined_chart(data_dict, title_suffix=""):
 def filter_data_by_date(data, filter_type, filter_params):
     """
     Filtra datos por diferentes criterios temporales con validaciones
+    
+    Opera sobre MonthlySeries: los rangos de fechas son búsquedas binarias que
+    devuelven vistas de la serie, sin copiar datos.
     """
     if data is None or len(data) == 0:
         return data
     
-    # Asegurar que date es datetime
-    if 'date' in data.columns:
-        data['date'] = pd.to_datetime(data['date'])
-        data = data.sort_values('date')
-    
     try:
         if filter_type == 'preset':
             preset_key = filter_params.get('preset_key')
@@ -479,29 +951,24 @@ def filter_data_by_date(data, filter_type, filter_params):
                 
                 if 'months' in preset:
                     # Filtrar por últimos N meses
-                    months_back = preset['months']
-                    cutoff_date = data['date'].max() - pd.DateOffset(months=months_back)
-                    filtered = data[data['date'] >= cutoff_date]
+                    filtered = data.last_months(preset['months'])
                     return filtered if len(filtered) > 0 else data.tail(1)  # Al menos 1 registro
                 
                 elif 'year' in preset:
                     # Filtrar por año específico
-                    year = preset['year']
-                    filtered = data[data['date'].dt.year == year]
+                    filtered = data.in_years([preset['year']])
                     return filtered if len(filtered) > 0 else data  # Si no hay datos del año, devolver todo
                 
                 elif 'start_date' in preset:
                     # Filtrar por rango de fechas
-                    start_date = pd.to_datetime(preset['start_date'])
-                    end_date = pd.to_datetime(preset['end_date']) if preset['end_date'] else data['date'].max()
-                    filtered = data[(data['date'] >= start_date) & (data['date'] <= end_date)]
+                    filtered = data.window(preset['start_date'], preset['end_date'])
                     return filtered if len(filtered) > 0 else data  # Si no hay datos, devolver todo
         
         elif filter_type == 'years':
             # Filtrar por años específicos
             years = filter_params.get('years', [])
             if years:
-                filtered = data[data['date'].dt.year.isin(years)]
+                filtered = data.in_years(years)
                 return filtered if len(filtered) > 0 else data  # Si no hay datos, devolver todo
         
         elif filter_type in ['months', 'custom']:
@@ -513,7 +980,7 @@ def filter_data_by_date(data, filter_type, filter_params):
             if start_date > end_date:
                 return data  # Rango inválido, devolver datos completos
                 
-            filtered = data[(data['date'] >= start_date) & (data['date'] <= end_date)]
+            filtered = data.window(start_date, end_date)
             return filtered if len(filtered) > 0 else data  # Si no hay datos, devolver todo
         
     except Exception as e:
@@ -535,33 +1002,64 @@ def apply_date_filters_to_category(category_data, filter_type, filter_params):
             filtered_data[metric] = data
     return filtered_data
 
-def get_available_years(data_dict):
+@st.cache_data(ttl=3600)
+def load_data_summary(snapshot_id):
     """
-    Obtiene los años disponibles en los datos
+    Obtiene el rango de fechas y los años disponibles desde los metadatos de las series
+    
+    Es una lectura O(número de series) de series_metadata, sin recorrer los datos.
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado (clave de caché)
+    
+    Returns:
+        dict: min_date, max_date, available_years y rango por serie
     """
-    years = set()
-    for metric_data in data_dict.values():
-        if metric_data is not None and 'date' in metric_data.columns:
-            metric_data['date'] = pd.to_datetime(metric_data['date'])
-            years.update(metric_data['date'].dt.year.unique())
-    return sorted(years)
+    collector = LaborMarketDataCollector()
+    return collector.get_data_summary(list(SERIES_MAPPING.values()))
 
-def get_date_range(data_dict):
+@st.cache_data(ttl=3600)
+def load_vintage_range(snapshot_id):
+    """
+    Lee la primera y la última fecha de publicación registradas
+    
+    Args:
+        snapshot_id (str): ID del snapshot publicado (clave de caché)
+    
+    Returns:
+        tuple: (datetime, datetime) o None si no hay vintages
     """
-    Obtiene el rango de fechas disponible en los datos
+    collector = LaborMarketDataCollector()
+    return collector.get_vintage_range()
+
+def render_as_of_picker(vintage_range):
     """
-    min_date = None
-    max_date = None
+    Selector de la fecha de publicación (as-of) en la barra lateral
+    
+    Args:
+        vintage_range (tuple): Resultado de load_vintage_range
     
-    for metric_data in data_dict.values():
-        if metric_data is not None and 'date' in metric_data.columns:
-            metric_data['date'] = pd.to_datetime(metric_data['date'])
-            if min_date is None or metric_data['date'].min() < min_date:
-                min_date = metric_data['date'].min()
-            if max_date is None or metric_data['date'].max() > max_date:
-                max_date = metric_data['date'].max()
+    Returns:
+        date: Fecha consultada, o None para los datos vigentes
+    """
+    if not vintage_range:
+        return None
+    first, last = vintage_range
+    
+    st.sidebar.markdown("### 📆 Datos Publicados")
+    as_of = st.sidebar.date_input(
+        "Ver los datos tal como estaban el:",
+        value=None,
+        min_value=first.date(),
+        max_value=datetime.now().date(),
+        help="Vacío = datos vigentes. Muestra los valores publicados hasta esa fecha, sin las revisiones posteriores",
+        key="as_of_date"
+    )
     
-    return min_date, max_date
+    # Desde la última publicación registrada los datos coinciden con los vigentes
+    if as_of is None or as_of >= last.date():
+        return None
+    return as_of
 
 def render_date_filters_dynamic(available_years, min_date, max_date):
     """
@@ -681,7 +1179,7 @@ def render_date_filters_dynamic(available_years, min_date, max_date):
     
     return filter_type, filter_params
 
-def render_category_metrics(category_key, data_dict, filter_type=None, filter_params=None):
+def render_category_metrics(category_key, data_dict, filter_type=None, filter_params=None, summary=None):
     """
     Renderiza las métricas de una categoría específica con filtros aplicados
     """
@@ -694,7 +1192,7 @@ def render_category_metrics(category_key, data_dict, filter_type=None, filter_pa
     # Aplicar filtros si están definidos
     if filter_type and filter_params:
         # Filtrar solo las métricas de esta categoría
-        category_data = {k: v for k, v in data_dict.items() if k in category['metrics']}
+        category_data = {k: data_dict[k] for k in category['metrics'] if k in data_dict}
         filtered_data = apply_date_filters_to_category(category_data, filter_type, filter_params)
         
         # Mostrar información del filtro aplicado
@@ -709,7 +1207,7 @@ def render_category_metrics(category_key, data_dict, filter_type=None, filter_pa
             end_date = filter_params.get('end_date')
             st.info(f"📅 Filtro activo: {start_date} a {end_date}")
     else:
-        filtered_data = {k: v for k, v in data_dict.items() if k in category['metrics']}
+        filtered_data = {k: data_dict[k] for k in category['metrics'] if k in data_dict}
     
     # Crear columnas para las métricas de la categoría
     metrics_available = [metric for metric in category['metrics'] if metric in filtered_data and filtered_data[metric] is not None and len(filtered_data[metric]) > 0]
@@ -720,12 +1218,18 @@ def render_category_metrics(category_key, data_dict, filter_type=None, filter_pa
     
     cols = st.columns(len(metrics_available))
     
+    # Sparklines de todas las métricas en una sola pasada (SVG en línea, sin figuras Plotly)
+    sparklines = create_sparkline_strip([filtered_data[metric] for metric in metrics_available])
+    
     for idx, metric in enumerate(metrics_available):
         with cols[idx]:
             data = filtered_data[metric]
             if data is not None and len(data) > 0:
-                current_value = data.iloc[-1]['value']
-                previous_value = data.iloc[-2]['value'] if len(data) > 1 else current_value
+                entry = (summary or {}).get(metric)
+                if entry and summary_matches_filter(entry, filter_type, filter_params):
+                    current_value, previous_value = entry['latest_value'], entry['previous_value']
+                else:
+                    current_value, previous_value = data.latest_value, data.previous_value
                 delta = current_value - previous_value
                 
                 # Formatear valores según el tipo de métrica
@@ -750,9 +1254,7 @@ def render_category_metrics(category_key, data_dict, filter_type=None, filter_pa
                 )
                 
                 # Mostrar sparkline con datos filtrados (máximo 12 puntos)
-                sparkline_data = data.tail(12) if len(data) >= 12 else data
-                sparkline_fig = create_sparkline_chart(sparkline_data)
-                st.plotly_chart(sparkline_fig, use_container_width=True)
+                st.markdown(sparklines[idx], unsafe_allow_html=True)
                 
                 # Mostrar conteo de datos disponibles
                 st.caption(f"📊 {len(data)} registros disponibles")
@@ -765,53 +1267,8 @@ def get_metric_health_indicator(metric, current_value, delta):
     """
     Determina el indicador de salud para una métrica específica
     """
-    health_rules = {
-        'unemployment_rate': {
-            'good_threshold': 4.0,
-            'bad_threshold': 6.0,
-            'lower_is_better': True
-        },
-        'job_openings': {
-            'good_threshold': 8000000,
-            'bad_threshold': 6000000,
-            'lower_is_better': False
-        },
-        'quits_rate': {
-            'good_threshold': 2.3,
-            'bad_threshold': 1.8,
-            'lower_is_better': False
-        },
-        'avg_hourly_earnings': {
-            'good_threshold': 3.0,  # % growth
-            'bad_threshold': 1.5,
-            'lower_is_better': False
-        },
-        'payroll_employment': {
-            'good_threshold': 150000,  # monthly change
-            'bad_threshold': 50000,
-            'lower_is_better': False
-        }
-    }
-    
-    if metric not in health_rules:
-        return "⚪", "neutral"  # Sin regla definida
-    
-    rule = health_rules[metric]
-    
-    if rule['lower_is_better']:
-        if current_value <= rule['good_threshold']:
-            return "🟢", "good"
-        elif current_value >= rule['bad_threshold']:
-            return "🔴", "bad"
-        else:
-            return "🟡", "warning"
-    else:
-        if current_value >= rule['good_threshold']:
-            return "🟢", "good"
-        elif current_value <= rule['bad_threshold']:
-            return "🔴", "bad"
-        else:
-            return "🟡", "warning"
+    health_status = classify_health(metric, current_value)
+    return HEALTH_EMOJIS[health_status], health_status
 
 def get_trend_indicator(delta):
     """
@@ -824,68 +1281,135 @@ def get_trend_indicator(delta):
     else:
         return "➡️"
 
-def render_kpi_dashboard(data_dict, filter_type=None, filter_params=None):
+def summary_matches_filter(entry, filter_type, filter_params):
     """
-    Renderiza KPIs principales en la parte superior del dashboard
+    Indica si la ventana filtrada contiene las dos últimas observaciones del resumen,
+    en cuyo caso los valores precalculados coinciden con los de los datos filtrados
     """
-    st.markdown("## 📊 Indicadores Clave del Mercado Laboral")
-    
-    # Métricas clave para KPIs principales
-    key_metrics = {
-        'unemployment_rate': {
-            'label': 'Tasa de Desempleo',
-            'format': 'percentage',
-            'icon': '📉'
-        },
-        'payroll_employment': {
-            'label': 'Variación Nóminas',
-            'format': 'thousands',
-            'icon': '🏭'
-        },
-        'job_openings': {
-            'label': 'Vacantes de Trabajo', 
-            'format': 'millions',
-            'icon': '💼'
-        },
-        'avg_hourly_earnings': {
-            'label': 'Salario Promedio/Hora',
-            'format': 'currency',
-            'icon': '💰'
-        }
-    }
+    if not filter_type or not filter_params:
+        return True
     
-    # Aplicar filtros si están definidos
-    if filter_type and filter_params:
-        filtered_data = {}
-        for metric in key_metrics.keys():
-            if metric in data_dict:
-                filtered_data[metric] = filter_data_by_date(data_dict[metric], filter_type, filter_params)
-            else:
-                filtered_data[metric] = None
-    else:
-        filtered_data = {k: v for k, v in data_dict.items() if k in key_metrics.keys()}
+    latest, previous = entry['latest_date'], entry['previous_date']
     
-    # Crear columnas para KPIs
-    available_metrics = [k for k, v in filtered_data.items() if v is not None and len(v) > 0]
+    if filter_type == 'preset':
+        preset = FILTER_PRESETS.get(filter_params.get('preset_key'), {})
+        if 'months' in preset:
+            return True
+        if 'year' in preset:
+            return latest.year == preset['year'] and previous.year == preset['year']
+        if 'start_date' in preset:
+            end_ok = preset['end_date'] is None or latest <= pd.Timestamp(preset['end_date'])
+            return pd.Timestamp(preset['start_date']) <= previous and end_ok
+    elif filter_type == 'years':
+        years = filter_params.get('years', [])
+        return latest.year in years and previous.year in years
+    elif filter_type in ['months', 'custom']:
+        start_date = pd.Timestamp(filter_params.get('start_date'))
+        end_date = pd.Timestamp(filter_params.get('end_date'))
+        return start_date <= previous and latest <= end_date
+    
+    return False
+
+def get_kpi_values(metrics, data_dict, filter_type=None, filter_params=None, summary=None):
+    """
+    Obtiene valor actual, anterior, fecha, número de observaciones y salud por métrica
     
-    if not available_metrics:
-        st.warning("No hay datos disponibles para los KPIs principales")
-        return
+    Returns:
+        dict: {métrica: (actual, anterior, fecha, observaciones, salud o None)}
+    """
+    summary = summary or {}
+    kpi_values = {}
+    
+    for metric in metrics:
+        entry = summary.get(metric)
+        if entry and summary_matches_filter(entry, filter_type, filter_params):
+            kpi_values[metric] = (
+                entry['latest_value'], entry['previous_value'], entry['latest_date'],
+                entry['obs_count'], entry['health_status']
+            )
+            continue
+        
+        # Sin resumen aplicable: calcular desde los datos filtrados
+        if data_dict is None or metric not in data_dict:
+            continue
+        data = data_dict[metric]
+        if filter_type and filter_params:
+            data = filter_data_by_date(data, filter_type, filter_params)
+        if data is not None and len(data) > 0:
+            kpi_values[metric] = (data.latest_value, data.previous_value, data.latest_date, len(data), None)
+    
+    return kpi_values
+
+# Métricas clave para KPIs principales
+KPI_METRICS = {
+    'unemployment_rate': {
+        'label': 'Tasa de Desempleo',
+        'format': 'percentage',
+        'icon': '📉'
+    },
+    'payroll_employment': {
+        'label': 'Variación Nóminas',
+        'format': 'thousands',
+        'icon': '🏭'
+    },
+    'job_openings': {
+        'label': 'Vacantes de Trabajo', 
+        'format': 'millions',
+        'icon': '💼'
+    },
+    'avg_hourly_earnings': {
+        'label': 'Salario Promedio/Hora',
+        'format': 'currency',
+        'icon': '💰'
+    }
+}
+
+def kpis_need_data(summary, filter_type=None, filter_params=None):
+    """
+    Indica si algún KPI no puede mostrarse solo con el resumen precalculado
+    """
+    for metric in KPI_METRICS:
+        entry = summary.get(metric)
+        if not entry or not summary_matches_filter(entry, filter_type, filter_params):
+            return True
+    return False
+
+def render_kpi_dashboard(data_dict, filter_type=None, filter_params=None, summary=None):
+    """
+    Renderiza KPIs principales en la parte superior del dashboard
+    
+    Usa el resumen precalculado en la ingesta (series_summary) cuando la ventana
+    filtrada incluye las dos últimas observaciones; si no, calcula desde los datos.
+    """
+    st.markdown("## 📊 Indicadores Clave del Mercado Laboral")
+    
+    key_metrics = KPI_METRICS
+    
+    # Valores de cada KPI: (actual, anterior, fecha, observaciones, estado de salud)
+    kpi_values = get_kpi_values(key_metrics.keys(), data_dict, filter_type, filter_params, summary)
+    
+    # Crear columnas para KPIs
+    available_metrics = [metric for metric in key_metrics if metric in kpi_values]
+    
+    if not available_metrics:
+        st.warning("No hay datos disponibles para los KPIs principales")
+        return
     
     cols = st.columns(len(available_metrics))
     
     for idx, metric in enumerate(available_metrics):
         with cols[idx]:
-            data = filtered_data[metric]
+            current_value, previous_value, last_date, n_obs, health_status = kpi_values[metric]
             metric_config = key_metrics[metric]
             
-            if data is not None and len(data) > 0:
-                current_value = data.iloc[-1]['value']
-                previous_value = data.iloc[-2]['value'] if len(data) > 1 else current_value
+            if n_obs > 0:
                 delta = current_value - previous_value
                 
                 # Obtener indicadores de salud y tendencia
-                health_emoji, health_status = get_metric_health_indicator(metric, current_value, delta)
+                if health_status is None:
+                    health_emoji, health_status = get_metric_health_indicator(metric, current_value, delta)
+                else:
+                    health_emoji = HEALTH_EMOJIS[health_status]
                 trend_indicator = get_trend_indicator(delta)
                 
                 # Formatear valores según el tipo de métrica
@@ -896,7 +1420,7 @@ def render_kpi_dashboard(data_dict, filter_type=None, filter_params=None):
                     value_str = f"${current_value:.2f}"
                     delta_str = f"${delta:+.2f}" if delta != 0 else "$0.00"
                 elif metric_config['format'] == 'thousands':
-                    if metric == 'payroll_employment' and len(data) > 1:
+                    if metric == 'payroll_employment' and n_obs > 1:
                         # Para nóminas, mostrar variación mensual
                         monthly_change = current_value - previous_value
                         value_str = f"{monthly_change/1000:+.0f}K"
@@ -932,7 +1456,6 @@ def render_kpi_dashboard(data_dict, filter_type=None, filter_params=None):
                     st.info("📈 Monitoreando", icon="ℹ️")
                 
                 # Mostrar fecha del último dato
-                last_date = data.iloc[-1]['date']
                 if hasattr(last_date, 'strftime'):
                     st.caption(f"📅 {last_date.strftime('%Y-%m')}")
                 else:
@@ -940,13 +1463,27 @@ def render_kpi_dashboard(data_dict, filter_type=None, filter_params=None):
     
     st.markdown("---")
 
-def create_enhanced_line_chart(data, title, y_title, color=None, show_events=True):
+def create_enhanced_line_chart(data, title, y_title, color=None, show_events=True, width_px=None, series_id=None,
+                               mean_value=None, forecast=None, anomalies=None, snapshot_id=None):
     """
     Crea un gráfico de líneas mejorado con anotaciones y líneas de referencia
+    
+    Args:
+        mean_value (float): Promedio de la ventana (p. ej. del índice de estadísticas);
+            si no se indica se calcula sobre los datos
+        forecast (dict): Pronóstico de la serie (ver load_forecasts); solo se dibuja si
+            parte del mes siguiente al último dato mostrado
+        anomalies (dict): Observaciones anómalas de la serie (ver load_anomalies)
     """
     if data is None or len(data) == 0:
         return go.Figure()
     
+    # El promedio se calcula sobre la ventana completa, antes de reducir puntos
+    if mean_value is None:
+        mean_value = np.nanmean(data.values)
+    data_months = data.months
+    data = prepare_chart_data(data, width_px, series_id, snapshot_id)
+    
     colors = get_colors()
     chart_colors = get_chart_colors()
     
@@ -956,9 +1493,8 @@ def create_enhanced_line_chart(data, title, y_title, color=None, show_events=Tru
     fig = go.Figure()
     
     # Línea principal
-    fig.add_trace(go.Scatter(
-        x=data['date'],
-        y=data['value'],
+    fig.add_trace(make_line_trace(
+        data,
         mode='lines+markers',
         name=title,
         line=dict(color=color, width=3),
@@ -969,8 +1505,51 @@ def create_enhanced_line_chart(data, title, y_title, color=None, show_events=Tru
                      '<extra></extra>'
     ))
     
+    # Pronóstico con su intervalo, unido al último dato observado
+    if forecast is not None and int(forecast['series'].months[0]) == int(data_months[-1]) + 1:
+        forecast_dates = [data['date'].iloc[-1]] + list(forecast['series'].dates)
+        last_value = data['value'].iloc[-1]
+        lower = [last_value] + forecast['lower'].tolist()
+        upper = [last_value] + forecast['upper'].tolist()
+        
+        fig.add_trace(go.Scatter(
+            x=forecast_dates + forecast_dates[::-1],
+            y=upper + lower[::-1],
+            fill='toself',
+            fillcolor=hex_to_rgba(color, 0.15),
+            line=dict(width=0),
+            name=f"Intervalo {FORECAST_CONFIG['confidence']:.0%}",
+            hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=forecast_dates,
+            y=[last_value] + forecast['series'].values.tolist(),
+            mode='lines',
+            name=f"Pronóstico ({forecast['model'].upper()})",
+            line=dict(color=color, width=2, dash='dot')
+        ))
+    
+    # Anomalías detectadas en la ingesta dentro de la ventana mostrada
+    if anomalies is not None:
+        flagged = anomalies['series']
+        in_window = (flagged.months >= data_months[0]) & (flagged.months <= data_months[-1])
+        if in_window.any():
+            fig.add_trace(go.Scatter(
+                x=flagged.dates[in_window],
+                y=flagged.values[in_window],
+                customdata=np.column_stack([anomalies['mad_z'][in_window], anomalies['seasonal_z'][in_window]]),
+                mode='markers',
+                name='Anomalía',
+                marker=dict(symbol='x', size=10, color=colors['warning']),
+                hovertemplate='<b>Anomalía</b><br>' +
+                             'Fecha: %{x}<br>' +
+                             'Valor: %{y}<br>' +
+                             'z cambio: %{customdata[0]:.1f}<br>' +
+                             'z estacional: %{customdata[1]:.1f}' +
+                             '<extra></extra>'
+            ))
+    
     # Línea de promedio histórico
-    mean_value = data['value'].mean()
     fig.add_hline(y=mean_value, line_dash="dash", line_color=colors['neutral'],
                   annotation_text=f"Promedio: {mean_value:.1f}")
     
@@ -997,24 +1576,22 @@ def create_enhanced_line_chart(data, title, y_title, color=None, show_events=Tru
     
     return fig
 
-def create_bar_chart_with_comparison(data, title, y_title, comparison_type="MoM"):
+def create_bar_chart_with_comparison(changes, title, y_title, comparison_type="MoM", width_px=None):
     """
     Crea gráfico de barras con comparación período sobre período
+    
+    Args:
+        changes (MonthlySeries): Cambios ya calculados por el panel mensual
+            (p. ej. panel.series(métrica, 'change', 1) para MoM)
     """
-    if data is None or len(data) < 2:
+    if changes is None or len(changes) < 1:
         return go.Figure()
     
     colors = get_colors()
     chart_colors = get_chart_colors()
     
-    # Calcular cambios período sobre período
-    data = data.copy()
-    if comparison_type == "MoM":
-        data['change'] = data['value'].diff()
-        data['pct_change'] = data['value'].pct_change() * 100
-    elif comparison_type == "YoY":
-        data['change'] = data['value'].diff(12)  # 12 months ago
-        data['pct_change'] = data['value'].pct_change(12) * 100
+    # Reducir puntos sobre los cambios ya calculados para no alterar las diferencias
+    data = prepare_chart_data(changes, width_px).rename(columns={'value': 'change'})
     
     # Colores condicionalesbasados en el cambio
     bar_colors = [colors['success'] if x > 0 else colors['warning'] if x < 0 else colors['neutral'] 
@@ -1047,10 +1624,12 @@ def create_bar_chart_with_comparison(data, title, y_title, comparison_type="MoM"
     
     return fig
 
-def create_dual_axis_chart(data1, data2, title1, title2, overall_title):
+def create_dual_axis_chart(data1, data2, title1, title2, overall_title, width_px=None):
     """
     Crea gráfico con doble eje Y para comparar dos métricas relacionadas
     """
+    from plotly.subplots import make_subplots  # Diferido hasta dibujar el gráfico
+    
     colors = get_colors()
     chart_colors = get_chart_colors()
     
@@ -1059,9 +1638,8 @@ def create_dual_axis_chart(data1, data2, title1, title2, overall_title):
     # Primera métrica (eje izquierdo)
     if data1 is not None and len(data1) > 0:
         fig.add_trace(
-            go.Scatter(
-                x=data1['date'],
-                y=data1['value'],
+            make_line_trace(
+                prepare_chart_data(data1, width_px),
                 name=title1,
                 line=dict(color=colors['primary'], width=3),
                 mode='lines'
@@ -1072,9 +1650,8 @@ def create_dual_axis_chart(data1, data2, title1, title2, overall_title):
     # Segunda métrica (eje derecho)
     if data2 is not None and len(data2) > 0:
         fig.add_trace(
-            go.Scatter(
-                x=data2['date'],
-                y=data2['value'],
+            make_line_trace(
+                prepare_chart_data(data2, width_px),
                 name=title2,
                 line=dict(color=colors['secondary'], width=3),
                 mode='lines'
@@ -1098,7 +1675,7 @@ def create_dual_axis_chart(data1, data2, title1, title2, overall_title):
     
     return fig
 
-def create_jolts_flow_chart(data_dict):
+def create_jolts_flow_chart(data_dict, width_px=None):
     """
     Crea gráfico combinado de flujos JOLTS (Contrataciones, Renuncias, Despidos)
     """
@@ -1115,10 +1692,9 @@ def create_jolts_flow_chart(data_dict):
     
     for metric, config in jolts_metrics.items():
         if metric in data_dict and data_dict[metric] is not None:
-            data = data_dict[metric]
-            fig.add_trace(go.Scatter(
-                x=data['date'],
-                y=data['value'],
+            data = prepare_chart_data(data_dict[metric], width_px)
+            fig.add_trace(make_line_trace(
+                data,
                 mode='lines+markers',
                 name=config['name'],
                 line=dict(color=config['color'], width=2),
@@ -1149,34 +1725,126 @@ def create_jolts_flow_chart(data_dict):
     
     return fig
 
-def check_alerts(data_dict):
+def check_alerts(alert_states):
     """
-    Verifica alertas basadas en los umbrales configurados
+    Lista las alertas activas en el orden de ALERT_RULES
+    
+    El estado de cada regla se evalúa en la ingesta y se lee de alert_state.
     """
     alerts = []
     
-    # Verificar cada métrica contra sus umbrales
-    for metric, threshold_key in [
-        ('unemployment_rate', 'unemployment_rate_high'),
-        ('job_openings', 'job_openings_low'),
-        ('quits_rate', 'quits_rate_low'),
-        ('layoffs_rate', 'layoffs_rate_high')
-    ]:
-        if metric in data_dict and not data_dict[metric].empty:
-            latest_value = data_dict[metric].iloc[-1]['value']
-            threshold = ALERT_THRESHOLDS[threshold_key]
-            
-            if metric == 'unemployment_rate' and latest_value > threshold:
-                alerts.append(f"⚠️ Tasa de desempleo alta: {latest_value:.1f}% (umbral: {threshold}%)")
-            elif metric == 'job_openings' and latest_value < threshold:
-                alerts.append(f"⚠️ Vacantes bajas: {latest_value:,.0f} (umbral: {threshold:,.0f})")
-            elif metric == 'quits_rate' and latest_value < threshold:
-                alerts.append(f"⚠️ Confianza laboral baja: {latest_value:.1f}% renuncias (umbral: {threshold}%)")
-            elif metric == 'layoffs_rate' and latest_value > threshold:
-                alerts.append(f"⚠️ Despidos altos: {latest_value:.1f}% (umbral: {threshold}%)")
+    for rule in ALERT_RULES:
+        state = alert_states.get(rule)
+        if state and state['active']:
+            alerts.append(f"⚠️ {state['message']}")
     
     return alerts
 
+def render_alert_history(history):
+    """
+    Muestra los episodios en que cada regla de alerta estuvo activa
+    
+    Args:
+        history (dict): Resultado de load_alert_history
+    """
+    rows = []
+    for rule, config in ALERT_RULES.items():
+        if rule not in history:
+            continue
+        for start, end in firing_episodes(history[rule].months):
+            rows.append({
+                'Regla': config['label'],
+                'Inicio': f"{1970 + start // 12:04d}-{start % 12 + 1:02d}",
+                'Fin': f"{1970 + end // 12:04d}-{end % 12 + 1:02d}",
+                'Meses': end - start + 1
+            })
+    
+    with st.expander("📜 Historial de alertas"):
+        if not rows:
+            st.info("Ninguna regla de alerta se ha activado en la historia disponible")
+            return
+        episodes = pd.DataFrame(rows).sort_values('Inicio', ascending=False)
+        st.dataframe(episodes, use_container_width=True, hide_index=True)
+
+def create_recession_signal_chart(name, signal_data, width_px=None):
+    """
+    Crea el gráfico histórico de una señal de recesión con su umbral y los
+    episodios en que estuvo activada sombreados
+    
+    Args:
+        name (str): Clave de la señal en RECESSION_SIGNALS
+        signal_data (dict): {'series': MonthlySeries, 'triggered': np.ndarray}
+    """
+    config = RECESSION_SIGNALS[name]
+    series = signal_data['series']
+    colors = get_colors()
+    chart_colors = get_chart_colors()
+    
+    fig = go.Figure()
+    fig.add_trace(make_line_trace(
+        prepare_chart_data(series, width_px),
+        mode='lines',
+        name=config['label'],
+        line=dict(color=colors['primary'], width=2),
+        hovertemplate='Fecha: %{x}<br>Valor: %{y:.2f}<extra></extra>'
+    ))
+    
+    fig.add_hline(y=config['threshold'], line_dash="dash", line_color=colors['warning'],
+                  annotation_text=f"Umbral: {config['threshold']} {config['unit']}")
+    
+    # Episodios activados calculados sobre la historia completa (no sobre los puntos reducidos)
+    for start, end in trigger_episodes(series.dates, signal_data['triggered']):
+        fig.add_vrect(
+            x0=start, x1=end + pd.DateOffset(months=1),
+            fillcolor="red", opacity=0.1, line_width=0
+        )
+    
+    fig.update_layout(
+        title=f"{config['label']}",
+        xaxis_title="Fecha",
+        yaxis_title=config['unit'],
+        template=get_plotly_template(),
+        height=350,
+        font=dict(color=chart_colors['text_color']),
+        plot_bgcolor=chart_colors['plot_bgcolor'],
+        paper_bgcolor=chart_colors['paper_bgcolor'],
+        showlegend=False
+    )
+    
+    return fig
+
+def render_recession_signals(signals):
+    """
+    Muestra el valor actual y el historial de cada señal de recesión
+    
+    Args:
+        signals (dict): Resultado de load_recession_signals
+    """
+    available = [name for name in RECESSION_SIGNALS if name in signals and len(signals[name]['series'])]
+    if not available:
+        return
+    
+    st.markdown("### 🚦 Señales de Recesión")
+    columns = st.columns(len(available))
+    for column, name in zip(columns, available):
+        config = RECESSION_SIGNALS[name]
+        series = signals[name]['series']
+        triggered = bool(signals[name]['triggered'][-1])
+        
+        with column:
+            st.metric(
+                label=f"{'🔴' if triggered else '🟢'} {config['label']}",
+                value=f"{series.latest_value:.2f} {config['unit']}",
+                delta=f"{series.latest_value - series.previous_value:+.2f} vs mes anterior",
+                delta_color="off",
+                help=f"{config['description']} (umbral: {config['threshold']} {config['unit']}; "
+                     f"dato de {series.latest_date:%B %Y})"
+            )
+            st.plotly_chart(
+                create_recession_signal_chart(name, signals[name], CHART_RENDER_CONFIG['half_width_px']),
+                use_container_width=True
+            )
+
 def create_publication_calendar():
     """
     Crea la pestaña de calendario de publicaciones
@@ -1285,6 +1953,531 @@ def create_publication_calendar():
             
             st.markdown("---")
 
+def render_window_comparison(stats_index, key_prefix="window_comparison"):
+    """
+    Compara estadísticas de varias métricas entre ventanas temporales lado a lado
+    
+    Cada celda sale del índice de estadísticas en tiempo constante, así que la
+    vista sigue siendo instantánea aunque se agreguen muchas ventanas.
+    """
+    config = WINDOW_COMPARISON_CONFIG
+    
+    st.markdown("### 🪟 Comparación entre Ventanas Temporales")
+    st.markdown("*Promedio, dispersión y extremos de cada métrica en distintos períodos*")
+    
+    metric_options = [metric for metric in UI_LABELS if metric in stats_index]
+    
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        windows = st.multiselect(
+            "Ventanas:",
+            options=list(FILTER_PRESETS.keys()),
+            default=config['default_windows'],
+            format_func=lambda x: FILTER_PRESETS[x]['name'],
+            key=f"{key_prefix}_windows"
+        )
+    with col2:
+        metrics = st.multiselect(
+            "Métricas:",
+            options=metric_options,
+            default=[metric for metric in config['default_metrics'] if metric in metric_options],
+            format_func=lambda x: UI_LABELS[x],
+            key=f"{key_prefix}_metrics"
+        )
+    with col3:
+        statistic = st.selectbox(
+            "Estadística:",
+            options=list(config['statistics'].keys()),
+            format_func=lambda x: config['statistics'][x],
+            key=f"{key_prefix}_statistic"
+        )
+    
+    if not windows or not metrics:
+        st.info("Selecciona al menos una ventana y una métrica")
+        return
+    
+    rows = []
+    for metric in metrics:
+        row = {'Métrica': UI_LABELS[metric]}
+        for window in windows:
+            stats = stats_index.stats_for_preset(metric, FILTER_PRESETS[window])
+            row[FILTER_PRESETS[window]['name']] = stats[statistic] if stats['count'] else None
+        rows.append(row)
+    
+    st.dataframe(
+        pd.DataFrame(rows),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            FILTER_PRESETS[window]['name']: st.column_config.NumberColumn(format="%.2f")
+            for window in windows
+        }
+    )
+    st.caption("Ventanas relativas (p. ej. último año) se miden desde el último dato de cada métrica")
+
+def create_beveridge_chart(curve, period, cycles):
+    """
+    Crea la curva de Beveridge coloreada por fecha con ciclos destacados
+    
+    Args:
+        curve (BeveridgeCurve): Curva precalculada del snapshot
+        period (slice): Puntos del período seleccionado (ver BeveridgeCurve.window)
+        cycles (list): Claves de BEVERIDGE_CONFIG['cycles'] a destacar
+    """
+    colors = get_colors()
+    chart_colors = get_chart_colors()
+    cycle_colors = [colors['secondary'], colors['warning'], colors['success'], colors['info']]
+    
+    fig = go.Figure()
+    
+    # Trayectoria completa del período: línea tenue y puntos coloreados por fecha
+    fig.add_trace(go.Scatter(
+        x=curve.unemployment_rate[period],
+        y=curve.vacancy_rate[period],
+        customdata=curve.labels[period],
+        mode='lines+markers',
+        name='Trayectoria',
+        line=dict(color=colors['border'], width=1),
+        marker=dict(
+            size=6,
+            color=curve.years[period],
+            colorscale=BEVERIDGE_CONFIG['colorscale'],
+            colorbar=dict(title="Año")
+        ),
+        hovertemplate='<b>%{customdata}</b><br>' +
+                     'Desempleo: %{x:.1f}%<br>' +
+                     'Vacantes: %{y:.2f}%<br>' +
+                     '<extra></extra>'
+    ))
+    
+    # Ciclos destacados, recortados al período seleccionado
+    for i, cycle in enumerate(cycles):
+        cycle_config = BEVERIDGE_CONFIG['cycles'][cycle]
+        cycle_window = curve.window(cycle_config['start_date'], cycle_config['end_date'])
+        lo = max(cycle_window.start, period.start)
+        hi = min(cycle_window.stop, period.stop)
+        if hi - lo < 2:
+            continue
+        
+        fig.add_trace(go.Scatter(
+            x=curve.unemployment_rate[lo:hi],
+            y=curve.vacancy_rate[lo:hi],
+            customdata=curve.labels[lo:hi],
+            mode='lines',
+            name=cycle_config['name'],
+            line=dict(color=cycle_colors[i % len(cycle_colors)], width=3),
+            hovertemplate='<b>%{fullData.name}</b> %{customdata}<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title="📐 Curva de Beveridge",
+        xaxis_title="Tasa de Desempleo (%)",
+        yaxis_title="Tasa de Vacantes (%)",
+        template=get_plotly_template(),
+        height=550,
+        font=dict(color=chart_colors['text_color']),
+        plot_bgcolor=chart_colors['plot_bgcolor'],
+        paper_bgcolor=chart_colors['paper_bgcolor'],
+        hovermode='closest',
+        legend=dict(orientation='h', y=-0.15)
+    )
+    
+    return fig
+
+def render_beveridge_curve(curve, key_prefix="beveridge"):
+    """
+    Muestra la curva de Beveridge con selección de período y de ciclos destacados
+    
+    Solo recorta los arreglos precalculados de la curva, así que cambiar el
+    período no vuelve a alinear ni unir series.
+    """
+    st.markdown("### 📐 Curva de Beveridge")
+    st.markdown("*Tasa de vacantes (vacantes / (nóminas + vacantes)) frente a la tasa de desempleo*")
+    
+    if len(curve) < 2:
+        st.info("Se necesitan vacantes, nóminas y desempleo para dibujar la curva de Beveridge")
+        return
+    
+    labels = curve.labels
+    default_start = curve.window(BEVERIDGE_CONFIG['default_start']).start
+    if default_start >= len(labels) - 1:
+        default_start = 0
+    
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        start_label, end_label = st.select_slider(
+            "Período:",
+            options=labels.tolist(),
+            value=(labels[default_start], labels[-1]),
+            key=f"{key_prefix}_period"
+        )
+    # Solo se ofrecen los ciclos con datos en la curva; los cubiertos en parte se marcan
+    coverage = {}
+    for cycle, cycle_config in BEVERIDGE_CONFIG['cycles'].items():
+        points, complete = curve.coverage(cycle_config['start_date'], cycle_config['end_date'])
+        if points:
+            coverage[cycle] = cycle_config['name'] if complete else f"{cycle_config['name']} (parcial)"
+    
+    with col2:
+        cycles = st.multiselect(
+            "Ciclos destacados:",
+            options=list(coverage),
+            default=[cycle for cycle in BEVERIDGE_CONFIG['default_cycles'] if cycle in coverage],
+            format_func=lambda x: coverage[x],
+            key=f"{key_prefix}_cycles"
+        )
+    
+    # Las etiquetas 'YYYY-MM' están ordenadas, así que el período se ubica por búsqueda binaria
+    period = slice(int(np.searchsorted(labels, start_label)), int(np.searchsorted(labels, end_label)) + 1)
+    st.plotly_chart(create_beveridge_chart(curve, period, cycles), use_container_width=True)
+
+# La interacción con la curva solo vuelve a ejecutar su propio bloque cuando Streamlit lo soporta
+if hasattr(st, 'fragment'):
+    render_beveridge_curve_fragment = st.fragment(render_beveridge_curve)
+else:
+    render_beveridge_curve_fragment = render_beveridge_curve
+
+def create_lead_lag_heatmap(lead_lag, lag):
+    """
+    Crea el mapa de calor de correlaciones entre todas las series a un rezago fijo
+    
+    Args:
+        lead_lag (LeadLagMatrix): Matriz precalculada del snapshot
+        lag (int): Meses de adelanto de la serie de la fila respecto de la columna
+    """
+    chart_colors = get_chart_colors()
+    labels = [get_series_label(key) for key in lead_lag.keys]
+    
+    fig = go.Figure(go.Heatmap(
+        z=lead_lag.matrix_at_lag(lag),
+        x=labels,
+        y=labels,
+        zmin=-1,
+        zmax=1,
+        colorscale='RdBu',
+        colorbar=dict(title="Correlación"),
+        hovertemplate='%{y} → %{x}<br>Correlación: %{z:.2f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=f"Correlación con {lag} meses de adelanto (fila adelanta a columna)",
+        template=get_plotly_template(),
+        height=650,
+        font=dict(color=chart_colors['text_color']),
+        plot_bgcolor=chart_colors['plot_bgcolor'],
+        paper_bgcolor=chart_colors['paper_bgcolor'],
+        yaxis=dict(autorange='reversed')
+    )
+    
+    return fig
+
+def render_lead_lag(lead_lag, key_prefix="lead_lag"):
+    """
+    Muestra los indicadores que adelantan a una serie y el mapa de calor de correlaciones
+    
+    Las consultas solo indexan la matriz precalculada por snapshot.
+    """
+    config = LEAD_LAG_CONFIG
+    
+    st.markdown("### ⏱️ Adelanto y Rezago entre Indicadores")
+    st.markdown(f"*Correlación cruzada de la variación interanual hasta {config['max_lag']} meses de adelanto*")
+    
+    if len(lead_lag.keys) < 2:
+        st.info("Se necesitan al menos dos series para calcular correlaciones")
+        return
+    
+    default_target = config['default_target'] if config['default_target'] in lead_lag else lead_lag.keys[0]
+    col1, col2 = st.columns(2)
+    with col1:
+        target = st.selectbox(
+            "Indicador objetivo:",
+            options=lead_lag.keys,
+            index=lead_lag.keys.index(default_target),
+            format_func=get_series_label,
+            key=f"{key_prefix}_target"
+        )
+    with col2:
+        lag = st.slider(
+            "Meses de adelanto (mapa de calor):",
+            min_value=-config['max_lag'],
+            max_value=config['max_lag'],
+            value=0,
+            key=f"{key_prefix}_lag"
+        )
+    
+    leaders = lead_lag.top_leaders(target, config['top_n'])
+    if leaders:
+        st.markdown(f"**Principales indicadores adelantados de {get_series_label(target)}**")
+        st.dataframe(
+            pd.DataFrame([{
+                'Indicador': get_series_label(leader['key']),
+                'Adelanto (meses)': leader['lag'],
+                'Correlación': leader['corr'],
+                'Meses en común': leader['overlap']
+            } for leader in leaders]),
+            use_container_width=True,
+            hide_index=True,
+            column_config={'Correlación': st.column_config.NumberColumn(format="%.2f")}
+        )
+    else:
+        st.info("No hay suficientes meses en común para estimar indicadores adelantados")
+    
+    st.plotly_chart(create_lead_lag_heatmap(lead_lag, lag), use_container_width=True)
+
+# La selección de objetivo y rezago solo vuelve a ejecutar su propio bloque cuando Streamlit lo soporta
+if hasattr(st, 'fragment'):
+    render_lead_lag_fragment = st.fragment(render_lead_lag)
+else:
+    render_lead_lag_fragment = render_lead_lag
+
+def create_revisions_chart(revisions, label, unit):
+    """
+    Crea el gráfico de barras de las revisiones por mes de referencia, una serie por publicación
+    
+    Args:
+        revisions (pd.DataFrame): Resultado de load_revisions
+        label (str): Nombre de la serie revisada
+        unit (str): Unidad de los valores
+    """
+    colors = get_colors()
+    chart_colors = get_chart_colors()
+    release_colors = [colors['primary'], colors['secondary'], colors['warning'],
+                      colors['success'], colors['info'], colors['neutral']]
+    
+    fig = go.Figure()
+    for i, (revised_at, release) in enumerate(revisions.groupby('revised_at', sort=True)):
+        fig.add_trace(go.Bar(
+            x=release['date'].dt.strftime('%Y-%m'),
+            y=release['revision'],
+            customdata=release[['old_value', 'new_value']].to_numpy(),
+            name=f"Publicación {revised_at[:16]}",
+            marker_color=release_colors[i % len(release_colors)],
+            hovertemplate='Mes: %{x}<br>' +
+                         f'Revisión: %{{y:+,.1f}} {unit}<br>' +
+                         'Anterior: %{customdata[0]:,.1f}<br>' +
+                         'Revisado: %{customdata[1]:,.1f}<extra></extra>'
+        ))
+    
+    fig.add_hline(y=0, line_color=colors['border'])
+    fig.update_layout(
+        title=f"Revisiones de {label}",
+        xaxis_title="Mes de referencia",
+        yaxis_title=f"Revisión ({unit})",
+        template=get_plotly_template(),
+        height=400,
+        barmode='group',
+        font=dict(color=chart_colors['text_color']),
+        plot_bgcolor=chart_colors['plot_bgcolor'],
+        paper_bgcolor=chart_colors['paper_bgcolor'],
+        legend=dict(orientation='h', y=-0.25)
+    )
+    
+    return fig
+
+def render_revisions(revisions):
+    """
+    Muestra el tamaño de las revisiones de la serie configurada en las publicaciones recientes
+    
+    Args:
+        revisions (pd.DataFrame): Resultado de load_revisions
+    """
+    config = REVISIONS_CONFIG
+    label = UI_LABELS.get(config['metric'], config['metric'])
+    
+    st.markdown("### 🔁 Revisiones de Datos Publicados")
+    st.markdown(f"*Cambios en meses ya publicados de {label} en las últimas {config['releases']} publicaciones con revisiones*")
+    
+    if revisions.empty:
+        st.info("Aún no se han detectado revisiones: se registran al actualizar datos ya almacenados")
+        return
+    
+    by_release = revisions.groupby('revised_at', sort=True)['revision'].agg(
+        meses='count',
+        neta='sum',
+        media_abs=lambda values: values.abs().mean(),
+        maxima_abs=lambda values: values.abs().max()
+    )
+    latest = by_release.iloc[-1]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Meses revisados (última publicación)", f"{int(latest['meses'])}")
+    with col2:
+        st.metric("Revisión neta (última publicación)", f"{latest['neta']:+,.1f} {config['unit']}")
+    with col3:
+        st.metric("Revisión absoluta media (publicaciones recientes)",
+                  f"{revisions['revision'].abs().mean():,.1f} {config['unit']}")
+    
+    st.plotly_chart(create_revisions_chart(revisions, label, config['unit']), use_container_width=True)
+    
+    st.dataframe(
+        pd.DataFrame({
+            'Publicación': by_release.index.str[:16],
+            'Meses revisados': by_release['meses'].to_numpy(),
+            f"Revisión neta ({config['unit']})": by_release['neta'].to_numpy(),
+            f"Revisión absoluta media ({config['unit']})": by_release['media_abs'].to_numpy(),
+            f"Revisión absoluta máxima ({config['unit']})": by_release['maxima_abs'].to_numpy()
+        }).iloc[::-1],
+        use_container_width=True,
+        hide_index=True
+    )
+
+def create_diffusion_chart(indexes, filter_type=None, filter_params=None):
+    """
+    Crea el gráfico del índice de difusión del empleo para cada intervalo
+    
+    Args:
+        indexes (dict): {intervalo en meses: MonthlySeries} (ver load_diffusion_index)
+    """
+    colors = get_colors()
+    chart_colors = get_chart_colors()
+    span_colors = [colors['primary'], colors['secondary'], colors['success']]
+    
+    fig = go.Figure()
+    for i, (span, series) in enumerate(sorted(indexes.items())):
+        if filter_type and filter_params:
+            series = filter_data_by_date(series, filter_type, filter_params)
+        fig.add_trace(make_line_trace(
+            prepare_chart_data(series),
+            mode='lines',
+            name=f"{span} {'mes' if span == 1 else 'meses'}",
+            line=dict(color=span_colors[i % len(span_colors)], width=2 if span > 1 else 1),
+            hovertemplate='Fecha: %{x}<br>Índice: %{y:.1f}<extra></extra>'
+        ))
+    
+    fig.add_hline(y=50, line_dash="dash", line_color=colors['warning'],
+                  annotation_text="50 = tantas industrias crecen como decrecen")
+    
+    fig.update_layout(
+        title="📶 Índice de Difusión del Empleo",
+        xaxis_title="Fecha",
+        yaxis_title="% de industrias con empleo creciente",
+        yaxis=dict(range=[0, 100]),
+        template=get_plotly_template(),
+        height=400,
+        font=dict(color=chart_colors['text_color']),
+        plot_bgcolor=chart_colors['plot_bgcolor'],
+        paper_bgcolor=chart_colors['paper_bgcolor'],
+        hovermode='x unified',
+        legend=dict(orientation='h', y=-0.2)
+    )
+    
+    return fig
+
+def render_diffusion_index(indexes, filter_type=None, filter_params=None):
+    """
+    Muestra el valor actual y la historia del índice de difusión del empleo
+    
+    Args:
+        indexes (dict): Resultado de load_diffusion_index
+    """
+    if not indexes:
+        return
+    
+    st.markdown("### 📶 Amplitud del Empleo")
+    st.markdown(f"*Porcentaje de {len(CES_INDUSTRY_SERIES)} industrias CES con empleo creciente "
+                "(las que no cambian cuentan la mitad)*")
+    
+    columns = st.columns(len(indexes))
+    for column, (span, series) in zip(columns, sorted(indexes.items())):
+        with column:
+            st.metric(
+                label=f"Difusión a {span} {'mes' if span == 1 else 'meses'}",
+                value=f"{series.latest_value:.1f}",
+                delta=f"{series.latest_value - series.previous_value:+.1f} vs mes anterior" if len(series) > 1 else None,
+                delta_color="off",
+                help=f"Dato de {series.latest_date:%B %Y}"
+            )
+    
+    st.plotly_chart(create_diffusion_chart(indexes, filter_type, filter_params), use_container_width=True)
+
+def create_contributions_chart(contributions, period):
+    """
+    Crea las barras apiladas de la contribución de cada sector al cambio mensual de las nóminas
+    
+    Args:
+        contributions (SectorContributions): Contribuciones precalculadas del snapshot
+        period (slice): Meses del período seleccionado (ver SectorContributions.window)
+    """
+    from plotly.colors import qualitative  # Diferido hasta dibujar el gráfico
+    
+    colors = get_colors()
+    chart_colors = get_chart_colors()
+    palette = qualitative.Plotly + qualitative.Pastel
+    
+    labels = contributions.labels[period]
+    sectors, matrix = contributions.grouped(period, SECTOR_CONTRIBUTION_CONFIG['max_sectors'])
+    
+    fig = go.Figure()
+    for i, (sector, values) in enumerate(zip(sectors, matrix)):
+        fig.add_trace(go.Bar(
+            x=labels,
+            y=values,
+            name=sector,
+            marker_color=palette[i % len(palette)],
+            hovertemplate=f'<b>{sector}</b><br>' + 'Mes: %{x}<br>Contribución: %{y:+,.0f}K<extra></extra>'
+        ))
+    
+    fig.add_trace(go.Scatter(
+        x=labels,
+        y=contributions.total_change[period],
+        customdata=contributions.discrepancy[period],
+        mode='markers',
+        name='Cambio total',
+        marker=dict(color=colors['text'], size=7, symbol='diamond'),
+        hovertemplate='<b>Cambio total</b><br>Mes: %{x}<br>%{y:+,.0f}K<br>' +
+                     'Diferencia con la suma de sectores: %{customdata:+,.1f}K<extra></extra>'
+    ))
+    
+    fig.add_hline(y=0, line_color=colors['border'])
+    fig.update_layout(
+        title="Contribución por Sector al Cambio Mensual de Nóminas",
+        xaxis_title="Mes",
+        yaxis_title="Cambio mensual (K empleos)",
+        template=get_plotly_template(),
+        height=500,
+        barmode='relative',
+        font=dict(color=chart_colors['text_color']),
+        plot_bgcolor=chart_colors['plot_bgcolor'],
+        paper_bgcolor=chart_colors['paper_bgcolor'],
+        hovermode='closest',
+        legend=dict(orientation='h', y=-0.2)
+    )
+    
+    return fig
+
+def render_sector_contributions(contributions, key_prefix="contributions"):
+    """
+    Muestra la descomposición del cambio mensual de las nóminas por sector
+    
+    Solo recorta las matrices precalculadas por snapshot al período elegido.
+    """
+    st.markdown("### 🧱 Contribución por Sector")
+    st.markdown("*Cambio mensual de las nóminas no agrícolas repartido entre sectores*")
+    
+    if len(contributions) < 2:
+        st.info("Se necesitan las nóminas totales y el empleo por sector para calcular las contribuciones")
+        return
+    
+    labels = contributions.labels
+    default_start = max(len(labels) - SECTOR_CONTRIBUTION_CONFIG['default_months'], 0)
+    start_label, end_label = st.select_slider(
+        "Período:",
+        options=labels.tolist(),
+        value=(labels[default_start], labels[-1]),
+        key=f"{key_prefix}_period"
+    )
+    
+    # Las etiquetas 'YYYY-MM' están ordenadas, así que el período se ubica por búsqueda binaria
+    period = slice(int(np.searchsorted(labels, start_label)), int(np.searchsorted(labels, end_label)) + 1)
+    st.plotly_chart(create_contributions_chart(contributions, period), use_container_width=True)
+
+# El cambio de período solo vuelve a ejecutar su propio bloque cuando Streamlit lo soporta
+if hasattr(st, 'fragment'):
+    render_sector_contributions_fragment = st.fragment(render_sector_contributions)
+else:
+    render_sector_contributions_fragment = render_sector_contributions
+
 def create_report_links_section():
     """
     Crea sección con enlaces útiles a reportes y calendarios
@@ -1315,6 +2508,8 @@ def main():
     """
     Función principal del dashboard
     """
+    run_started_at = time.perf_counter()
+    
     # Control de configuración en sidebar
     st.sidebar.header("⚙️ Configuración")
     
@@ -1325,30 +2520,52 @@ def main():
     st.markdown('<h1 class="main-header">Dashboard Mercado Laboral USA</h1>', 
                 unsafe_allow_html=True)
     
-    # Control para forzar actualización
-    force_refresh = st.sidebar.button("🔄 Actualizar Datos")
+    # Control para forzar actualización (se ejecuta en segundo plano)
+    refresher = get_refresher()
+    if st.sidebar.button("🔄 Actualizar Datos"):
+        start_background_refresh(refresher)
     
-    # Cargar datos primero para obtener años disponibles
-    with st.spinner("Cargando datos..."):
-        try:
-            data_dict = load_labor_data(force_refresh=force_refresh)
-            
-            if data_dict:
-                available_years = get_available_years(data_dict)
-                min_date, max_date = get_date_range(data_dict)
-            else:
-                available_years = list(range(2020, 2026))
-                min_date, max_date = datetime(2020, 1, 1), datetime.now()
-                
-        except Exception as e:
-            st.error(f"❌ Error cargando datos: {e}")
+    # Si los datos están desactualizados, actualizarlos sin bloquear la sesión
+    try:
+        data_status = get_data_status()
+        if data_status['needs_refresh'] and not refresher.is_running() and can_auto_refresh():
+            start_background_refresh(refresher)
+    except Exception as e:
+        st.error(f"❌ Error verificando la base de datos: {e}")
+        data_status = {'total_series': 0}
+    
+    with st.sidebar:
+        if refresher.is_running():
+            render_refresh_progress_live(refresher)
+        else:
+            render_refresh_progress(refresher)
+    
+    # Renderizado progresivo: primero lo que sale de consultas pequeñas (límites de
+    # fechas, resumen de KPIs y alertas); los paneles de gráficos muestran un esqueleto
+    # y se completan a medida que sus datos y figuras están listos.
+    try:
+        snapshot_id = get_snapshot_id()
+        data_summary = load_data_summary(snapshot_id) if data_status['total_series'] else None
+        
+        if data_summary and data_summary['available_years']:
+            available_years = data_summary['available_years']
+            min_date, max_date = data_summary['min_date'], data_summary['max_date']
+        else:
             available_years = list(range(2020, 2026))
             min_date, max_date = datetime(2020, 1, 1), datetime.now()
-            data_dict = None
+            
+    except Exception as e:
+        st.error(f"❌ Error cargando datos: {e}")
+        available_years = list(range(2020, 2026))
+        min_date, max_date = datetime(2020, 1, 1), datetime.now()
+        data_summary = None
     
     # Renderizar controles de filtro de fecha con años dinámicos
     filter_type, filter_params = render_date_filters_dynamic(available_years, min_date, max_date)
     
+    # Fecha de publicación consultada (None = datos vigentes)
+    as_of = render_as_of_picker(load_vintage_range(snapshot_id)) if data_summary else None
+    
     # Información sobre las fuentes de datos
     st.sidebar.markdown("### Fuentes de Datos")
     st.sidebar.markdown("- **FRED**: Federal Reserve Economic Data")
@@ -1362,54 +2579,50 @@ def main():
         st.sidebar.markdown(f"**Registros totales**: {db_status['total_records']:,}")
         if db_status['last_update']:
             st.sidebar.markdown(f"**Última actualización**: {db_status['last_update'][:16]}")
+        render_backoff_status(refresher)
     
     # Opción para actualización completa
     if st.sidebar.button("🔄 Actualizar desde APIs", help="Obtiene los datos más recientes desde BLS y FRED"):
-        # Si los datos no se cargaron antes, intentar cargarlos ahora
-        if not data_dict:
-            with st.spinner("Cargando datos del mercado laboral desde SQLite..."):
-                try:
-                    data_dict = load_labor_data(force_refresh=True)
-                    
-                    if not data_dict:
-                        st.error("🚨 No hay datos disponibles en la base de datos")
-                        st.info("🔧 Intentando poblar la base de datos...")
-                        
-                        # Intentar poblar la base de datos
-                        collector = LaborMarketDataCollector()
-                        collector.refresh_all_data()
-                        data_dict = load_labor_data()
-                        
-                        if not data_dict:
-                            st.error("No se pudo poblar la base de datos. Verifica la configuración de APIs.")
-                            return
-                    
-                    # Recalcular años disponibles y rango de fechas
-                    available_years = get_available_years(data_dict)
-                    min_date, max_date = get_date_range(data_dict)
-                    
-                except Exception as e:
-                    st.error(f"❌ Error cargando datos: {e}")
-                    return
-        
-        st.sidebar.success("📊 Datos actualizados desde APIs")
+        start_background_refresh(refresher)
+        st.sidebar.success("📊 Actualización desde APIs iniciada en segundo plano")
     
-    if not data_dict:
-        st.error("No hay datos disponibles para mostrar")
+    if not data_summary:
+        if refresher.is_running():
+            st.info("⏳ Poblando la base de datos desde las APIs; el dashboard se mostrará al terminar")
+        else:
+            st.error("No hay datos disponibles para mostrar")
         return
     
-    # Verificar alertas
-    alerts = check_alerts(data_dict)
+    if as_of is None:
+        # Resumen precalculado de KPIs (una lectura pequeña e indexada)
+        summary = load_series_summary(snapshot_id)
+        
+        # Verificar alertas (reglas evaluadas en la ingesta)
+        alerts = check_alerts(load_alert_states(snapshot_id))
+        
+        # Mostrar alertas si existen
+        if alerts:
+            st.markdown("### 🚨 Alertas del Sistema")
+            for alert in alerts:
+                st.warning(alert)
+        render_alert_history(load_alert_history(snapshot_id))
+    else:
+        # Resumen, alertas, señales, pronósticos y anomalías describen los datos vigentes
+        summary = {}
+        st.info(f"📆 Datos tal como estaban publicados el {as_of:%d/%m/%Y}: sin revisiones posteriores. "
+                "Alertas, señales, pronósticos, anomalías y difusión solo se muestran para los datos vigentes.")
+    st.markdown("---")
     
-    # Mostrar alertas si existen
-    if alerts:
-        st.markdown("### 🚨 Alertas del Sistema")
-        for alert in alerts:
-            st.warning(alert)
-        st.markdown("---")
+    # KPIs Principales en la parte superior (desde el resumen si el filtro lo permite)
+    kpi_slot = st.empty()
+    kpi_from_summary = not kpis_need_data(summary, filter_type, filter_params)
+    if kpi_from_summary:
+        with kpi_slot.container():
+            render_kpi_dashboard(None, filter_type, filter_params, summary)
+    else:
+        kpi_slot.markdown('<div class="chart-skeleton" style="height: 220px"></div>', unsafe_allow_html=True)
     
-    # KPIs Principales en la parte superior
-    render_kpi_dashboard(data_dict, filter_type, filter_params)
+    record_phase('primer_render', run_started_at)
     
     # Dashboard reorganizado por categorías temáticas
     # Crear pestañas principales siguiendo la propuesta del usuario
@@ -1418,63 +2631,147 @@ def main():
         "🏗️ Creación de Empleo", 
         "🔄 Dinámica Laboral",
         "💰 Compensación",
+        "🔬 Análisis Avanzado",
         "📅 Calendario",
         "🔗 Enlaces"
     ])
     
-    # Pestaña 1: 🏥 Salud General del Mercado Laboral
+    # Esqueletos de los paneles que dependen de las series completas
     with thematic_tabs[0]:
         st.markdown("### 🏥 Salud General del Mercado Laboral")
         st.markdown("*Métricas fundamentales que indican la salud general del empleo*")
-        
-        # Aplicar filtros a métricas de salud general
-        health_metrics = ['unemployment_rate', 'labor_force_participation']
-        filtered_health_data = {}
-        
-        for metric in health_metrics:
-            if metric in data_dict:
-                if filter_type and filter_params:
-                    filtered_health_data[metric] = filter_data_by_date(data_dict[metric], filter_type, filter_params)
-                else:
-                    filtered_health_data[metric] = data_dict[metric]
-        
-        # Gráfico dual: Desempleo vs Participación Laboral
-        if 'unemployment_rate' in filtered_health_data and 'labor_force_participation' in filtered_health_data:
-            dual_fig = create_dual_axis_chart(
-                filtered_health_data['unemployment_rate'],
-                filtered_health_data['labor_force_participation'], 
-                "Tasa de Desempleo (%)",
-                "Participación Laboral (%)",
-                "🏥 Desempleo vs Participación en la Fuerza Laboral"
-            )
-            st.plotly_chart(dual_fig, use_container_width=True)
-        
-        # Gráficos individuales mejorados
+        dual_slot = render_chart_skeleton(500)
         col1, col2 = st.columns(2)
-        
         with col1:
-            if 'unemployment_rate' in filtered_health_data:
-                unemp_fig = create_enhanced_line_chart(
-                    filtered_health_data['unemployment_rate'],
-                    "📉 Tasa de Desempleo",
-                    "Porcentaje (%)",
-                    color='#ff6b6b'
-                )
-                st.plotly_chart(unemp_fig, use_container_width=True)
-        
+            unemp_slot = render_chart_skeleton(400)
         with col2:
-            if 'labor_force_participation' in filtered_health_data:
-                part_fig = create_enhanced_line_chart(
-                    filtered_health_data['labor_force_participation'],
-                    "👥 Participación en Fuerza Laboral", 
-                    "Porcentaje (%)",
-                    color='#4dabf7'
-                )
-                st.plotly_chart(part_fig, use_container_width=True)
+            part_slot = render_chart_skeleton(400)
+        
+        # Señales precalculadas en la ingesta: no dependen de cargar las series
+        if as_of is None:
+            render_recession_signals(load_recession_signals(snapshot_id))
     
-    # Pestaña 2: 🏗️ Creación de Empleo
     with thematic_tabs[1]:
-        filtered_data_2 = render_category_metrics('dinamica_mercado', data_dict, filter_type, filter_params)
+        dynamics_slot = render_chart_skeleton(600)
+        contributions_slot = render_chart_skeleton(500)
+        
+        # Índice de difusión precalculado en la ingesta: no depende de cargar las series
+        if as_of is None:
+            render_diffusion_index(load_diffusion_index(snapshot_id), filter_type, filter_params)
+    
+    with thematic_tabs[2]:
+        wages_slot = render_chart_skeleton(600)
+    
+    # Pestaña 4: 💰 Compensación
+    with thematic_tabs[3]:
+        st.markdown("### 💰 Compensación y Costo Laboral")
+        compensation_slot = render_chart_skeleton(400)
+    
+    with thematic_tabs[4]:
+        advanced_tabs = st.tabs(["🪟 Comparación de Ventanas", "📐 Curva de Beveridge", "⏱️ Adelanto/Rezago",
+                                 "🔁 Revisiones"])
+        with advanced_tabs[0]:
+            window_comparison_slot = render_chart_skeleton(300)
+        with advanced_tabs[1]:
+            beveridge_slot = render_chart_skeleton(550)
+        with advanced_tabs[2]:
+            lead_lag_slot = render_chart_skeleton(650)
+        with advanced_tabs[3]:
+            # Revisiones registradas en la ingesta: no dependen de cargar las series
+            render_revisions(load_revisions(snapshot_id))
+    
+    # Pestañas sin datos de series: se muestran de inmediato
+    with thematic_tabs[5]:
+        create_publication_calendar()
+    
+    with thematic_tabs[6]:
+        create_report_links_section()
+    
+    footer = st.container()
+    
+    # Cargar las series completas una vez que la estructura de la página ya es visible
+    try:
+        data_dict = load_labor_data(snapshot_id, as_of)
+    except Exception as e:
+        st.error(f"❌ Error cargando datos: {e}")
+        return
+    
+    # Índice de estadísticas por ventana sobre el panel de las métricas principales (una vez por snapshot)
+    stats_index = load_window_stats(snapshot_id, as_of)
+    forecasts = load_forecasts(snapshot_id, get_forecast_version()) if as_of is None else {}
+    anomalies = load_anomalies(snapshot_id) if as_of is None else {}
+    
+    # Los niveles de resolución precalculados solo corresponden a los datos vigentes
+    chart_series_ids = SERIES_MAPPING if as_of is None else {}
+    
+    if not kpi_from_summary:
+        with kpi_slot.container():
+            render_kpi_dashboard(data_dict, filter_type, filter_params, summary)
+    
+    # Pestaña 1: 🏥 Salud General del Mercado Laboral
+    # Aplicar filtros a métricas de salud general
+    health_metrics = ['unemployment_rate', 'labor_force_participation']
+    filtered_health_data = {}
+    
+    for metric in health_metrics:
+        if metric in data_dict:
+            if filter_type and filter_params:
+                filtered_health_data[metric] = filter_data_by_date(data_dict[metric], filter_type, filter_params)
+            else:
+                filtered_health_data[metric] = data_dict[metric]
+    
+    # Gráfico dual: Desempleo vs Participación Laboral
+    if 'unemployment_rate' in filtered_health_data and 'labor_force_participation' in filtered_health_data:
+        dual_fig = create_dual_axis_chart(
+            filtered_health_data['unemployment_rate'],
+            filtered_health_data['labor_force_participation'], 
+            "Tasa de Desempleo (%)",
+            "Participación Laboral (%)",
+            "🏥 Desempleo vs Participación en la Fuerza Laboral"
+        )
+        dual_slot.plotly_chart(dual_fig, use_container_width=True)
+    else:
+        dual_slot.empty()
+    
+    # Gráficos individuales mejorados
+    if 'unemployment_rate' in filtered_health_data:
+        unemp_fig = create_enhanced_line_chart(
+            filtered_health_data['unemployment_rate'],
+            "📉 Tasa de Desempleo",
+            "Porcentaje (%)",
+            color='#ff6b6b',
+            width_px=CHART_RENDER_CONFIG['half_width_px'],
+            series_id=chart_series_ids.get('unemployment_rate'),
+            mean_value=get_window_mean(stats_index, 'unemployment_rate', filtered_health_data['unemployment_rate']),
+            forecast=forecasts.get(SERIES_MAPPING['unemployment_rate']),
+            anomalies=anomalies.get(SERIES_MAPPING['unemployment_rate']),
+            snapshot_id=snapshot_id
+        )
+        unemp_slot.plotly_chart(unemp_fig, use_container_width=True)
+    else:
+        unemp_slot.empty()
+    
+    if 'labor_force_participation' in filtered_health_data:
+        part_fig = create_enhanced_line_chart(
+            filtered_health_data['labor_force_participation'],
+            "👥 Participación en Fuerza Laboral", 
+            "Porcentaje (%)",
+            color='#4dabf7',
+            width_px=CHART_RENDER_CONFIG['half_width_px'],
+            series_id=chart_series_ids.get('labor_force_participation'),
+            mean_value=get_window_mean(stats_index, 'labor_force_participation',
+                                       filtered_health_data['labor_force_participation']),
+            forecast=forecasts.get(SERIES_MAPPING['labor_force_participation']),
+            anomalies=anomalies.get(SERIES_MAPPING['labor_force_participation']),
+            snapshot_id=snapshot_id
+        )
+        part_slot.plotly_chart(part_fig, use_container_width=True)
+    else:
+        part_slot.empty()
+    
+    # Pestaña 2: 🏗️ Creación de Empleo
+    with dynamics_slot.container():
+        filtered_data_2 = render_category_metrics('dinamica_mercado', data_dict, filter_type, filter_params, summary)
         
         # Gráfico específico para dinámica con datos filtrados
         if len(filtered_data_2) >= 2:
@@ -1482,9 +2779,12 @@ def main():
             combined_fig = create_combined_chart(filtered_data_2, " (Filtrado)")
             st.plotly_chart(combined_fig, use_container_width=True)
     
+    with contributions_slot.container():
+        render_sector_contributions_fragment(load_sector_contributions(snapshot_id, as_of))
+    
     # Pestaña 3: Salarios e Inflación
-    with thematic_tabs[2]:
-        filtered_data_3 = render_category_metrics('salarios_inflacion', data_dict, filter_type, filter_params)
+    with wages_slot.container():
+        filtered_data_3 = render_category_metrics('salarios_inflacion', data_dict, filter_type, filter_params, summary)
         
         # Gráficos específicos para salarios con datos filtrados
         if len(filtered_data_3) >= 1:
@@ -1493,47 +2793,61 @@ def main():
                 if data is not None and len(data) > 0:
                     colors = get_colors()
                     fig = create_trend_chart(data, UI_LABELS[metric], 
-                                           UI_LABELS[metric], colors['success'])
+                                           UI_LABELS[metric], colors['success'],
+                                           series_id=chart_series_ids.get(metric),
+                                           snapshot_id=snapshot_id)
                     st.plotly_chart(fig, use_container_width=True)
     
-
-    # Pestaña 4: 💰 Compensación (placeholder por ahora)
-    with thematic_tabs[3]:
-        st.markdown("### 💰 Compensación y Costo Laboral")
-        st.info("🚧 Esta sección se está desarrollando - próximamente análisis completo de salarios")
+    # Pestaña 4: crecimiento salarial interanual desde el panel mensual (el mismo del índice por ventana)
+    panel = load_panel(snapshot_id, as_of, tuple(UI_LABELS))
+    if 'avg_hourly_earnings' in panel:
+        wage_growth = filter_data_by_date(
+            panel.series('avg_hourly_earnings', 'pct_change', 12), filter_type, filter_params
+        )
+        compensation_slot.plotly_chart(
+            create_bar_chart_with_comparison(wage_growth, UI_LABELS['avg_hourly_earnings'], "%", "YoY"),
+            use_container_width=True
+        )
+    else:
+        compensation_slot.info("🚧 Esta sección se está desarrollando - próximamente análisis completo de salarios")
     
-    # Pestaña 5: 📅 Calendario de Publicaciones
-    with thematic_tabs[4]:
-        create_publication_calendar()
+    # Pestaña 5: comparación entre ventanas temporales
+    with window_comparison_slot.container():
+        render_window_comparison(stats_index)
     
-    # Pestaña 6: 🔗 Enlaces Útiles
-    with thematic_tabs[5]:
-        create_report_links_section()
+    with beveridge_slot.container():
+        render_beveridge_curve_fragment(load_beveridge_curve(snapshot_id, as_of))
     
-    # Footer con información adicional
-    st.markdown("---")
-    st.markdown("### ℹ️ Información Adicional")
+    with lead_lag_slot.container():
+        render_lead_lag_fragment(load_lead_lag(snapshot_id, as_of))
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Descripción de Métricas:**")
-        for metric, desc in METRIC_DESCRIPTIONS.items():
-            if metric in data_dict:
-                st.markdown(f"- **{UI_LABELS.get(metric, metric)}**: {desc}")
+    record_phase('render_completo', run_started_at)
     
-    with col2:
-        st.markdown("**Estado del Sistema:**")
-        st.markdown(f"- **Última actualización**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        st.markdown(f"- **Métricas disponibles**: {len(data_dict)}")
-        st.markdown(f"- **Período de datos**: {YEARS_OF_DATA} años")
-        st.markdown(f"- **Base de datos**: SQLite ({db_status.get('total_records', 0):,} registros)")
+    # Footer con información adicional (contenedor reservado antes de cargar las series)
+    with footer:
+        st.markdown("---")
+        st.markdown("### ℹ️ Información Adicional")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Descripción de Métricas:**")
+            for metric, desc in METRIC_DESCRIPTIONS.items():
+                if metric in data_dict:
+                    st.markdown(f"- **{UI_LABELS.get(metric, metric)}**: {desc}")
+        
+        with col2:
+            st.markdown("**Estado del Sistema:**")
+            st.markdown(f"- **Última actualización**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            st.markdown(f"- **Métricas disponibles**: {len(data_dict)}")
+            st.markdown(f"- **Período de datos**: {YEARS_OF_DATA} años")
+            st.markdown(f"- **Base de datos**: SQLite ({db_status.get('total_records', 0):,} registros)")
         
-        # Mostrar información de fuentes de datos
-        if db_status.get('series_details'):
-            sources = set(detail[2] for detail in db_status['series_details'] if detail[2])
-            if sources:
-                st.markdown(f"- **Fuentes**: {', '.join(sources)}")
+            # Mostrar información de fuentes de datos
+            if db_status.get('series_details'):
+                sources = set(detail[2] for detail in db_status['series_details'] if detail[2])
+                if sources:
+                    st.markdown(f"- **Fuentes**: {', '.join(sources)}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
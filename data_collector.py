@@ -3,14 +3,29 @@ Módulo de extracción de datos del mercado laboral USA
 Conecta con APIs de BLS (Bureau of Labor Statistics) y FRED (Federal Reserve Economic Data)
 """
 
-import requests
+import os
+import threading
+import numpy as np
 import pandas as pd
 import json
 import sqlite3
 from datetime import datetime, timedelta
 import time
 import logging
+from functools import partial
 from config import *
+from downsampling import build_resolution_levels, pick_resolution_level
+from single_flight import run_single_flight
+from backoff import BackoffTracker
+from metric_rules import classify_health
+from alert_rules import compile_rules, format_message, rule_lookback, RESCORE_MONTHS
+from monthly_series import MonthlySeries, month_ordinal
+from recession_signals import create_signal, is_triggered
+from seasonal import decompose_batch, input_hash
+from forecasting import MODEL_TYPES, Z_SCORES, contiguous_tail, fit_batch
+from anomalies import score_panel
+from diffusion import diffusion_indexes
+from monthly_panel import MonthlyPanel
 
 # Configurar logging
 logging.basicConfig(
@@ -18,6 +33,34 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Reglas de alerta compiladas una vez por proceso
+_compiled_alert_rules = compile_rules(ALERT_RULES)
+
+# Bases de datos cuyo esquema ya se verificó en este proceso
+_initialized_databases = set()
+_setup_lock = threading.Lock()
+
+def _as_of_timestamp(as_of):
+    """
+    Normaliza una fecha de consulta as-of (una fecha sin hora incluye todo ese día)
+    """
+    if isinstance(as_of, datetime):
+        # Instante exacto (p. ej. la publicación de un snapshot)
+        return as_of.strftime('%Y-%m-%d %H:%M:%S')
+    timestamp = pd.Timestamp(as_of)
+    if timestamp == timestamp.normalize():
+        return timestamp.strftime('%Y-%m-%d 23:59:59')
+    return timestamp.strftime('%Y-%m-%d %H:%M:%S')
+
+def _snapshot_published_at(snapshot_id):
+    """
+    Momento de publicación codificado en el ID de un snapshot (None si no es válido)
+    """
+    try:
+        return datetime.strptime(snapshot_id, '%Y%m%d%H%M%S%f')
+    except (TypeError, ValueError):
+        return None
+
 class LaborMarketDataCollector:
     """
     Clase principal para recolección de datos del mercado laboral
@@ -27,7 +70,14 @@ class LaborMarketDataCollector:
         self.fred_api_key = FRED_API_KEY
         self.bls_api_key = BLS_API_KEY
         self.db_path = DATABASE_PATH
-        self.setup_database()
+        
+        # El DDL y las migraciones se ejecutan una vez por proceso, no en cada instancia
+        db_key = os.path.abspath(self.db_path)
+        with _setup_lock:
+            if db_key not in _initialized_databases:
+                self.setup_database()
+                _initialized_databases.add(db_key)
+        self.backoff = BackoffTracker(self.db_path)
         
     def setup_database(self):
         """
@@ -84,11 +134,28 @@ class LaborMarketDataCollector:
                     geography TEXT DEFAULT 'USA',
                     category TEXT,
                     active BOOLEAN DEFAULT TRUE,
+                    min_date TEXT,
+                    max_date TEXT,
+                    obs_count INTEGER DEFAULT 0,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
             
+            # Migrar bases de datos existentes: rango de fechas y conteo por serie
+            self._add_missing_columns(cursor, 'series_metadata', {
+                'min_date': 'TEXT',
+                'max_date': 'TEXT',
+                'obs_count': 'INTEGER DEFAULT 0'
+            })
+            cursor.execute('''
+                UPDATE series_metadata SET
+                    min_date = (SELECT MIN(date) FROM labor_data ld WHERE ld.series_id = series_metadata.series_id),
+                    max_date = (SELECT MAX(date) FROM labor_data ld WHERE ld.series_id = series_metadata.series_id),
+                    obs_count = (SELECT COUNT(*) FROM labor_data ld WHERE ld.series_id = series_metadata.series_id)
+                WHERE min_date IS NULL
+            ''')
+            
             # Tabla de log de actualizaciones para auditoría
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS update_log (
@@ -104,6 +171,204 @@ class LaborMarketDataCollector:
                 )
             ''')
             
+            # Tabla de niveles de resolución precalculados (LTTB) para gráficos
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS labor_data_lod (
+                    series_id TEXT NOT NULL,
+                    level INTEGER NOT NULL,
+                    date TEXT NOT NULL,
+                    value REAL NOT NULL,
+                    PRIMARY KEY (series_id, level, date)
+                )
+            ''')
+
+            # Revisiones de valores ya publicados detectadas al reescribir cada serie
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS data_revisions (
+                    series_id TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    old_value REAL NOT NULL,
+                    new_value REAL NOT NULL,
+                    revised_at TEXT NOT NULL,
+                    PRIMARY KEY (series_id, date, revised_at)
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_data_revisions_release
+                ON data_revisions(series_id, revised_at DESC)
+            ''')
+            
+            # Historial bitemporal: cada valor con su vigencia [valid_from, valid_to)
+            # Solo se guarda una fila nueva cuando el valor de un mes cambia
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS labor_data_vintages (
+                    series_id TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    value REAL NOT NULL,
+                    valid_from TEXT NOT NULL,
+                    valid_to TEXT,
+                    PRIMARY KEY (series_id, date, valid_from)
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_vintages_current
+                ON labor_data_vintages(series_id, date) WHERE valid_to IS NULL
+            ''')
+            
+            # Resumen precalculado por serie (KPIs, salud y alertas) mantenido en la ingesta
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS series_summary (
+                    series_id TEXT PRIMARY KEY,
+                    metric_name TEXT,
+                    latest_date TEXT,
+                    latest_value REAL,
+                    previous_date TEXT,
+                    previous_value REAL,
+                    mom_change REAL,
+                    mom_pct REAL,
+                    yoy_change REAL,
+                    yoy_pct REAL,
+                    percentile_rank REAL,
+                    health_status TEXT,
+                    obs_count INTEGER,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Modelos de pronóstico persistidos (parámetros y estado) y sus pronósticos
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS forecast_models (
+                    series_id TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    last_month INTEGER NOT NULL,
+                    inputs TEXT NOT NULL,
+                    updates_since_fit INTEGER DEFAULT 0,
+                    snapshot_id TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS forecasts (
+                    series_id TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    value REAL NOT NULL,
+                    lower REAL NOT NULL,
+                    upper REAL NOT NULL,
+                    PRIMARY KEY (series_id, date)
+                )
+            ''')
+            
+            # Observaciones marcadas como anómalas en la ingesta y último mes evaluado por serie
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS anomalies (
+                    series_id TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    value REAL NOT NULL,
+                    change REAL,
+                    mad_z REAL,
+                    seasonal_z REAL,
+                    detected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (series_id, date)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS anomaly_state (
+                    series_id TEXT PRIMARY KEY,
+                    last_month INTEGER NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_series_summary_metric
+                ON series_summary(metric_name)
+            ''')
+            
+            # Estado actual e historial de disparos de las reglas de alerta
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS alert_state (
+                    rule TEXT PRIMARY KEY,
+                    metric_name TEXT,
+                    series_id TEXT,
+                    active INTEGER NOT NULL,
+                    last_month INTEGER NOT NULL,
+                    value REAL,
+                    message TEXT,
+                    fired_since TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS alert_history (
+                    rule TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    value REAL NOT NULL,
+                    PRIMARY KEY (rule, date)
+                )
+            ''')
+            
+            # Estado incremental e historial de las señales de recesión
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS recession_signal_state (
+                    signal TEXT PRIMARY KEY,
+                    series_id TEXT NOT NULL,
+                    last_month INTEGER NOT NULL,
+                    inputs TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS recession_signals (
+                    signal TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    value REAL NOT NULL,
+                    triggered INTEGER NOT NULL,
+                    PRIMARY KEY (signal, date)
+                )
+            ''')
+            
+            # Componentes de la descomposición estacional y huella de su entrada
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS derived_series (
+                    series_id TEXT NOT NULL,
+                    component TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    value REAL NOT NULL,
+                    PRIMARY KEY (series_id, component, date)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS decomposition_state (
+                    series_id TEXT PRIMARY KEY,
+                    input_hash TEXT NOT NULL,
+                    mode TEXT NOT NULL,
+                    obs_count INTEGER,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Lease para coordinar actualizaciones entre procesos (single-flight)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS refresh_lease (
+                    name TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    acquired_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            ''')
+            
+            # Estado de backoff (caché negativa) por fuente y por serie
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS refresh_backoff (
+                    key TEXT PRIMARY KEY,
+                    failures INTEGER NOT NULL,
+                    last_error TEXT,
+                    last_failure_at REAL,
+                    next_attempt_at REAL NOT NULL
+                )
+            ''')
+            
             # Tabla de configuración del sistema
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS system_config (
@@ -120,40 +385,97 @@ class LaborMarketDataCollector:
                 VALUES 
                 ('db_version', '2.0', 'Versión del esquema de la base de datos'),
                 ('last_full_refresh', '', 'Última actualización completa de datos'),
+                ('snapshot_id', '', 'Versión de los datos publicados'),
                 ('data_source_priority', 'API_ONLY', 'Solo APIs reales, sin datos simulados'),
                 ('auto_populate', 'true', 'Poblar automáticamente datos faltantes')
             ''')
             
             conn.commit()
+            
+            # Poblar el resumen de KPIs en bases de datos creadas antes de existir la tabla
+            cursor.execute('SELECT COUNT(*) FROM series_summary')
+            summary_empty = cursor.fetchone()[0] == 0
+            cursor.execute('SELECT COUNT(*) FROM recession_signal_state')
+            signals_empty = cursor.fetchone()[0] == 0
+            cursor.execute('SELECT COUNT(*) FROM anomaly_state')
+            anomalies_empty = cursor.fetchone()[0] == 0
+            cursor.execute('SELECT COUNT(*) FROM alert_state')
+            alerts_empty = cursor.fetchone()[0] == 0
+            cursor.execute('SELECT COUNT(*) FROM labor_data_vintages')
+            vintages_empty = cursor.fetchone()[0] == 0
+            cursor.execute('SELECT COUNT(*) FROM derived_series WHERE series_id = ?',
+                           (DIFFUSION_CONFIG['series_id'],))
+            diffusion_empty = cursor.fetchone()[0] == 0
             conn.close()
+            if summary_empty:
+                self.rebuild_series_summary()
+            if signals_empty:
+                self.rebuild_recession_signals()
+            if anomalies_empty:
+                self.rebuild_anomalies()
+            if alerts_empty:
+                self.rebuild_alert_rules()
+            if vintages_empty:
+                self.rebuild_vintages()
+            if diffusion_empty:
+                self.rebuild_diffusion_index()
+            
             logging.info("Base de datos SQLite configurada como almacenamiento principal")
             
         except Exception as e:
             logging.error(f"Error configurando base de datos: {e}")
             
-    def get_fred_data(self, series_id, limit=60):
+    def _add_missing_columns(self, cursor, table, columns):
+        """
+        Añade a una tabla existente las columnas que falten (migración de esquema)
+        
+        Args:
+            cursor (sqlite3.Cursor): Cursor de la conexión abierta
+            table (str): Nombre de la tabla
+            columns (dict): {nombre_columna: definición SQL}
+        """
+        cursor.execute(f'PRAGMA table_info({table})')
+        existing = {row[1] for row in cursor.fetchall()}
+        for column, definition in columns.items():
+            if column not in existing:
+                cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+    
+    def get_fred_data(self, series_id, limit=None, vintages=False):
         """
         Obtiene datos de la API de FRED
         
         Args:
             series_id (str): ID de la serie de FRED
-            limit (int): Número de observaciones a obtener
+            limit (int): Número de observaciones más recientes (None = historia completa)
+            vintages (bool): Obtener todas las publicaciones de cada observación
+                (columnas realtime_start y realtime_end) en lugar de los últimos valores
         
         Returns:
             pd.DataFrame: DataFrame con los datos
         """
+        import requests  # Diferido: solo se necesita al consultar las APIs
+        
         if not self.fred_api_key or self.fred_api_key == 'tu_api_key_aqui_requerida':
             logging.error("API key de FRED no configurada")
             return pd.DataFrame()
+        
+        # Respetar la ventana de backoff de la fuente y de la serie
+        if self.backoff.is_blocked('source:FRED') or self.backoff.is_blocked(f'series:{series_id}'):
+            logging.info(f"FRED {series_id} en backoff; se conservan los últimos datos guardados")
+            return pd.DataFrame()
             
         try:
             params = {
                 'series_id': series_id,
                 'api_key': self.fred_api_key,
                 'file_type': 'json',
-                'sort_order': 'desc',
-                'limit': limit
+                'sort_order': 'desc'
             }
+            if limit:
+                params['limit'] = limit
+            if vintages:
+                # Historial completo en tiempo real (ALFRED)
+                params.update({'realtime_start': '1776-07-04', 'realtime_end': '9999-12-31', 'limit': 100000})
             
             response = requests.get(FRED_BASE_URL, params=params)
             response.raise_for_status()
@@ -168,55 +490,83 @@ class LaborMarketDataCollector:
                 df = df.sort_values('date').reset_index(drop=True)
                 
                 logging.info(f"Obtenidos {len(df)} registros para {series_id} desde FRED")
+                self.backoff.record_success('source:FRED')
+                self.backoff.record_success(f'series:{series_id}')
                 return df
                 
+        except (requests.ConnectionError, requests.Timeout) as e:
+            # Fallo de red: toda la fuente queda en backoff
+            logging.error(f"Error obteniendo datos de FRED para {series_id}: {e}")
+            self.backoff.record_failure('source:FRED', e)
         except requests.RequestException as e:
             logging.error(f"Error obteniendo datos de FRED para {series_id}: {e}")
+            self.backoff.record_failure(f'series:{series_id}', e)
         except Exception as e:
             logging.error(f"Error procesando datos de FRED para {series_id}: {e}")
+            self.backoff.record_failure(f'series:{series_id}', e)
             
         return pd.DataFrame()
     
-    def get_bls_data(self, series_ids, start_year=2020, end_year=2025):
+    def get_bls_data(self, series_ids, start_year=None, end_year=None):
         """
         Obtiene datos de la API de BLS
         
+        La API limita los años por petición, así que el rango se pide en tramos y
+        las observaciones de cada serie se concatenan. Si un tramo falla no se
+        devuelve nada: una historia parcial haría que _write_series borrara los
+        meses ausentes.
+        
         Args:
             series_ids (list): Lista de IDs de series de BLS
-            start_year (int): Año de inicio
-            end_year (int): Año final
+            start_year (int): Año de inicio (por defecto el reciente de BLS_API_CONFIG)
+            end_year (int): Año final (por defecto el año en curso)
         
         Returns:
             dict: Diccionario con DataFrames por serie
         """
+        import requests  # Diferido: solo se necesita al consultar las APIs
+        
         if not isinstance(series_ids, list):
             series_ids = [series_ids]
+        start_year = start_year or int(BLS_API_CONFIG['startyear'])
+        end_year = end_year or datetime.now().year
             
         data_dict = {}
         
+        # Respetar la ventana de backoff de la fuente
+        if self.backoff.is_blocked('source:BLS'):
+            logging.info("BLS en backoff; se conservan los últimos datos guardados")
+            return data_dict
+        
         try:
-            payload = {
-                'seriesid': series_ids,
-                'startyear': str(start_year),
-                'endyear': str(end_year)
-            }
-            
-            if self.bls_api_key:
-                payload['registrationkey'] = self.bls_api_key
-            
-            headers = {'Content-Type': 'application/json'}
-            response = requests.post(BLS_BASE_URL, 
-                                   data=json.dumps(payload), 
-                                   headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data['status'] == 'REQUEST_SUCCEEDED':
+            observations = {series_id: [] for series_id in series_ids}
+            messages = []
+            years_per_request = BLS_API_CONFIG['max_years_per_request']
+            for chunk_start in range(start_year, end_year + 1, years_per_request):
+                payload = {
+                    'seriesid': series_ids,
+                    'startyear': str(chunk_start),
+                    'endyear': str(min(chunk_start + years_per_request - 1, end_year))
+                }
+                
+                if self.bls_api_key:
+                    payload['registrationkey'] = self.bls_api_key
+                
+                headers = {'Content-Type': 'application/json'}
+                response = requests.post(BLS_BASE_URL, 
+                                       data=json.dumps(payload), 
+                                       headers=headers)
+                response.raise_for_status()
+                
+                data = response.json()
+                
+                if data['status'] != 'REQUEST_SUCCEEDED':
+                    logging.error(f"Error en respuesta de BLS: {data.get('message', 'Error desconocido')}")
+                    self.backoff.record_failure('source:BLS', data.get('message', 'Error desconocido'))
+                    return {}
+                
+                messages.extend(data.get('message') or [])
                 for series in data['Results']['series']:
-                    series_id = series['seriesID']
-                    observations = []
-                    
                     for item in series['data']:
                         # Crear fecha a partir de year y period
                         if 'M' in item['period']:
@@ -226,170 +576,1493 @@ class LaborMarketDataCollector:
                         else:
                             continue
                             
-                        observations.append({
+                        observations.setdefault(series['seriesID'], []).append({
                             'date': date,
                             'value': float(item['value']) if item['value'] != '.' else None
                         })
-                    
-                    df = pd.DataFrame(observations)
-                    df = df[df['value'].notna()]  # Remover valores faltantes
-                    df = df.sort_values('date').reset_index(drop=True)
-                    
-                    data_dict[series_id] = df
-                    logging.info(f"Obtenidos {len(df)} registros para {series_id} desde BLS")
-            else:
-                logging.error(f"Error en respuesta de BLS: {data.get('message', 'Error desconocido')}")
+            
+            for series_id, series_observations in observations.items():
+                df = pd.DataFrame(series_observations, columns=['date', 'value'])
+                df = df[df['value'].notna()]  # Remover valores faltantes
+                df = df.drop_duplicates('date').sort_values('date').reset_index(drop=True)
+                
+                if df.empty:
+                    continue
+                
+                data_dict[series_id] = df
+                self.backoff.record_success(f'series:{series_id}')
+                logging.info(f"Obtenidos {len(df)} registros para {series_id} desde BLS")
+            self.backoff.record_success('source:BLS')
+            
+            # La petición puede tener éxito aunque algunas series fallen (IDs
+            # inexistentes o sin datos): cada una entra en su propio backoff
+            for series_id in series_ids:
+                if series_id not in data_dict:
+                    error = next((m for m in messages if series_id in m), 'Serie sin datos en la respuesta de BLS')
+                    logging.warning(f"BLS no devolvió datos para {series_id}: {error}")
+                    self.backoff.record_failure(f'series:{series_id}', error)
                 
         except requests.RequestException as e:
             logging.error(f"Error obteniendo datos de BLS: {e}")
+            self.backoff.record_failure('source:BLS', e)
+            return {}
         except Exception as e:
             logging.error(f"Error procesando datos de BLS: {e}")
+            self.backoff.record_failure('source:BLS', e)
+            return {}
             
         return data_dict
     
-    def save_to_cache(self, series_id, df, source='FRED'):
+    def _write_series(self, conn, series_id, df, source, revised_at=None):
         """
-        Guarda datos en la base de datos SQLite permanente
+        Escribe una serie completa dentro de la transacción abierta
+        
+        Los valores entrantes se comparan con los guardados en una sola consulta
+        por conjuntos; los meses cuyo valor cambió se registran en data_revisions
+        y abren un nuevo vintage en labor_data_vintages.
         
         Args:
+            conn (sqlite3.Connection): Conexión con la transacción en curso
             series_id (str): ID de la serie
             df (pd.DataFrame): DataFrame con los datos
             source (str): Fuente de los datos (FRED, BLS, SAMPLE)
+            revised_at (str): Momento de la publicación (por defecto ahora)
+        
+        Returns:
+            int: Número de registros escritos
         """
         start_time = time.time()
-        records_affected = 0
-        success = False
-        error_message = None
+        revised_at = revised_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        try:
-            conn = sqlite3.connect(self.db_path)
-            
-            # Limpiar datos existentes para esta serie
-            conn.execute('DELETE FROM labor_data WHERE series_id = ?', (series_id,))
-            
-            # Insertar nuevos datos
-            for _, row in df.iterrows():
-                conn.execute('''
-                    INSERT OR REPLACE INTO labor_data 
-                    (series_id, date, value, value_status, data_quality_score)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    series_id, 
-                    row['date'].strftime('%Y-%m-%d'), 
-                    row['value'],
-                    'valid',
-                    100 if source in ['FRED', 'BLS'] else 80  # Datos de ejemplo tienen menor score
-                ))
-                records_affected += 1
-            
-            # Encontrar el nombre de métrica para esta serie
-            metric_name = None
-            for metric, sid in SERIES_MAPPING.items():
-                if sid == series_id:
-                    metric_name = metric
-                    break
-            
-            # Actualizar metadatos mejorados
-            title = UI_LABELS.get(series_id, series_id)
-            description = METRIC_DESCRIPTIONS.get(metric_name, 'Serie de datos del mercado laboral')
-            
-            conn.execute('''
-                INSERT OR REPLACE INTO series_metadata 
-                (series_id, metric_name, title, source, description, active)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (series_id, metric_name, title, source, description, True))
-            
-            # Registrar en log de actualizaciones
-            execution_time_ms = int((time.time() - start_time) * 1000)
-            conn.execute('''
-                INSERT INTO update_log 
-                (series_id, update_type, records_affected, source, success, execution_time_ms)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (series_id, 'data_save', records_affected, source, True, execution_time_ms))
-            
-            conn.commit()
-            conn.close()
-            
-            success = True
-            logging.info(f"Datos guardados permanentemente: {series_id} ({records_affected} registros) desde {source}")
-            
-        except Exception as e:
-            error_message = str(e)
-            logging.error(f"Error guardando datos {series_id}: {e}")
-            
-            # Registrar error en log
-            try:
-                conn = sqlite3.connect(self.db_path)
-                execution_time_ms = int((time.time() - start_time) * 1000)
-                conn.execute('''
-                    INSERT INTO update_log 
-                    (series_id, update_type, records_affected, source, success, error_message, execution_time_ms)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (series_id, 'data_save', records_affected, source, False, error_message, execution_time_ms))
-                conn.commit()
-                conn.close()
-            except:
-                pass
+        # Cargar los valores entrantes en una tabla temporal de la conexión
+        conn.execute('''
+            CREATE TEMP TABLE IF NOT EXISTS incoming_data (
+                date TEXT PRIMARY KEY,
+                value REAL NOT NULL
+            )
+        ''')
+        conn.execute('DELETE FROM incoming_data')
+        rows = [
+            (date.strftime('%Y-%m-%d'), float(value))
+            for date, value in zip(df['date'], df['value'])
+        ]
+        conn.executemany('INSERT OR REPLACE INTO incoming_data (date, value) VALUES (?, ?)', rows)
+        
+        # Revisiones: meses ya guardados cuyo valor cambió
+        revisions = conn.execute('''
+            INSERT OR REPLACE INTO data_revisions (series_id, date, old_value, new_value, revised_at)
+            SELECT d.series_id, d.date, d.value, i.value, ?
+            FROM incoming_data i
+            JOIN labor_data d ON d.series_id = ? AND d.date = i.date
+            WHERE d.value != i.value
+        ''', (revised_at, series_id)).rowcount
+        if revisions:
+            logging.info(f"Revisiones detectadas: {series_id} ({revisions} meses)")
+        
+        # Vintages: cerrar los valores revisados o retirados y abrir solo los que cambiaron
+        conn.execute('''
+            UPDATE labor_data_vintages SET valid_to = ?
+            WHERE series_id = ? AND valid_to IS NULL AND NOT EXISTS (
+                SELECT 1 FROM incoming_data i
+                WHERE i.date = labor_data_vintages.date AND i.value = labor_data_vintages.value
+            )
+        ''', (revised_at, series_id))
+        conn.execute('''
+            INSERT OR REPLACE INTO labor_data_vintages (series_id, date, value, valid_from)
+            SELECT ?, i.date, i.value, ? FROM incoming_data i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM labor_data_vintages v
+                WHERE v.series_id = ? AND v.date = i.date AND v.valid_to IS NULL
+            )
+        ''', (series_id, revised_at, series_id))
+        
+        # Primer mes nuevo, revisado o retirado (los derivados se recalculan desde ahí)
+        conn.execute('''
+            CREATE TEMP TABLE IF NOT EXISTS changed_series (
+                series_id TEXT PRIMARY KEY,
+                first_date TEXT NOT NULL
+            )
+        ''')
+        conn.execute('''
+            INSERT OR REPLACE INTO changed_series (series_id, first_date)
+            SELECT ?, first_date FROM (
+                SELECT MIN(date) AS first_date FROM (
+                    SELECT i.date FROM incoming_data i
+                    LEFT JOIN labor_data d ON d.series_id = ? AND d.date = i.date
+                    WHERE d.value IS NULL OR d.value != i.value
+                    UNION ALL
+                    SELECT date FROM labor_data
+                    WHERE series_id = ? AND date NOT IN (SELECT date FROM incoming_data)
+                )
+            ) WHERE first_date IS NOT NULL
+        ''', (series_id, series_id, series_id))
+        
+        # Meses que ya no publica la fuente
+        conn.execute('''
+            DELETE FROM labor_data
+            WHERE series_id = ? AND date NOT IN (SELECT date FROM incoming_data)
+        ''', (series_id,))
+        
+        # Insertar los meses nuevos y actualizar los existentes (revision_date solo si cambió el valor)
+        quality_score = 100 if source in ['FRED', 'BLS'] else 80  # Datos de ejemplo tienen menor score
+        conn.execute('''
+            INSERT INTO labor_data 
+            (series_id, date, value, value_status, data_quality_score)
+            SELECT ?, date, value, 'valid', ? FROM incoming_data WHERE true
+            ON CONFLICT(series_id, date) DO UPDATE SET
+                revision_date = CASE WHEN labor_data.value != excluded.value
+                                     THEN ? ELSE labor_data.revision_date END,
+                value = excluded.value,
+                value_status = excluded.value_status,
+                data_quality_score = excluded.data_quality_score,
+                last_updated = CURRENT_TIMESTAMP
+        ''', (series_id, quality_score, revised_at))
+        records_affected = len(rows)
+        
+        # Precalcular niveles de resolución para gráficos de series largas
+        self._save_resolution_levels(conn, series_id, df)
+        
+        # Encontrar el nombre de métrica para esta serie
+        metric_name = None
+        for metric, sid in SERIES_MAPPING.items():
+            if sid == series_id:
+                metric_name = metric
+                break
+        
+        # Actualizar metadatos mejorados
+        title = UI_LABELS.get(series_id, series_id)
+        description = METRIC_DESCRIPTIONS.get(metric_name, 'Serie de datos del mercado laboral')
+        
+        # Rango de fechas y número de observaciones para consultas sin leer los datos
+        dates = [row[0] for row in rows]
+        min_date = min(dates) if dates else None
+        max_date = max(dates) if dates else None
+        
+        conn.execute('''
+            INSERT OR REPLACE INTO series_metadata 
+            (series_id, metric_name, title, source, description, active, min_date, max_date, obs_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (series_id, metric_name, title, source, description, True, min_date, max_date, records_affected))
+        
+        # Actualizar el resumen de KPIs en la misma transacción
+        self._update_series_summary(conn, series_id, metric_name, df)
+        
+        # Evaluar las reglas de alerta de la métrica sobre los meses nuevos
+        self._update_alert_rules(conn, series_id, metric_name, df)
+        
+        # Incorporar los meses nuevos a las señales de recesión que dependen de la serie
+        self._update_recession_signals(conn, series_id, metric_name, df)
+        
+        # Registrar en log de actualizaciones
+        execution_time_ms = int((time.time() - start_time) * 1000)
+        conn.execute('''
+            INSERT INTO update_log 
+            (series_id, update_type, records_affected, source, success, execution_time_ms)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (series_id, 'data_save', records_affected, source, True, execution_time_ms))
+        
+        return records_affected
     
-    def load_from_cache(self, series_id):
+    def _update_series_summary(self, conn, series_id, metric_name, df):
         """
-        Carga datos desde la base de datos local
+        Recalcula la fila de series_summary de una serie dentro de la transacción abierta
+        
+        Args:
+            conn (sqlite3.Connection): Conexión con la transacción en curso
+            series_id (str): ID de la serie
+            metric_name (str): Nombre de la métrica (None para series sin métrica asociada)
+            df (pd.DataFrame): DataFrame completo con los datos
+        """
+        data = df[['date', 'value']].dropna().sort_values('date')
+        if data.empty:
+            conn.execute('DELETE FROM series_summary WHERE series_id = ?', (series_id,))
+            return
+        
+        dates = pd.to_datetime(data['date'])
+        values = data['value'].to_numpy(dtype=float)
+        latest_date, latest_value = dates.iloc[-1], values[-1]
+        previous_date = dates.iloc[-2] if len(values) > 1 else latest_date
+        previous_value = values[-2] if len(values) > 1 else latest_value
+        
+        mom_change = latest_value - previous_value
+        mom_pct = mom_change / previous_value * 100 if previous_value else None
+        
+        # Variación interanual contra la observación de hace 12 meses (si existe)
+        year_ago = dates.searchsorted(latest_date - pd.DateOffset(months=12))
+        if year_ago < len(values) and dates.iloc[year_ago] == latest_date - pd.DateOffset(months=12):
+            yoy_change = latest_value - values[year_ago]
+            yoy_pct = yoy_change / values[year_ago] * 100 if values[year_ago] else None
+        else:
+            yoy_change, yoy_pct = None, None
+        
+        percentile_rank = float((values <= latest_value).mean() * 100)
+        health_status = classify_health(metric_name, latest_value)
+        
+        conn.execute('''
+            INSERT OR REPLACE INTO series_summary
+            (series_id, metric_name, latest_date, latest_value, previous_date, previous_value,
+             mom_change, mom_pct, yoy_change, yoy_pct, percentile_rank,
+             health_status, obs_count, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (
+            series_id, metric_name,
+            latest_date.strftime('%Y-%m-%d'), float(latest_value),
+            previous_date.strftime('%Y-%m-%d'), float(previous_value),
+            float(mom_change), mom_pct, yoy_change, yoy_pct, percentile_rank,
+            health_status, len(values)
+        ))
+    
+    def rebuild_series_summary(self):
+        """
+        Recalcula series_summary para todas las series almacenadas
+        """
+        conn = sqlite3.connect(self.db_path)
+        series_ids = [row[0] for row in conn.execute('SELECT DISTINCT series_id FROM labor_data')]
+        metric_by_series = {sid: metric for metric, sid in SERIES_MAPPING.items()}
+        
+        for series_id in series_ids:
+            df = pd.read_sql_query(
+                'SELECT date, value FROM labor_data WHERE series_id = ? ORDER BY date',
+                conn, params=(series_id,)
+            )
+            df['date'] = pd.to_datetime(df['date'])
+            self._update_series_summary(conn, series_id, metric_by_series.get(series_id), df)
+        
+        conn.commit()
+        conn.close()
+        if series_ids:
+            logging.info(f"Resumen de KPIs recalculado para {len(series_ids)} series")
+    
+    def _update_alert_rules(self, conn, series_id, metric_name, df):
+        """
+        Evalúa las reglas de alerta de la métrica dentro de la transacción abierta
+        
+        Solo se evalúan los meses posteriores al último evaluado (más los últimos
+        meses, que pueden haber sido revisados), con el contexto mínimo que cada
+        regla necesita; sin estado previo se evalúa la historia completa.
         
         Args:
+            conn (sqlite3.Connection): Conexión con la transacción en curso
             series_id (str): ID de la serie
+            metric_name (str): Nombre de la métrica (None para series sin métrica asociada)
+            df (pd.DataFrame): DataFrame completo con los datos
+        """
+        rules = {name: rule for name, rule in ALERT_RULES.items() if rule['metric'] == metric_name}
+        if not rules:
+            return
+        
+        series = MonthlySeries.from_frame(df)
+        if not len(series):
+            return
+        
+        for name, rule in rules.items():
+            row = conn.execute(
+                'SELECT last_month, active, fired_since FROM alert_state WHERE rule = ?', (name,)
+            ).fetchone()
+            start_month = row[0] + 1 - RESCORE_MONTHS if row else int(series.months[0])
+            if start_month > int(series.months[-1]):
+                # La serie recibida termina antes de lo ya evaluado (meses retirados): evaluar todo
+                start_month = int(series.months[0])
+        
+            # Meses a evaluar más el contexto que necesita la regla (rezagos, rachas)
+            lo = int(np.searchsorted(series.months, start_month - rule_lookback(rule), side='left'))
+            months = series.months[lo:]
+            signal, active = _compiled_alert_rules[name](months, series.values[lo:])
+            evaluated = months >= start_month
+        
+            start_date = f"{1970 + start_month // 12:04d}-{start_month % 12 + 1:02d}-01"
+            conn.execute('DELETE FROM alert_history WHERE rule = ? AND date >= ?', (name, start_date))
+            conn.executemany('''
+                INSERT INTO alert_history (rule, date, value) VALUES (?, ?, ?)
+            ''', [
+                (name, f"{1970 + month // 12:04d}-{month % 12 + 1:02d}-01", float(value))
+                for month, value in zip(months[evaluated & active].tolist(), signal[evaluated & active].tolist())
+            ])
+        
+            # Estado actual: activa en el último mes y desde cuándo sin interrupción
+            is_active = bool(active[-1])
+            value = float(signal[-1]) if not np.isnan(signal[-1]) else None
+            fired_since = None
+            if is_active:
+                run_start = len(active) - np.argmin(active[::-1]) if not active.all() else 0
+                if run_start == 0 and row and row[1] and row[2]:
+                    fired_since = row[2]
+                else:
+                    month = int(months[run_start])
+                    fired_since = f"{1970 + month // 12:04d}-{month % 12 + 1:02d}-01"
+        
+            conn.execute('''
+                INSERT OR REPLACE INTO alert_state
+                (rule, metric_name, series_id, active, last_month, value, message, fired_since, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (name, metric_name, series_id, int(is_active), int(months[-1]), value,
+                  format_message(rule, value) if is_active else None, fired_since))
+    
+    def rebuild_alert_rules(self):
+        """
+        Evalúa todas las reglas de alerta sobre la historia completa de sus series
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('DELETE FROM alert_state')
+        conn.execute('DELETE FROM alert_history')
+        
+        for metric_name in {rule['metric'] for rule in ALERT_RULES.values()}:
+            series_id = SERIES_MAPPING.get(metric_name)
+            df = pd.read_sql_query(
+                'SELECT date, value FROM labor_data WHERE series_id = ? ORDER BY date',
+                conn, params=(series_id,)
+            )
+            if not df.empty:
+                self._update_alert_rules(conn, series_id, metric_name, df)
+        
+        conn.commit()
+        conn.close()
+    
+    def get_alert_states(self):
+        """
+        Lee el estado actual de las reglas de alerta
         
         Returns:
-            pd.DataFrame: DataFrame con los datos o DataFrame vacío
+            dict: {regla: fila de alert_state como diccionario}
         """
         try:
             conn = sqlite3.connect(self.db_path)
-            
-            query = '''
-                SELECT date, value, last_updated 
-                FROM labor_data 
-                WHERE series_id = ? 
-                ORDER BY date
-            '''
-            
-            df = pd.read_sql_query(query, conn, params=(series_id,))
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute('SELECT * FROM alert_state').fetchall()
             conn.close()
-            
-            if not df.empty:
-                df['date'] = pd.to_datetime(df['date'])
-                logging.info(f"Cargados {len(df)} registros desde caché para {series_id}")
-                
-            return df
-            
         except Exception as e:
-            logging.error(f"Error cargando desde caché {series_id}: {e}")
-            return pd.DataFrame()
+            logging.error(f"Error leyendo estado de alertas: {e}")
+            return {}
+        return {row['rule']: dict(row) for row in rows}
     
-    def is_cache_fresh(self, series_id, hours=24):
+    def get_alert_history(self):
         """
-        Verifica si el caché está actualizado
-        
-        Args:
-            series_id (str): ID de la serie
-            hours (int): Horas de validez del caché
+        Lee los meses en que cada regla de alerta estuvo activa
         
         Returns:
-            bool: True si el caché está fresco
+            dict: {regla: MonthlySeries con el valor evaluado en cada mes activo}
         """
         try:
             conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT MAX(last_updated) 
-                FROM labor_data 
-                WHERE series_id = ?
-            ''', (series_id,))
-            
-            result = cursor.fetchone()
+            rows = conn.execute('SELECT rule, date, value FROM alert_history ORDER BY rule, date').fetchall()
             conn.close()
-            
-            if result[0]:
-                last_updated = datetime.strptime(result[0], '%Y-%m-%d %H:%M:%S')
+        except Exception as e:
+            logging.error(f"Error leyendo historial de alertas: {e}")
+            return {}
+        
+        by_rule = {}
+        for rule, date, value in rows:
+            by_rule.setdefault(rule, []).append((date, value))
+        return {
+            rule: MonthlySeries.from_dates(*zip(*entries))
+            for rule, entries in by_rule.items()
+        }
+    
+    def _update_recession_signals(self, conn, series_id, metric_name, df):
+        """
+        Actualiza las señales de recesión que dependen de la métrica dentro de la transacción abierta
+        
+        Si los meses ya procesados no cambiaron, la señal continúa desde su estado
+        persistido y solo se procesan los meses nuevos (O(1) por mes). Ante revisiones
+        de datos ya procesados se recalcula la señal sobre toda la serie recibida; los
+        meses anteriores a su inicio se conservan.
+        
+        Args:
+            conn (sqlite3.Connection): Conexión con la transacción en curso
+            series_id (str): ID de la serie
+            metric_name (str): Nombre de la métrica (None para series sin métrica asociada)
+            df (pd.DataFrame): DataFrame completo con los datos
+        """
+        signals = {name: cfg for name, cfg in RECESSION_SIGNALS.items() if cfg['metric'] == metric_name}
+        if not signals:
+            return
+        
+        series = MonthlySeries.from_frame(df)
+        months, values = series.months.tolist(), series.values.tolist()
+        
+        for name, cfg in signals.items():
+            signal = create_signal(cfg)
+            start = 0
+        
+            row = conn.execute(
+                'SELECT last_month, inputs, state FROM recession_signal_state WHERE signal = ?', (name,)
+            ).fetchone()
+            if row:
+                last_month, inputs = row[0], json.loads(row[1])
+                end = int(np.searchsorted(series.months, last_month, side='right'))
+                seen = [[month, value] for month, value in
+                        zip(months[max(end - len(inputs), 0):end], values[max(end - len(inputs), 0):end])]
+                # El estado solo es válido si los meses que lo formaron no fueron revisados
+                if inputs and seen == inputs:
+                    signal.set_state(json.loads(row[2]))
+                    start = end
+        
+            if start == 0 and months:
+                # Solo se reemplazan los meses que cubre la serie; la historia anterior se conserva
+                first_date = f"{1970 + months[0] // 12:04d}-{months[0] % 12 + 1:02d}-01"
+                conn.execute('DELETE FROM recession_signals WHERE signal = ? AND date >= ?', (name, first_date))
+        
+            rows = []
+            previous_month = months[start - 1] if start else None
+            for month, value in zip(months[start:], values[start:]):
+                # Un hueco en la serie reinicia las ventanas móviles
+                if previous_month is not None and month != previous_month + 1:
+                    signal = create_signal(cfg)
+                previous_month = month
+        
+                signal_value = signal.update(value)
+                if signal_value is not None:
+                    date = f"{1970 + month // 12:04d}-{month % 12 + 1:02d}-01"
+                    rows.append((name, date, signal_value, int(is_triggered(cfg, signal_value))))
+        
+            conn.executemany('''
+                INSERT OR REPLACE INTO recession_signals (signal, date, value, triggered)
+                VALUES (?, ?, ?, ?)
+            ''', rows)
+        
+            if not months:
+                conn.execute('DELETE FROM recession_signal_state WHERE signal = ?', (name,))
+                continue
+        
+            # Se guardan los meses que determinan el estado para detectar revisiones
+            lookback = signal.lookback
+            inputs = [[month, value] for month, value in zip(months[-lookback:], values[-lookback:])]
+            conn.execute('''
+                INSERT OR REPLACE INTO recession_signal_state
+                (signal, series_id, last_month, inputs, state, updated_at)
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (name, series_id, months[-1], json.dumps(inputs), json.dumps(signal.get_state())))
+        
+            mode = 'incremental' if start else 'completo'
+            logging.info(f"Señal {name}: {len(rows)} meses procesados (cálculo {mode})")
+    
+    def rebuild_recession_signals(self):
+        """
+        Recalcula desde cero la historia de todas las señales de recesión
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('DELETE FROM recession_signal_state')
+        
+        for metric_name in {cfg['metric'] for cfg in RECESSION_SIGNALS.values()}:
+            series_id = SERIES_MAPPING.get(metric_name)
+            df = pd.read_sql_query(
+                'SELECT date, value FROM labor_data WHERE series_id = ? ORDER BY date',
+                conn, params=(series_id,)
+            )
+            if not df.empty:
+                self._update_recession_signals(conn, series_id, metric_name, df)
+        
+        conn.commit()
+        conn.close()
+    
+    def get_recession_signals(self):
+        """
+        Lee el historial precalculado de las señales de recesión
+        
+        Returns:
+            dict: {señal: {'series': MonthlySeries, 'triggered': np.ndarray de bool}}
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            rows = conn.execute(
+                'SELECT signal, date, value, triggered FROM recession_signals ORDER BY signal, date'
+            ).fetchall()
+            conn.close()
+        except Exception as e:
+            logging.error(f"Error leyendo señales de recesión: {e}")
+            return {}
+        
+        by_signal = {}
+        for signal, date, value, triggered in rows:
+            by_signal.setdefault(signal, []).append((date, value, triggered))
+        
+        signals = {}
+        for signal, entries in by_signal.items():
+            dates, values, triggered = zip(*entries)
+            signals[signal] = {
+                'series': MonthlySeries.from_dates(dates, values),
+                'triggered': np.array(triggered, dtype=bool)
+            }
+        return signals
+    
+    def update_decompositions(self, series_ids=None, max_workers=None):
+        """
+        Recalcula la descomposición estacional de las series cuya entrada cambió
+        
+        Args:
+            series_ids (list): Series a descomponer (por defecto las de SEASONAL_DECOMPOSITION_CONFIG)
+            max_workers (int): Procesos del pool (por defecto los de la configuración)
+        
+        Returns:
+            dict: computed, skipped, seconds y series_per_second
+        """
+        config = SEASONAL_DECOMPOSITION_CONFIG
+        conn = sqlite3.connect(self.db_path)
+        
+        if series_ids is None:
+            series_ids = config['series'] or [
+                row[0] for row in conn.execute('SELECT DISTINCT series_id FROM labor_data')
+            ]
+        stored_hashes = dict(conn.execute('SELECT series_id, input_hash FROM decomposition_state'))
+        
+        # Solo se envían al pool las series cuya entrada (fechas, valores y modo) cambió
+        tasks, hashes, skipped = [], {}, 0
+        for series_id in series_ids:
+            series = self.load_series(series_id)
+            if len(series) < config['min_years'] * 12:
+                continue
+        
+            multiplicative = series_id in config['multiplicative_series'] and bool(np.all(series.values > 0))
+            mode = 'multiplicative' if multiplicative else 'additive'
+            digest = input_hash(series.months, series.values, mode)
+            if stored_hashes.get(series_id) == digest:
+                skipped += 1
+                continue
+        
+            hashes[series_id] = (digest, mode)
+            tasks.append((series_id, series.months, series.values, mode))
+        
+        results, seconds = decompose_batch(
+            tasks,
+            max_workers=max_workers or config['max_workers'],
+            min_parallel=config['min_parallel_series']
+        )
+        
+        try:
+            for series_id, months, components in results:
+                dates = [f"{1970 + month // 12:04d}-{month % 12 + 1:02d}-01" for month in months.tolist()]
+                conn.execute('DELETE FROM derived_series WHERE series_id = ?', (series_id,))
+                for component, values in components.items():
+                    conn.executemany('''
+                        INSERT INTO derived_series (series_id, component, date, value)
+                        VALUES (?, ?, ?, ?)
+                    ''', [(series_id, component, date, value) for date, value in zip(dates, values.tolist())])
+        
+                digest, mode = hashes[series_id]
+                conn.execute('''
+                    INSERT OR REPLACE INTO decomposition_state
+                    (series_id, input_hash, mode, obs_count, updated_at)
+                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ''', (series_id, digest, mode, len(months)))
+            conn.commit()
+        except Exception as e:
+            logging.error(f"Error guardando descomposiciones: {e}")
+            conn.rollback()
+            results = []
+        finally:
+            conn.close()
+        
+        series_per_second = len(results) / seconds if seconds > 0 and results else 0.0
+        logging.info(f"Descomposición estacional: {len(results)} series en {seconds:.2f}s "
+                     f"({series_per_second:.1f} series/s), {skipped} sin cambios")
+        return {
+            'computed': len(results),
+            'skipped': skipped,
+            'seconds': seconds,
+            'series_per_second': series_per_second
+        }
+    
+    def load_derived_series(self, series_id, component):
+        """
+        Carga una serie derivada (componente de la descomposición estacional o índice de difusión)
+        
+        Args:
+            series_id (str): ID de la serie original (o DIFFUSION_CONFIG['series_id'])
+            component (str): 'trend', 'seasonal', 'residual', 'adjusted' o el intervalo del índice ('1m', ...)
+        
+        Returns:
+            MonthlySeries: Componente (vacío si la serie no se ha descompuesto)
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            rows = conn.execute('''
+                SELECT date, value
+                FROM derived_series
+                WHERE series_id = ? AND component = ?
+                ORDER BY date
+            ''', (series_id, component)).fetchall()
+            conn.close()
+        except Exception as e:
+            logging.error(f"Error cargando componente {component} de {series_id}: {e}")
+            return MonthlySeries([], [])
+        
+        if not rows:
+            return MonthlySeries([], [])
+        
+        dates, values = zip(*rows)
+        return MonthlySeries.from_dates(dates, values)
+    
+    def _update_diffusion_index(self, conn):
+        """
+        Recalcula el índice de difusión desde el primer mes afectado por las industrias escritas
+        
+        Usa los meses cambiados que registra _write_series en la transacción abierta;
+        si ninguna industria cambió no se recalcula nada.
+        
+        Args:
+            conn (sqlite3.Connection): Conexión con la transacción en curso
+        """
+        industry_ids = list(CES_INDUSTRY_SERIES.values())
+        first_changed = conn.execute(f'''
+            SELECT MIN(first_date) FROM changed_series
+            WHERE series_id IN ({','.join('?' * len(industry_ids))})
+        ''', industry_ids).fetchone()[0]
+        conn.execute('DELETE FROM changed_series')
+        
+        if first_changed is not None:
+            self._compute_diffusion_index(conn, first_changed)
+    
+    def _compute_diffusion_index(self, conn, start_date=None):
+        """
+        Calcula y guarda el índice de difusión de los meses desde `start_date`
+        
+        Solo se leen los meses afectados más el contexto del intervalo más largo.
+        
+        Args:
+            conn (sqlite3.Connection): Conexión con la transacción en curso
+            start_date (str): Primer mes a recalcular ('YYYY-MM-DD'; None = toda la historia)
+        """
+        config = DIFFUSION_CONFIG
+        industry_ids = list(CES_INDUSTRY_SERIES.values())
+        
+        query = f"SELECT series_id, date, value FROM labor_data WHERE series_id IN ({','.join('?' * len(industry_ids))})"
+        params = list(industry_ids)
+        if start_date is None:
+            conn.execute('DELETE FROM derived_series WHERE series_id = ?', (config['series_id'],))
+        else:
+            start_month = month_ordinal(start_date)
+            context_month = start_month - max(config['spans'])
+            query += ' AND date >= ?'
+            params.append(f"{1970 + context_month // 12:04d}-{context_month % 12 + 1:02d}-01")
+            conn.execute('DELETE FROM derived_series WHERE series_id = ? AND date >= ?',
+                         (config['series_id'], start_date))
+        
+        by_series = {}
+        for series_id, date, value in conn.execute(query + ' ORDER BY series_id, date', params):
+            by_series.setdefault(series_id, []).append((date, value))
+        panel = MonthlyPanel({
+            series_id: MonthlySeries.from_dates(*zip(*rows)) for series_id, rows in by_series.items()
+        })
+        if not len(panel):
+            return
+        
+        indexes = diffusion_indexes(panel, config['spans'], config['min_industries'])
+        keep = panel.months >= start_month if start_date is not None else np.ones(len(panel.months), dtype=bool)
+        months = panel.months[keep].tolist()
+        rows = []
+        for span, index in indexes.items():
+            for month, value in zip(months, index[keep].tolist()):
+                if not np.isnan(value):
+                    rows.append((config['series_id'], f"{span}m",
+                                 f"{1970 + month // 12:04d}-{month % 12 + 1:02d}-01", value))
+        conn.executemany('''
+            INSERT OR REPLACE INTO derived_series (series_id, component, date, value)
+            VALUES (?, ?, ?, ?)
+        ''', rows)
+        logging.info(f"Índice de difusión: {len(months)} meses recalculados con {len(panel)} industrias")
+    
+    def rebuild_diffusion_index(self):
+        """
+        Calcula el índice de difusión sobre la historia completa de las industrias
+        """
+        conn = sqlite3.connect(self.db_path)
+        self._compute_diffusion_index(conn)
+        conn.commit()
+        conn.close()
+    
+    def get_diffusion_index(self):
+        """
+        Lee el índice de difusión almacenado para cada intervalo
+        
+        Returns:
+            dict: {intervalo en meses: MonthlySeries} (solo los intervalos con datos)
+        """
+        config = DIFFUSION_CONFIG
+        indexes = {}
+        for span in config['spans']:
+            series = self.load_derived_series(config['series_id'], f"{span}m")
+            if len(series):
+                indexes[span] = series
+        return indexes
+    
+    def update_forecasts(self, series_ids=None, max_workers=None):
+        """
+        Actualiza los modelos y pronósticos de las series
+        
+        Si una serie solo agregó meses nuevos, su modelo persistido se actualiza
+        con esas observaciones sin reestimarse. Las series nuevas, revisadas o con
+        demasiadas actualizaciones incrementales se reestiman en el pool de procesos.
+        
+        Args:
+            series_ids (list): Series a pronosticar (por defecto las de FORECAST_CONFIG)
+            max_workers (int): Procesos del pool (por defecto los de la configuración)
+        
+        Returns:
+            dict: refit, incremental, skipped, seconds y series_per_second
+        """
+        config = FORECAST_CONFIG
+        z = Z_SCORES[config['confidence']]
+        snapshot_id = self.get_snapshot_id()
+        conn = sqlite3.connect(self.db_path)
+        
+        if series_ids is None:
+            series_ids = config['series'] or [
+                row[0] for row in conn.execute('SELECT DISTINCT series_id FROM labor_data')
+            ]
+        stored = {
+            row[0]: row[1:] for row in conn.execute(
+                'SELECT series_id, model, params, last_month, inputs, updates_since_fit FROM forecast_models'
+            )
+        }
+        
+        tasks, updated, inputs_by_series, skipped = [], {}, {}, 0
+        for series_id in series_ids:
+            series = self.load_series(series_id)
+            months, values = contiguous_tail(series.months, series.values)
+            if len(months) < config['min_observations']:
+                continue
+            months, values = months.tolist(), values.tolist()
+            window = config['revision_window']
+            inputs_by_series[series_id] = (months[-1], [[m, v] for m, v in zip(months[-window:], values[-window:])])
+        
+            if series_id in stored:
+                model_name, params, last_month, inputs, updates = stored[series_id]
+                inputs = json.loads(inputs)
+                end = int(np.searchsorted(months, last_month, side='right'))
+                seen = [[m, v] for m, v in zip(months[max(end - len(inputs), 0):end],
+                                               values[max(end - len(inputs), 0):end])]
+                new_values = values[end:]
+                # Solo meses nuevos sobre datos no revisados: actualización incremental
+                if seen == inputs and updates + len(new_values) < config['refit_every']:
+                    if not new_values:
+                        skipped += 1
+                        continue
+                    model = MODEL_TYPES[model_name].from_dict(json.loads(params))
+                    for value in new_values:
+                        model.update(value)
+                    updated[series_id] = (model, updates + len(new_values))
+                    continue
+        
+            tasks.append((series_id, np.array(values), config['models'], config['ar_order']))
+        
+        results, seconds = fit_batch(
+            tasks,
+            max_workers=max_workers or config['max_workers'],
+            min_parallel=config['min_parallel_series']
+        )
+        incremental = len(updated)
+        updated.update({series_id: (model, 0) for series_id, model in results})
+        
+        try:
+            for series_id, (model, updates) in updated.items():
+                last_month, inputs = inputs_by_series[series_id]
+                point, lower, upper = model.forecast(config['horizon'], z)
+                conn.execute('DELETE FROM forecasts WHERE series_id = ?', (series_id,))
+                conn.executemany('''
+                    INSERT INTO forecasts (series_id, date, value, lower, upper)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', [
+                    (series_id, f"{1970 + month // 12:04d}-{month % 12 + 1:02d}-01",
+                     float(point[step]), float(lower[step]), float(upper[step]))
+                    for step, month in enumerate(range(last_month + 1, last_month + 1 + config['horizon']))
+                ])
+                conn.execute('''
+                    INSERT OR REPLACE INTO forecast_models
+                    (series_id, model, params, last_month, inputs, updates_since_fit, snapshot_id, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ''', (series_id, model.name, json.dumps(model.to_dict()), last_month,
+                      json.dumps(inputs), updates, snapshot_id))
+            conn.commit()
+        except Exception as e:
+            logging.error(f"Error guardando pronósticos: {e}")
+            conn.rollback()
+        finally:
+            conn.close()
+        
+        series_per_second = len(results) / seconds if seconds > 0 and results else 0.0
+        logging.info(f"Pronósticos: {len(results)} series reestimadas en {seconds:.2f}s "
+                     f"({series_per_second:.1f} series/s), {incremental} actualizadas "
+                     f"incrementalmente, {skipped} sin cambios")
+        return {
+            'refit': len(results),
+            'incremental': incremental,
+            'skipped': skipped,
+            'seconds': seconds,
+            'series_per_second': series_per_second
+        }
+    
+    def get_forecast_version(self):
+        """
+        Versión de los pronósticos guardados, que update_forecasts escribe después de
+        publicar el snapshot (la usa el dashboard como clave de caché)
+        
+        Returns:
+            str: Última actualización y número de modelos ('' si no hay pronósticos)
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            updated_at, models = conn.execute(
+                'SELECT MAX(updated_at), COUNT(*) FROM forecast_models'
+            ).fetchone()
+            conn.close()
+            return f"{updated_at}|{models}" if models else ''
+        except Exception as e:
+            logging.error(f"Error obteniendo versión de pronósticos: {e}")
+            return ''
+    
+    def get_forecasts(self):
+        """
+        Lee los pronósticos almacenados
+        
+        Returns:
+            dict: {series_id: {'series': MonthlySeries, 'lower': np.ndarray, 'upper': np.ndarray, 'model': str}}
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            rows = conn.execute('''
+                SELECT f.series_id, f.date, f.value, f.lower, f.upper, m.model
+                FROM forecasts f JOIN forecast_models m ON m.series_id = f.series_id
+                ORDER BY f.series_id, f.date
+            ''').fetchall()
+            conn.close()
+        except Exception as e:
+            logging.error(f"Error leyendo pronósticos: {e}")
+            return {}
+        
+        by_series = {}
+        for series_id, date, value, lower, upper, model in rows:
+            by_series.setdefault(series_id, []).append((date, value, lower, upper, model))
+        
+        forecasts = {}
+        for series_id, entries in by_series.items():
+            dates, values, lower, upper, models = zip(*entries)
+            forecasts[series_id] = {
+                'series': MonthlySeries.from_dates(dates, values),
+                'lower': np.array(lower),
+                'upper': np.array(upper),
+                'model': models[0]
+            }
+        return forecasts
+    
+    def _detect_anomalies(self, conn, frames):
+        """
+        Evalúa las observaciones nuevas de las series escritas dentro de la transacción abierta
+        
+        Se evalúan los meses posteriores al último evaluado (más los últimos
+        meses, que pueden haber sido revisados); una serie nueva se evalúa completa.
+        
+        Args:
+            conn (sqlite3.Connection): Conexión con la transacción en curso
+            frames (dict): {series_id: DataFrame escrito}
+        """
+        config = ANOMALY_CONFIG
+        last_scored = dict(conn.execute('SELECT series_id, last_month FROM anomaly_state'))
+        
+        series_by_id = {series_id: MonthlySeries.from_frame(df) for series_id, df in frames.items()}
+        panel = MonthlyPanel(series_by_id)
+        if not len(panel):
+            return
+        
+        start_months = {}
+        for series_id in panel.keys:
+            if series_id in last_scored:
+                start_months[series_id] = last_scored[series_id] + 1 - config['rescore_months']
+            else:
+                start_months[series_id] = int(series_by_id[series_id].months[0])
+        
+        flagged = score_panel(panel, start_months, config,
+                              log_keys=SEASONAL_DECOMPOSITION_CONFIG['multiplicative_series'])
+        
+        for series_id, start_month in start_months.items():
+            conn.execute('DELETE FROM anomalies WHERE series_id = ? AND date >= ?',
+                         (series_id, f"{1970 + start_month // 12:04d}-{start_month % 12 + 1:02d}-01"))
+        conn.executemany('''
+            INSERT OR REPLACE INTO anomalies (series_id, date, value, change, mad_z, seasonal_z)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [
+            (item['key'], f"{1970 + item['month'] // 12:04d}-{item['month'] % 12 + 1:02d}-01",
+             item['value'], item['change'], item['mad_z'], item['seasonal_z'])
+            for item in flagged
+        ])
+        conn.executemany('''
+            INSERT OR REPLACE INTO anomaly_state (series_id, last_month, updated_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+        ''', [(series_id, int(series_by_id[series_id].months[-1])) for series_id in panel.keys])
+        
+        if flagged:
+            logging.info(f"Anomalías: {len(flagged)} observaciones marcadas en {len(panel)} series evaluadas")
+    
+    def get_anomalies(self, series_ids=None):
+        """
+        Lee las observaciones marcadas como anómalas en la ingesta
+        
+        Args:
+            series_ids (list): Series a consultar (por defecto todas)
+        
+        Returns:
+            dict: {series_id: {'series': MonthlySeries, 'change', 'mad_z', 'seasonal_z' (np.ndarray)}}
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            query = 'SELECT series_id, date, value, change, mad_z, seasonal_z FROM anomalies'
+            params = []
+            if series_ids is not None:
+                query += f" WHERE series_id IN ({','.join('?' * len(series_ids))})"
+                params = list(series_ids)
+            rows = conn.execute(query + ' ORDER BY series_id, date', params).fetchall()
+            conn.close()
+        except Exception as e:
+            logging.error(f"Error leyendo anomalías: {e}")
+            return {}
+        
+        by_series = {}
+        for series_id, *entry in rows:
+            by_series.setdefault(series_id, []).append(entry)
+        
+        anomalies = {}
+        for series_id, entries in by_series.items():
+            dates, values, changes, mad_z, seasonal_z = zip(*entries)
+            anomalies[series_id] = {
+                'series': MonthlySeries.from_dates(dates, values),
+                'change': np.array(changes, dtype=np.float64),
+                'mad_z': np.array(mad_z, dtype=np.float64),
+                'seasonal_z': np.array(seasonal_z, dtype=np.float64)
+            }
+        return anomalies
+    
+    def rebuild_anomalies(self):
+        """
+        Evalúa la historia completa de todas las series almacenadas
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('DELETE FROM anomaly_state')
+        series_ids = [row[0] for row in conn.execute('SELECT DISTINCT series_id FROM labor_data')]
+        frames = {
+            series_id: pd.read_sql_query(
+                'SELECT date, value FROM labor_data WHERE series_id = ? ORDER BY date',
+                conn, params=(series_id,)
+            )
+            for series_id in series_ids
+        }
+        if frames:
+            self._detect_anomalies(conn, frames)
+        conn.commit()
+        conn.close()
+    
+    def get_revisions(self, series_id, releases=6):
+        """
+        Lee las revisiones de una serie en sus publicaciones más recientes
+        
+        Args:
+            series_id (str): ID de la serie
+            releases (int): Número de publicaciones recientes con revisiones
+        
+        Returns:
+            pd.DataFrame: date, old_value, new_value, revision y revised_at (vacío si no hay revisiones)
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            df = pd.read_sql_query('''
+                SELECT date, old_value, new_value, new_value - old_value AS revision, revised_at
+                FROM data_revisions
+                WHERE series_id = ? AND revised_at IN (
+                    SELECT DISTINCT revised_at FROM data_revisions
+                    WHERE series_id = ? ORDER BY revised_at DESC LIMIT ?
+                )
+                ORDER BY revised_at, date
+            ''', conn, params=(series_id, series_id, releases))
+            conn.close()
+        except Exception as e:
+            logging.error(f"Error leyendo revisiones de {series_id}: {e}")
+            return pd.DataFrame(columns=['date', 'old_value', 'new_value', 'revision', 'revised_at'])
+        
+        df['date'] = pd.to_datetime(df['date'])
+        return df
+    
+    def save_vintages(self, series_id, df):
+        """
+        Incorpora el historial de vintages publicado por la fuente a los de la serie
+        
+        Las filas consecutivas de un mismo mes con el mismo valor se fusionan, de modo
+        que solo se guarda una fila por cambio de valor. El historial de la fuente
+        reemplaza los vintages locales hasta su última publicación; los registrados en
+        la ingesta después de ella se conservan y cierran el vintage de la fuente.
+        
+        Args:
+            series_id (str): ID de la serie
+            df (pd.DataFrame): date, value, realtime_start y realtime_end (formato de FRED,
+                ambos extremos inclusivos; '9999-12-31' para el valor vigente)
+        
+        Returns:
+            int: Número de vintages guardados
+        """
+        df = df.sort_values(['date', 'realtime_start']).reset_index(drop=True)
+        new_run = (df['date'] != df['date'].shift()) | (df['value'] != df['value'].shift())
+        runs = df.groupby(new_run.cumsum()).agg(
+            date=('date', 'first'),
+            value=('value', 'first'),
+            realtime_start=('realtime_start', 'first'),
+            realtime_end=('realtime_end', 'last')
+        )
+        
+        rows = []
+        for date, value, realtime_start, realtime_end in runs.itertuples(index=False):
+            # FRED publica el último día vigente; valid_to es exclusivo
+            valid_to = None if realtime_end == '9999-12-31' else (
+                pd.Timestamp(realtime_end) + timedelta(days=1)).strftime('%Y-%m-%d')
+            rows.append((series_id, date.strftime('%Y-%m-%d'), float(value), realtime_start, valid_to))
+        
+        last_release = df['realtime_start'].max()
+        dates = sorted({row[1] for row in rows})
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executemany('''
+                DELETE FROM labor_data_vintages
+                WHERE series_id = ? AND date = ? AND valid_from <= ?
+            ''', [(series_id, date, last_release) for date in dates])
+            conn.executemany('''
+                INSERT OR REPLACE INTO labor_data_vintages (series_id, date, value, valid_from, valid_to)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+            
+            # Los vintages de la ingesta posteriores a la última publicación siguen vigentes:
+            # el valor de la fuente deja de estarlo cuando empieza el primero de ellos
+            conn.execute('''
+                UPDATE labor_data_vintages SET valid_to = (
+                    SELECT MIN(l.valid_from) FROM labor_data_vintages l
+                    WHERE l.series_id = labor_data_vintages.series_id
+                      AND l.date = labor_data_vintages.date AND l.valid_from > ?
+                )
+                WHERE series_id = ? AND valid_from <= ? AND EXISTS (
+                    SELECT 1 FROM labor_data_vintages l
+                    WHERE l.series_id = labor_data_vintages.series_id
+                      AND l.date = labor_data_vintages.date AND l.valid_from > ?
+                      AND (labor_data_vintages.valid_to IS NULL OR labor_data_vintages.valid_to > l.valid_from)
+                )
+            ''', (last_release, series_id, last_release, last_release))
+            conn.commit()
+        finally:
+            conn.close()
+        
+        logging.info(f"Vintages guardados: {series_id} ({len(rows)} valores de {len(df)} observaciones)")
+        return len(rows)
+    
+    def import_fred_vintages(self, series_ids=None):
+        """
+        Importa el historial de publicaciones en tiempo real de FRED (ALFRED)
+        
+        Args:
+            series_ids (list): Series a importar (por defecto las guardadas desde FRED)
+        
+        Returns:
+            dict: {series_id: vintages guardados}
+        """
+        if series_ids is None:
+            conn = sqlite3.connect(self.db_path)
+            series_ids = [row[0] for row in conn.execute(
+                "SELECT series_id FROM series_metadata WHERE source = 'FRED'"
+            )]
+            conn.close()
+        
+        imported = {}
+        for series_id in series_ids:
+            df = self.get_fred_data(series_id, vintages=True)
+            if not df.empty:
+                imported[series_id] = self.save_vintages(series_id, df)
+            time.sleep(0.5)  # Rate limiting
+        return imported
+    
+    def rebuild_vintages(self):
+        """
+        Reconstruye los vintages desde los valores vigentes y las revisiones registradas
+        
+        revised_at y revision_date usan la hora local del proceso (datetime.now());
+        created_at (CURRENT_TIMESTAMP de SQLite, en UTC) se convierte a la misma hora.
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('DELETE FROM labor_data_vintages')
+        
+        # Valores anteriores: vigentes desde la revisión previa (o la carga) hasta su revisión
+        conn.execute('''
+            INSERT OR REPLACE INTO labor_data_vintages (series_id, date, value, valid_from, valid_to)
+            SELECT r.series_id, r.date, r.old_value,
+                   COALESCE(LAG(r.revised_at) OVER w, datetime(d.created_at, 'localtime')), r.revised_at
+            FROM data_revisions r
+            JOIN labor_data d ON d.series_id = r.series_id AND d.date = r.date
+            WINDOW w AS (PARTITION BY r.series_id, r.date ORDER BY r.revised_at)
+        ''')
+        conn.execute('''
+            INSERT OR REPLACE INTO labor_data_vintages (series_id, date, value, valid_from)
+            SELECT series_id, date, value, COALESCE(revision_date, datetime(created_at, 'localtime'))
+            FROM labor_data
+        ''')
+        conn.commit()
+        conn.close()
+    
+    def get_vintage_range(self):
+        """
+        Primera y última fecha de publicación registradas en los vintages
+        
+        Returns:
+            tuple: (datetime, datetime) o None si no hay vintages
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            first, last = conn.execute(
+                'SELECT MIN(valid_from), MAX(valid_from) FROM labor_data_vintages'
+            ).fetchone()
+            conn.close()
+        except Exception as e:
+            logging.error(f"Error leyendo rango de vintages: {e}")
+            return None
+        if first is None:
+            return None
+        return pd.Timestamp(first).to_pydatetime(), pd.Timestamp(last).to_pydatetime()
+    
+    def get_series_summary(self, metric_names=None):
+        """
+        Lee el resumen precalculado de KPIs (una consulta pequeña e indexada)
+        
+        Args:
+            metric_names (list): Métricas a consultar (por defecto todas las que tienen métrica)
+        
+        Returns:
+            dict: {metric_name: fila del resumen como diccionario}
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            if metric_names is None:
+                rows = conn.execute(
+                    'SELECT * FROM series_summary WHERE metric_name IS NOT NULL'
+                ).fetchall()
+            else:
+                placeholders = ','.join('?' * len(metric_names))
+                rows = conn.execute(
+                    f'SELECT * FROM series_summary WHERE metric_name IN ({placeholders})',
+                    list(metric_names)
+                ).fetchall()
+            conn.close()
+        except Exception as e:
+            logging.error(f"Error leyendo resumen de series: {e}")
+            return {}
+        
+        summary = {}
+        for row in rows:
+            entry = dict(row)
+            entry['latest_date'] = pd.Timestamp(entry['latest_date'])
+            entry['previous_date'] = pd.Timestamp(entry['previous_date'])
+            summary[entry['metric_name']] = entry
+        return summary
+    
+    def _bump_snapshot(self, conn, published_at=None):
+        """
+        Publica un nuevo ID de snapshot dentro de la transacción abierta
+        
+        Args:
+            conn (sqlite3.Connection): Conexión con la transacción en curso
+            published_at (datetime): Momento de la publicación; debe coincidir con el
+                revised_at de los vintages escritos para que el snapshot pueda leerse as-of
+        
+        Returns:
+            str: Nuevo ID de snapshot
+        """
+        snapshot_id = (published_at or datetime.now()).strftime('%Y%m%d%H%M%S%f')
+        conn.execute('''
+            INSERT OR REPLACE INTO system_config (key, value, description, last_updated)
+            VALUES ('snapshot_id', ?, 'Versión de los datos publicados', CURRENT_TIMESTAMP)
+        ''', (snapshot_id,))
+        return snapshot_id
+    
+    def get_snapshot_id(self):
+        """
+        Obtiene el ID del snapshot de datos publicado actualmente
+        
+        Returns:
+            str: ID del snapshot ('' si la base de datos nunca se ha poblado)
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute("SELECT value FROM system_config WHERE key = 'snapshot_id'")
+            result = cursor.fetchone()
+            conn.close()
+            return result[0] if result else ''
+        except Exception as e:
+            logging.error(f"Error obteniendo snapshot actual: {e}")
+            return ''
+    
+    def save_to_cache(self, series_id, df, source='FRED'):
+        """
+        Guarda datos en la base de datos SQLite permanente
+        
+        Args:
+            series_id (str): ID de la serie
+            df (pd.DataFrame): DataFrame con los datos
+            source (str): Fuente de los datos (FRED, BLS, SAMPLE)
+        """
+        start_time = time.time()
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            published_at = datetime.now()
+            records_affected = self._write_series(
+                conn, series_id, df, source, published_at.strftime('%Y-%m-%d %H:%M:%S')
+            )
+            self._detect_anomalies(conn, {series_id: df})
+            self._update_diffusion_index(conn)
+            self._bump_snapshot(conn, published_at)
+            conn.commit()
+            
+            logging.info(f"Datos guardados permanentemente: {series_id} ({records_affected} registros) desde {source}")
+            
+        except Exception as e:
+            conn.rollback()
+            self._log_save_error(series_id, source, e, start_time)
+        finally:
+            conn.close()
+    
+    def save_snapshot(self, fetched_data):
+        """
+        Guarda varias series en una única transacción y publica un nuevo snapshot.
+        Los lectores ven el snapshot anterior completo hasta el commit.
+        
+        Args:
+            fetched_data (dict): {series_id: (DataFrame, fuente)}
+        
+        Returns:
+            str: ID del nuevo snapshot o None si no se guardó nada
+        """
+        if not fetched_data:
+            return None
+        
+        start_time = time.time()
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            total_records = 0
+            published_at = datetime.now()  # Una publicación para todo el snapshot
+            revised_at = published_at.strftime('%Y-%m-%d %H:%M:%S')
+            for series_id, (df, source) in fetched_data.items():
+                total_records += self._write_series(conn, series_id, df, source, revised_at)
+            
+            # Evaluar las observaciones nuevas de todas las series del snapshot a la vez
+            self._detect_anomalies(conn, {series_id: df for series_id, (df, _) in fetched_data.items()})
+            
+            # Índice de difusión solo desde el primer mes afectado de las industrias
+            self._update_diffusion_index(conn)
+            
+            snapshot_id = self._bump_snapshot(conn, published_at)
+            conn.execute('''
+                UPDATE system_config SET value = ?, last_updated = CURRENT_TIMESTAMP
+                WHERE key = 'last_full_refresh'
+            ''', (datetime.now().strftime('%Y-%m-%d %H:%M:%S'),))
+            conn.commit()
+            
+            logging.info(f"Snapshot {snapshot_id} publicado: {len(fetched_data)} series ({total_records} registros)")
+            return snapshot_id
+            
+        except Exception as e:
+            # Descartar las escrituras a medias (vintages, tablas temporales) antes de registrar el error
+            conn.rollback()
+            self._log_save_error('snapshot', 'API', e, start_time)
+            return None
+        finally:
+            conn.close()
+    
+    def _log_save_error(self, series_id, source, error, start_time):
+        """
+        Registra un error de guardado en el log de actualizaciones
+        """
+        logging.error(f"Error guardando datos {series_id}: {error}")
+        
+        try:
+            conn = sqlite3.connect(self.db_path)
+            execution_time_ms = int((time.time() - start_time) * 1000)
+            conn.execute('''
+                INSERT INTO update_log 
+                (series_id, update_type, records_affected, source, success, error_message, execution_time_ms)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (series_id, 'data_save', 0, source, False, str(error), execution_time_ms))
+            conn.commit()
+            conn.close()
+        except:
+            pass
+    
+    def _save_resolution_levels(self, conn, series_id, df):
+        """
+        Guarda versiones reducidas (LTTB) de la serie dentro de la transacción abierta
+
+        Args:
+            conn (sqlite3.Connection): Conexión con la transacción en curso
+            series_id (str): ID de la serie
+            df (pd.DataFrame): DataFrame completo con los datos
+        """
+        conn.execute('DELETE FROM labor_data_lod WHERE series_id = ?', (series_id,))
+
+        for level, level_df in build_resolution_levels(df).items():
+            conn.executemany('''
+                INSERT OR REPLACE INTO labor_data_lod (series_id, level, date, value)
+                VALUES (?, ?, ?, ?)
+            ''', [
+                (series_id, level, date.strftime('%Y-%m-%d'), float(value))
+                for date, value in zip(level_df['date'], level_df['value'])
+            ])
+
+    def load_resolution_level(self, series_id, max_points):
+        """
+        Carga la mayor versión precalculada de la serie que no supere max_points
+
+        Args:
+            series_id (str): ID de la serie
+            max_points (int): Número máximo de puntos a cargar
+
+        Returns:
+            pd.DataFrame: DataFrame reducido o DataFrame vacío si no hay nivel aplicable
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+
+            cursor.execute('SELECT DISTINCT level FROM labor_data_lod WHERE series_id = ?', (series_id,))
+            level = pick_resolution_level([row[0] for row in cursor.fetchall()], max_points)
+
+            if level is None:
+                conn.close()
+                return pd.DataFrame()
+
+            df = pd.read_sql_query('''
+                SELECT date, value
+                FROM labor_data_lod
+                WHERE series_id = ? AND level = ?
+                ORDER BY date
+            ''', conn, params=(series_id, level))
+            conn.close()
+
+            df['date'] = pd.to_datetime(df['date'])
+            return df
+
+        except Exception as e:
+            logging.error(f"Error cargando nivel de resolución para {series_id}: {e}")
+            return pd.DataFrame()
+
+    def load_from_cache(self, series_id, as_of=None):
+        """
+        Carga datos desde la base de datos local
+        
+        Args:
+            series_id (str): ID de la serie
+            as_of (str | datetime): Fecha de consulta; si se indica, los valores tal
+                como estaban publicados en ese momento (por defecto los vigentes)
+        
+        Returns:
+            pd.DataFrame: DataFrame con los datos o DataFrame vacío
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            
+            if as_of is None:
+                query = '''
+                    SELECT date, value, last_updated 
+                    FROM labor_data 
+                    WHERE series_id = ? 
+                    ORDER BY date
+                '''
+                params = (series_id,)
+            else:
+                query = '''
+                    SELECT date, value, valid_from AS last_updated
+                    FROM labor_data_vintages
+                    WHERE series_id = ? AND valid_from <= ? AND (valid_to IS NULL OR valid_to > ?)
+                    ORDER BY date
+                '''
+                as_of = _as_of_timestamp(as_of)
+                params = (series_id, as_of, as_of)
+            
+            df = pd.read_sql_query(query, conn, params=params)
+            conn.close()
+            
+            if not df.empty:
+                df['date'] = pd.to_datetime(df['date'])
+                logging.info(f"Cargados {len(df)} registros desde caché para {series_id}")
+                
+            return df
+            
+        except Exception as e:
+            logging.error(f"Error cargando desde caché {series_id}: {e}")
+            return pd.DataFrame()
+    
+    def load_series(self, series_id, as_of=None):
+        """
+        Carga una serie desde SQLite en su representación compacta
+        
+        Lee solo fecha y valor con el cursor, sin construir un DataFrame intermedio.
+        Con `as_of` lee los vintages vigentes en esa fecha: el índice por
+        (serie, mes, inicio de vigencia) recorre los pocos valores de cada mes.
+        
+        Args:
+            series_id (str): ID de la serie
+            as_of (str | datetime): Fecha de consulta (por defecto los valores vigentes)
+        
+        Returns:
+            MonthlySeries: Serie mensual (vacía si no hay datos)
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            if as_of is None:
+                rows = conn.execute('''
+                    SELECT date, value
+                    FROM labor_data
+                    WHERE series_id = ? AND value IS NOT NULL
+                    ORDER BY date
+                ''', (series_id,)).fetchall()
+            else:
+                as_of = _as_of_timestamp(as_of)
+                rows = conn.execute('''
+                    SELECT date, value
+                    FROM labor_data_vintages
+                    WHERE series_id = ? AND valid_from <= ? AND (valid_to IS NULL OR valid_to > ?)
+                    ORDER BY date
+                ''', (series_id, as_of, as_of)).fetchall()
+            conn.close()
+        except Exception as e:
+            logging.error(f"Error cargando serie {series_id}: {e}")
+            return MonthlySeries([], [])
+        
+        if not rows:
+            return MonthlySeries([], [])
+        
+        dates, values = zip(*rows)
+        logging.info(f"Cargados {len(rows)} registros desde caché para {series_id}")
+        return MonthlySeries.from_dates(dates, values)
+    
+    def is_cache_fresh(self, series_id, hours=24):
+        """
+        Verifica si el caché está actualizado
+        
+        Args:
+            series_id (str): ID de la serie
+            hours (int): Horas de validez del caché
+        
+        Returns:
+            bool: True si el caché está fresco
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT MAX(last_updated) 
+                FROM labor_data 
+                WHERE series_id = ?
+            ''', (series_id,))
+            
+            result = cursor.fetchone()
+            conn.close()
+            
+            if result[0]:
+                last_updated = datetime.strptime(result[0], '%Y-%m-%d %H:%M:%S')
                 threshold = datetime.now() - timedelta(hours=hours)
                 return last_updated > threshold
                 
@@ -398,6 +2071,34 @@ class LaborMarketDataCollector:
             
         return False
     
+    def get_data_status(self):
+        """
+        Obtiene un resumen rápido de la frescura de los datos almacenados
+        
+        Returns:
+            dict: Series totales y series actualizadas en la ventana de refresco
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT COUNT(DISTINCT series_id) FROM labor_data')
+        total_series = cursor.fetchone()[0]
+        
+        # Verificar si existe al menos una métrica con datos recientes
+        cursor.execute('''
+            SELECT COUNT(DISTINCT series_id) 
+            FROM labor_data 
+            WHERE last_updated > datetime('now', ?)
+        ''', (f"-{DATA_SYSTEM_CONFIG['refresh_threshold_days']} days",))
+        recent_series = cursor.fetchone()[0]
+        conn.close()
+        
+        return {
+            'total_series': total_series,
+            'recent_series': recent_series,
+            'needs_refresh': recent_series < DATA_SYSTEM_CONFIG['min_series_required']
+        }
+    
     def ensure_data_availability(self):
         """
         Asegura que hay datos disponibles en la base de datos.
@@ -407,162 +2108,373 @@ class LaborMarketDataCollector:
             bool: True si hay datos disponibles
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Verificar si existe al menos una métrica con datos recientes
-            cursor.execute('''
-                SELECT COUNT(DISTINCT series_id) 
-                FROM labor_data 
-                WHERE last_updated > datetime('now', '-7 days')
-            ''')
+            status = self.get_data_status()
             
-            recent_series_count = cursor.fetchone()[0]
-            conn.close()
-            
-            # Si tenemos al menos 5 series con datos recientes, consideramos que hay suficientes datos
-            if recent_series_count >= 5:
-                logging.info(f"Datos disponibles: {recent_series_count} series actualizadas")
+            # Si tenemos suficientes series con datos recientes, consideramos que hay suficientes datos
+            if not status['needs_refresh']:
+                logging.info(f"Datos disponibles: {status['recent_series']} series actualizadas")
                 return True
+            elif not self.can_auto_refresh():
+                # Un intento anterior falló: servir los últimos datos sin repetirlo
+                return status['total_series'] > 0
             else:
-                logging.warning(f"Datos insuficientes o desactualizados: {recent_series_count} series")
-                # Intentar actualizar automáticamente
-                self.refresh_all_data()
+                logging.warning(f"Datos insuficientes o desactualizados: {status['recent_series']} series")
+                # Intentar actualizar automáticamente; si ya hay datos y otra sesión o
+                # proceso está actualizando, seguir sirviendo los datos actuales
+                self.refresh_all_data(
+                    wait=status['total_series'] == 0,
+                    still_needed=lambda: self.get_data_status()['needs_refresh']
+                )
                 return True
                 
         except Exception as e:
             logging.error(f"Error verificando disponibilidad de datos: {e}")
-            # Intentar poblar la base de datos por primera vez
-            self.refresh_all_data()
-            return True
+            return False
+    
+    def can_auto_refresh(self):
+        """
+        Indica si se permite una actualización automática (fuera de la ventana de backoff)
+        """
+        return not self.backoff.is_blocked('source:FRED')
+    
+    def get_backoff_status(self):
+        """
+        Obtiene el estado de backoff por fuente y por serie para el panel de estado
+        
+        Returns:
+            list: Claves con fallos registrados y tiempo restante hasta el próximo intento
+        """
+        return self.backoff.get_state()
     
-    def refresh_all_data(self):
+    def refresh_all_data(self, progress_callback=None, wait=True, still_needed=None):
         """
-        Actualiza todos los datos desde las APIs y los almacena en SQLite
+        Actualiza todos los datos desde las APIs y los almacena en SQLite.
+        Solo una actualización se ejecuta a la vez entre sesiones y procesos.
+        
+        Args:
+            progress_callback (callable): Función opcional llamada como
+                progress_callback(series_id, estado, completadas, total) por cada serie
+            wait (bool): Si otra actualización está en curso, esperar a que termine
+                (False para retornar inmediatamente y servir los datos actuales)
+            still_needed (callable): Verificación opcional antes de ejecutar la actualización
+        
+        Returns:
+            str: ID del snapshot publicado o None si no se obtuvieron datos
         """
         logging.info("Actualizando todos los datos desde APIs...")
         
         # Verificar que las APIs estén configuradas
         if not self.fred_api_key or self.fred_api_key == 'tu_api_key_aqui_requerida':
             error_msg = "API key de FRED es requerida para obtener datos reales. Configura FRED_API_KEY en el archivo .env"
-            logging.error(error_msg)
+            # Registrar el fallo una sola vez por ventana de backoff
+            if not self.backoff.is_blocked('source:FRED'):
+                logging.error(error_msg)
+                self.backoff.record_failure('source:FRED', error_msg)
             raise ValueError(error_msg)
         
-        # Obtener datos reales de APIs
-        self._fetch_all_api_data()
+        # Obtener datos reales de APIs (una sola actualización en curso a la vez)
+        return run_single_flight(
+            self.db_path,
+            'full_refresh',
+            lambda: self._fetch_all_api_data(progress_callback),
+            wait=wait,
+            still_needed=still_needed
+        )
     
     
-    def _fetch_all_api_data(self):
+    def _fetch_all_api_data(self, progress_callback=None):
         """
-        Obtiene datos reales de las APIs y los almacena
+        Obtiene datos reales de las APIs y los almacena.
+        Todas las series se descargan primero en memoria y se publican juntas
+        en una sola transacción, de modo que los lectores nunca ven un estado mixto.
         """
-        all_data = {}
+        fetched_data = {}
         
         # Series de FRED
         fred_series = ['unemployment_rate', 'job_openings', 'quits_rate', 
                       'layoffs_rate', 'labor_force_participation']
         
+        # Series de BLS
+        bls_series = ['payroll_employment', 'avg_hourly_earnings', 'employment_cost_index']
+        bls_series_ids = [SERIES_MAPPING[metric] for metric in bls_series]
+        sector_series_ids = list(SECTOR_EMPLOYMENT_SERIES.values())
+        
+        # Industrias CES en lotes del tamaño máximo que admite la API
+        industry_series_ids = list(CES_INDUSTRY_SERIES.values())
+        batch_size = BLS_API_CONFIG['max_series_per_request']
+        industry_batches = [
+            industry_series_ids[i:i + batch_size]
+            for i in range(0, len(industry_series_ids), batch_size)
+        ]
+        
+        total = len(fred_series) + len(bls_series_ids) + len(sector_series_ids) + len(industry_series_ids)
+        completed = 0
+        
+        def report(series_id, status):
+            if progress_callback:
+                progress_callback(series_id, status, completed, total)
+        
         for metric in fred_series:
             series_id = SERIES_MAPPING[metric]
+            report(series_id, 'running')
+            
+            if self.backoff.is_blocked('source:FRED') or self.backoff.is_blocked(f'series:{series_id}'):
+                completed += 1
+                report(series_id, 'skipped')
+                continue
             
             # Obtener desde API
             df = self.get_fred_data(series_id)
+            completed += 1
             if not df.empty:
-                self.save_to_cache(series_id, df, 'FRED')
+                fetched_data[series_id] = (df, 'FRED')
+                report(series_id, 'done')
+            else:
+                report(series_id, 'error')
             
             # Rate limiting
             time.sleep(0.5)
         
-        # Series de BLS
-        bls_series = ['payroll_employment', 'avg_hourly_earnings', 'employment_cost_index']
-        bls_series_ids = [SERIES_MAPPING[metric] for metric in bls_series]
+        # Series de BLS (una petición por lote y tramo de años), empleo por sector y por industria;
+        # las nóminas y los sectores se piden con historia completa, las industrias solo recientes
+        history_start = BLS_API_CONFIG['history_start_year']
+        bls_batches = [(bls_series_ids, history_start), (sector_series_ids, history_start)]
+        bls_batches += [(batch, None) for batch in industry_batches]
+        for batch, start_year in bls_batches:
+            source_blocked = self.backoff.is_blocked('source:BLS')
+            skipped = [
+                series_id for series_id in batch
+                if source_blocked or self.backoff.is_blocked(f'series:{series_id}')
+            ]
+            for series_id in skipped:
+                completed += 1
+                report(series_id, 'skipped')
+            
+            batch = [series_id for series_id in batch if series_id not in skipped]
+            if not batch:
+                continue
+            
+            for series_id in batch:
+                report(series_id, 'running')
+            
+            bls_data = self.get_bls_data(batch, start_year)
+            
+            for series_id in batch:
+                completed += 1
+                if series_id in bls_data:
+                    # Usamos el series_id como 'metric' para el cache
+                    fetched_data[series_id] = (bls_data[series_id], 'BLS')
+                    report(series_id, 'done')
+                else:
+                    report(series_id, 'error')
         
-        bls_data = self.get_bls_data(bls_series_ids)
+        # Publicar todas las series de una vez (intercambio atómico del snapshot)
+        snapshot_id = self.save_snapshot(fetched_data)
+        if snapshot_id:
+            self._update_model_stages()
+        return snapshot_id
+    
+    def _update_model_stages(self):
+        """
+        Ejecuta las etapas por serie que dependen del snapshot recién publicado
         
-        for metric in bls_series:
-            series_id = SERIES_MAPPING[metric]
-            if series_id in bls_data:
-                self.save_to_cache(series_id, bls_data[series_id], 'BLS')
-
-        # Series de empleo por sector de BLS
-        sector_series_ids = list(SECTOR_EMPLOYMENT_SERIES.values())
-        sector_data = self.get_bls_data(sector_series_ids)
-
-        for sector_name, series_id in SECTOR_EMPLOYMENT_SERIES.items():
-            if series_id in sector_data:
-                # Usamos el series_id como 'metric' para el cache
-                self.save_to_cache(series_id, sector_data[series_id], 'BLS')
+        Cada etapa es incremental (solo recalcula las series cuya entrada cambió) y un
+        fallo en ella no invalida el snapshot ya publicado.
+        """
+        try:
+            self.update_decompositions()
+        except Exception as e:
+            logging.error(f"Error actualizando descomposiciones: {e}")
+        
+        # Los pronósticos llevan su propia versión (ver get_forecast_version)
+        try:
+            self.update_forecasts()
+        except Exception as e:
+            logging.error(f"Error actualizando pronósticos: {e}")
     
-    def get_all_labor_data(self, force_refresh=False):
+    def get_all_labor_data(self, force_refresh=False, ensure_available=True, as_of=None):
         """
         Obtiene todos los datos del mercado laboral desde SQLite.
         Si no hay datos disponibles o force_refresh=True, actualiza desde APIs.
         
         Args:
             force_refresh (bool): Forzar actualización desde APIs
+            ensure_available (bool): Actualizar de forma síncrona si los datos están
+                desactualizados (el dashboard lo desactiva y actualiza en segundo plano)
+            as_of (str | datetime): Fecha de consulta (por defecto los valores vigentes)
         
         Returns:
             dict: Diccionario con todos los DataFrames
         """
         # Asegurar que hay datos disponibles en la base de datos
-        if force_refresh or not self.ensure_data_availability():
+        if force_refresh:
             self.refresh_all_data()
+        elif ensure_available:
+            self.ensure_data_availability()
         
         # Cargar todos los datos desde SQLite
+        loaders, derived = self.get_labor_data_loaders(as_of)
+        all_series = {metric: load() for metric, load in loaders.items()}
+        
+        # Calcular métricas derivadas (p. ej. Ratio Vacantes/Desempleo)
+        for metric, (deps, calculate) in derived.items():
+            if all(dep in all_series for dep in deps):
+                derived_series = calculate(*(all_series[dep] for dep in deps))
+                if len(derived_series):
+                    all_series[metric] = derived_series
+        
+        # Convertir a DataFrames para los consumidores de pandas (scripts y reportes)
         all_data = {}
+        for metric, series in all_series.items():
+            if isinstance(series, MonthlySeries):
+                all_data[metric] = series.to_frame()
+            else:
+                all_data[metric] = {name: nested.to_frame() for name, nested in series.items()}
         
-        # Mapear series ID a nombres de métricas
-        for metric, series_id in SERIES_MAPPING.items():
-            df = self.load_from_cache(series_id)
-            if not df.empty:
-                all_data[metric] = df[['date', 'value']]
-
-        # Cargar datos de empleo por sector
-        sector_employment_data = {}
-        for sector_name, series_id in SECTOR_EMPLOYMENT_SERIES.items():
-            df = self.load_from_cache(series_id)
-            if not df.empty:
-                sector_employment_data[sector_name] = df[['date', 'value']]
+        logging.info(f"Datos cargados desde SQLite: {len(all_data)} métricas")
+        return all_data
+    
+    def get_labor_data_loaders(self, as_of=None, snapshot_id=None):
+        """
+        Construye las funciones de carga por métrica sin leer ninguna observación
+        
+        Solo incluye las series que tienen datos según series_metadata, de modo que
+        el conjunto de claves coincide con el de get_all_labor_data. Con `snapshot_id`
+        las cargas diferidas leen los vintages vigentes en la publicación de ese
+        snapshot, así que una actualización publicada entretanto no se mezcla con él.
+        
+        Args:
+            as_of (str | datetime): Fecha de consulta (por defecto los valores vigentes)
+            snapshot_id (str): Snapshot al que se fijan las lecturas si no hay `as_of`
+        
+        Returns:
+            tuple: (loaders, derived) donde loaders es {métrica: callable que carga la
+                MonthlySeries} y derived es {métrica: (dependencias, función de cálculo)}
+        """
+        if as_of is None:
+            as_of = _snapshot_published_at(snapshot_id)
+        
+        available = self.get_series_bounds()
+        
+        loaders = {
+            metric: partial(self.load_series, series_id, as_of=as_of)
+            for metric, series_id in SERIES_MAPPING.items()
+            if series_id in available
+        }
         
-        if sector_employment_data:
-            all_data['sector_employment'] = sector_employment_data
+        # Datos de empleo por sector (se cargan juntos al primer acceso)
+        sector_series = {
+            sector_name: series_id
+            for sector_name, series_id in SECTOR_EMPLOYMENT_SERIES.items()
+            if series_id in available
+        }
+        if sector_series:
+            loaders['sector_employment'] = partial(self._load_series_group, sector_series, as_of)
         
-        # Calcular métrica derivada: Ratio Vacantes/Desempleo
-        if 'job_openings' in all_data and 'unemployment_rate' in all_data:
-            vacancy_ratio = self.calculate_vacancy_unemployment_ratio(
-                all_data['job_openings'], 
-                all_data['unemployment_rate']
+        derived = {
+            'vacancy_unemployment_ratio': (
+                ('job_openings', 'unemployment_rate'),
+                self.calculate_vacancy_unemployment_ratio
             )
-            if not vacancy_ratio.empty:
-                all_data['vacancy_unemployment_ratio'] = vacancy_ratio
+        }
         
-        logging.info(f"Datos cargados desde SQLite: {len(all_data)} métricas")
-        return all_data
+        return loaders, derived
+    
+    def _load_series_group(self, series_by_name, as_of=None):
+        """
+        Carga un grupo de series anidadas {nombre: series_id}
+        """
+        group = {}
+        for name, series_id in series_by_name.items():
+            series = self.load_series(series_id, as_of)
+            if len(series):
+                group[name] = series
+        return group
     
-    def calculate_vacancy_unemployment_ratio(self, job_openings_df, unemployment_df):
+    def calculate_vacancy_unemployment_ratio(self, job_openings, unemployment):
         """
         Calcula el ratio de vacantes a desempleo
         
         Args:
-            job_openings_df (pd.DataFrame): Datos de vacantes
-            unemployment_df (pd.DataFrame): Datos de desempleo
+            job_openings (MonthlySeries): Datos de vacantes
+            unemployment (MonthlySeries): Datos de desempleo
         
         Returns:
-            pd.DataFrame: DataFrame con el ratio calculado
+            MonthlySeries: Serie con el ratio calculado en los meses comunes
         """
         try:
-            # Merge de los datos por fecha
-            merged = pd.merge(job_openings_df, unemployment_df, on='date', suffixes=('_openings', '_unemployment'))
+            # Alinear ambas series por mes
+            months, openings, unemployment_rate = job_openings.align(unemployment)
             
             # Calcular ratio (vacantes en miles / tasa de desempleo)
-            merged['value'] = (merged['value_openings'] / 1000) / merged['value_unemployment']
-            
-            return merged[['date', 'value']].copy()
+            return MonthlySeries(months, (openings / 1000) / unemployment_rate)
             
         except Exception as e:
             logging.error(f"Error calculando ratio vacantes/desempleo: {e}")
-            return pd.DataFrame()
+            return MonthlySeries([], [])
 
+    def get_series_bounds(self, series_ids=None):
+        """
+        Obtiene el rango de fechas y el número de observaciones por serie desde los metadatos
+        
+        Args:
+            series_ids (list): Series a consultar (por defecto todas las activas)
+        
+        Returns:
+            dict: {series_id: {'min_date', 'max_date', 'obs_count'}} con fechas como pd.Timestamp
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT series_id, min_date, max_date, obs_count
+                FROM series_metadata
+                WHERE active AND obs_count > 0
+            ''')
+            rows = cursor.fetchall()
+            conn.close()
+        except Exception as e:
+            logging.error(f"Error obteniendo rangos de fechas: {e}")
+            return {}
+        
+        wanted = set(series_ids) if series_ids is not None else None
+        return {
+            series_id: {
+                'min_date': pd.Timestamp(min_date),
+                'max_date': pd.Timestamp(max_date),
+                'obs_count': obs_count
+            }
+            for series_id, min_date, max_date, obs_count in rows
+            if wanted is None or series_id in wanted
+        }
+    
+    def get_data_summary(self, series_ids=None):
+        """
+        Resume el rango de fechas y los años disponibles a partir de los metadatos
+        (O(número de series), sin leer las observaciones)
+        
+        Args:
+            series_ids (list): Series a considerar (por defecto todas las activas)
+        
+        Returns:
+            dict: min_date, max_date, available_years y bounds por serie
+        """
+        bounds = self.get_series_bounds(series_ids)
+        if not bounds:
+            return {'min_date': None, 'max_date': None, 'available_years': [], 'series': {}}
+        
+        # Las series son mensuales y contiguas: cada una cubre todos los años de su rango
+        years = set()
+        for info in bounds.values():
+            years.update(range(info['min_date'].year, info['max_date'].year + 1))
+        
+        return {
+            'min_date': min(info['min_date'] for info in bounds.values()),
+            'max_date': max(info['max_date'] for info in bounds.values()),
+            'available_years': sorted(years),
+            'series': bounds
+        }
+    
     def get_database_status(self):
         """
         Obtiene el estado actual de la base de datos
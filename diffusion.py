@@ -0,0 +1,48 @@
+"""
+Índice de difusión del empleo
+Porcentaje de industrias que aumentan su empleo en un intervalo de meses,
+contando la mitad de las que no cambian (definición de BLS). Se calcula para
+todas las industrias y meses a la vez como una reducción sobre la matriz de
+cambios (industrias × meses) del panel alineado.
+"""
+
+import numpy as np
+
+
+def diffusion_index(changes, min_industries):
+    """
+    Índice de difusión de cada mes a partir de los cambios por industria
+
+    Args:
+        changes (np.ndarray): Matriz (industrias × meses) de cambios con NaN donde no hay dato
+        min_industries (int): Industrias con dato necesarias para publicar un mes
+
+    Returns:
+        np.ndarray: Índice (0-100) por mes, NaN donde no hay industrias suficientes
+    """
+    valid = ~np.isnan(changes)
+    count = valid.sum(axis=0)
+    with np.errstate(invalid='ignore'):
+        rising = (changes > 0).sum(axis=0)
+        unchanged = (changes == 0).sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        index = (rising + 0.5 * unchanged) / count * 100
+    return np.where(count >= min_industries, index, np.nan)
+
+
+def diffusion_indexes(panel, spans, min_industries):
+    """
+    Índices de difusión del panel para varios intervalos
+
+    Args:
+        panel (MonthlyPanel): Panel con el empleo de cada industria
+        spans (iterable): Meses sobre los que se mide el cambio (p. ej. 1, 3, 6)
+        min_industries (int): Industrias con dato necesarias para publicar un mes
+
+    Returns:
+        dict: {intervalo: np.ndarray alineado con panel.months}
+    """
+    return {
+        span: diffusion_index(panel.transform('change', span), min_industries)
+        for span in spans
+    }
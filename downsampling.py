@@ -0,0 +1,131 @@
+"""
+Módulo de reducción de puntos (downsampling) para series temporales largas
+Implementa Largest-Triangle-Three-Buckets (LTTB) preservando mínimos y máximos
+"""
+
+import numpy as np
+from config import CHART_RENDER_CONFIG
+
+
+def _to_numeric_x(x):
+    """
+    Convierte el eje X (fechas o números) a un arreglo float64 para el cálculo de áreas
+    """
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Selecciona índices con el algoritmo Largest-Triangle-Three-Buckets
+
+    Args:
+        x (array-like): Eje X ordenado (fechas o números)
+        y (array-like): Valores de la serie
+        n_out (int): Número de puntos deseado
+
+    Returns:
+        np.ndarray: Índices ordenados de los puntos seleccionados
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = _to_numeric_x(x)
+
+    # Límites de los buckets intermedios (el primer y último punto se conservan siempre)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+
+        # Punto promedio del siguiente bucket (o el último punto)
+        if i < n_out - 3:
+            next_start, next_end = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # Área del triángulo formado con el punto anterior y el promedio siguiente
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        areas = np.abs(
+            (x[prev] - avg_x) * (bucket_y - y[prev]) -
+            (x[prev] - bucket_x) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(areas))
+        selected[i + 1] = prev
+
+    # Preservar mínimo y máximo global para no aplanar picos extremos
+    extremes = np.array([np.argmin(y), np.argmax(y)], dtype=np.int64)
+    return np.unique(np.concatenate([selected, extremes]))
+
+
+def points_for_width(width_px=None):
+    """
+    Calcula el número máximo de puntos a enviar según el ancho del gráfico en píxeles
+    """
+    if width_px is None:
+        width_px = CHART_RENDER_CONFIG['default_width_px']
+    return max(3, int(width_px * CHART_RENDER_CONFIG['points_per_pixel']))
+
+
+def downsample_frame(data, max_points):
+    """
+    Reduce un DataFrame con columnas date/value a como máximo ~max_points filas
+
+    Args:
+        data (pd.DataFrame): Serie con columnas 'date' y 'value'
+        max_points (int): Número de puntos objetivo
+
+    Returns:
+        pd.DataFrame: Subconjunto de filas seleccionado por LTTB
+    """
+    if data is None or len(data) <= max_points:
+        return data
+
+    data = data[data['value'].notna()]
+    indices = lttb_indices(data['date'].to_numpy(), data['value'].to_numpy(), max_points)
+    return data.iloc[indices]
+
+
+def build_resolution_levels(data, levels=None):
+    """
+    Precalcula versiones reducidas de una serie para cada nivel de resolución
+
+    Args:
+        data (pd.DataFrame): Serie completa con columnas 'date' y 'value'
+        levels (list): Número de puntos por nivel (por defecto los de CHART_RENDER_CONFIG)
+
+    Returns:
+        dict: {nivel: DataFrame reducido} solo para niveles menores que la serie
+    """
+    if levels is None:
+        levels = CHART_RENDER_CONFIG['resolution_levels']
+
+    result = {}
+    if data is None or data.empty:
+        return result
+
+    data = data.sort_values('date')
+    for level in sorted(levels, reverse=True):
+        if len(data) > level:
+            result[level] = downsample_frame(data, level)[['date', 'value']]
+    return result
+
+
+def pick_resolution_level(available_levels, max_points):
+    """
+    Elige el mayor nivel precalculado que no supere max_points
+    """
+    candidates = [level for level in available_levels if level <= max_points]
+    return max(candidates) if candidates else None
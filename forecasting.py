@@ -0,0 +1,232 @@
+"""
+Pronósticos de corto plazo por serie
+Dos modelos livianos: suavizamiento exponencial de Holt (nivel y tendencia) y
+un AR(p) sobre las diferencias mensuales. Ambos se pueden actualizar con una
+observación nueva en O(1) (Holt) u O(p²) (AR, por mínimos cuadrados recursivos
+sobre sus estadísticos suficientes) sin reestimar desde cero; la reestimación
+completa se hace por lotes en un pool de procesos (ver process_pool.py).
+"""
+
+import numpy as np
+from process_pool import map_in_processes
+
+# Valores z de los intervalos de pronóstico soportados
+Z_SCORES = {0.8: 1.2816, 0.9: 1.6449, 0.95: 1.96}
+
+
+class HoltModel:
+    """
+    Suavizamiento exponencial con tendencia lineal (Holt)
+    """
+
+    name = 'holt'
+
+    # Grilla de parámetros evaluada en una sola pasada vectorizada
+    ALPHAS = np.linspace(0.05, 0.95, 19)
+    BETAS = np.array([0.0, 0.01, 0.05, 0.1, 0.2, 0.3])
+
+    def __init__(self, alpha, beta, level, trend, sse, count):
+        self.alpha = alpha
+        self.beta = beta
+        self.level = level
+        self.trend = trend
+        self.sse = sse
+        self.count = count
+
+    @classmethod
+    def fit(cls, values):
+        """
+        Estima alpha y beta minimizando el error cuadrático de un paso
+        """
+        alpha, beta = (grid.ravel() for grid in np.meshgrid(cls.ALPHAS, cls.BETAS))
+        level = np.full(alpha.shape, values[1])
+        trend = np.full(alpha.shape, values[1] - values[0])
+        sse = np.zeros(alpha.shape)
+
+        for value in values[2:]:
+            forecast = level + trend
+            sse += (value - forecast) ** 2
+            new_level = alpha * value + (1 - alpha) * forecast
+            trend = beta * (new_level - level) + (1 - beta) * trend
+            level = new_level
+
+        best = int(np.argmin(sse))
+        return cls(float(alpha[best]), float(beta[best]), float(level[best]),
+                   float(trend[best]), float(sse[best]), len(values) - 2)
+
+    def update(self, value):
+        """
+        Incorpora una observación nueva con los parámetros actuales (O(1))
+        """
+        forecast = self.level + self.trend
+        self.sse += (value - forecast) ** 2
+        self.count += 1
+        new_level = self.alpha * value + (1 - self.alpha) * forecast
+        self.trend = self.beta * (new_level - self.level) + (1 - self.beta) * self.trend
+        self.level = new_level
+
+    @property
+    def sigma2(self):
+        return self.sse / max(self.count, 1)
+
+    def forecast(self, horizon, z):
+        """
+        Pronóstico puntual e intervalo para los próximos `horizon` meses
+
+        Returns:
+            tuple: (pronóstico, límite inferior, límite superior)
+        """
+        steps = np.arange(1, horizon + 1)
+        point = self.level + self.trend * steps
+        # Varianza del error a h pasos: σ² (1 + Σ_{j<h} (α (1 + j β))²)
+        weights = (self.alpha * (1 + np.arange(1, horizon) * self.beta)) ** 2
+        variance = self.sigma2 * (1 + np.concatenate([[0.0], np.cumsum(weights)]))
+        spread = z * np.sqrt(variance)
+        return point, point - spread, point + spread
+
+    def to_dict(self):
+        return {'alpha': self.alpha, 'beta': self.beta, 'level': self.level,
+                'trend': self.trend, 'sse': self.sse, 'count': self.count}
+
+    @classmethod
+    def from_dict(cls, params):
+        return cls(**params)
+
+
+class ARModel:
+    """
+    AR(p) con constante sobre las diferencias mensuales (ARI(p,1))
+    """
+
+    name = 'ar'
+
+    def __init__(self, order, xtx, xty, yty, count, recent_diffs, last_level):
+        self.order = order
+        self.xtx = np.asarray(xtx, dtype=np.float64)
+        self.xty = np.asarray(xty, dtype=np.float64)
+        self.yty = yty
+        self.count = count
+        self.recent_diffs = list(recent_diffs)   # Últimas p diferencias, la más reciente al final
+        self.last_level = last_level
+
+    @classmethod
+    def fit(cls, values, order=3):
+        """
+        Estima el AR por mínimos cuadrados a partir de sus estadísticos suficientes
+        """
+        diffs = np.diff(values)
+        target = diffs[order:]
+        design = np.column_stack([np.ones(len(target))] +
+                                 [diffs[order - lag:len(diffs) - lag] for lag in range(1, order + 1)])
+        return cls(order, design.T @ design, design.T @ target, float(target @ target),
+                   len(target), diffs[-order:].tolist(), float(values[-1]))
+
+    def _regressors(self):
+        return np.concatenate([[1.0], self.recent_diffs[::-1]])
+
+    def update(self, value):
+        """
+        Incorpora una observación nueva actualizando los estadísticos suficientes (O(p²))
+        """
+        diff = value - self.last_level
+        x = self._regressors()
+        self.xtx += np.outer(x, x)
+        self.xty += x * diff
+        self.yty += diff ** 2
+        self.count += 1
+        self.recent_diffs = self.recent_diffs[1:] + [diff]
+        self.last_level = value
+
+    def coefficients(self):
+        ridge = 1e-9 * np.trace(self.xtx) * np.eye(len(self.xtx))
+        return np.linalg.solve(self.xtx + ridge, self.xty)
+
+    @property
+    def sigma2(self):
+        coef = self.coefficients()
+        sse = self.yty - 2 * coef @ self.xty + coef @ self.xtx @ coef
+        return max(sse, 0.0) / max(self.count - len(coef), 1)
+
+    def forecast(self, horizon, z):
+        """
+        Pronóstico puntual e intervalo para los próximos `horizon` meses
+
+        Returns:
+            tuple: (pronóstico, límite inferior, límite superior)
+        """
+        coef = self.coefficients()
+        constant, phi = coef[0], coef[1:]
+
+        history = list(self.recent_diffs)
+        diffs = []
+        for _ in range(horizon):
+            diff = constant + phi @ np.array(history[::-1][:self.order])
+            diffs.append(diff)
+            history.append(diff)
+        point = self.last_level + np.cumsum(diffs)
+
+        # Pesos psi del AR en diferencias; acumulados dan los del nivel
+        psi = np.zeros(horizon)
+        psi[0] = 1.0
+        for j in range(1, horizon):
+            psi[j] = sum(phi[i] * psi[j - 1 - i] for i in range(min(j, self.order)))
+        level_psi = np.cumsum(psi)
+        variance = self.sigma2 * np.cumsum(level_psi ** 2)
+        spread = z * np.sqrt(variance)
+        return point, point - spread, point + spread
+
+    def to_dict(self):
+        return {'order': self.order, 'xtx': self.xtx.tolist(), 'xty': self.xty.tolist(),
+                'yty': self.yty, 'count': self.count, 'recent_diffs': self.recent_diffs,
+                'last_level': self.last_level}
+
+    @classmethod
+    def from_dict(cls, params):
+        return cls(**params)
+
+
+MODEL_TYPES = {
+    'holt': HoltModel,
+    'ar': ARModel
+}
+
+
+def contiguous_tail(months, values):
+    """
+    Tramo final de la serie sin meses faltantes (los modelos requieren meses consecutivos)
+    """
+    months = np.asarray(months)
+    gaps = np.nonzero(np.diff(months) != 1)[0]
+    start = gaps[-1] + 1 if len(gaps) else 0
+    return months[start:], np.asarray(values)[start:]
+
+
+def fit_series(task):
+    """
+    Estima los modelos de una serie y elige el de menor error de un paso
+    (función de nivel de módulo para el pool de procesos)
+
+    Args:
+        task (tuple): (series_id, valores, modelos candidatos, orden del AR)
+
+    Returns:
+        tuple: (series_id, modelo elegido)
+    """
+    series_id, values, candidates, ar_order = task
+    models = []
+    for name in candidates:
+        if name == 'ar':
+            models.append(ARModel.fit(values, ar_order))
+        else:
+            models.append(MODEL_TYPES[name].fit(values))
+    return series_id, min(models, key=lambda model: model.sigma2)
+
+
+def fit_batch(tasks, max_workers=None, min_parallel=8):
+    """
+    Estima los modelos de varias series, en paralelo si el lote es suficientemente grande
+
+    Returns:
+        tuple: (resultados de fit_series, segundos transcurridos)
+    """
+    return map_in_processes(fit_series, tasks, max_workers, min_parallel)
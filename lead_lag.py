@@ -0,0 +1,141 @@
+"""
+Correlación cruzada adelanto/rezago entre todas las series del panel
+Las correlaciones de todos los pares y todos los rezagos se obtienen con FFT
+sobre el panel mensual alineado: cada suma necesaria para la correlación de
+Pearson en la superposición de cada par (conteo, sumas, sumas de cuadrados y
+productos cruzados) es una correlación cruzada de arreglos completos, así que
+el costo es O(n² · T log T) en lugar de un recorrido por rezago y par. El
+resultado se calcula una vez por snapshot y las consultas solo lo indexan.
+"""
+
+import numpy as np
+
+
+def _xcorr(spectrum_a, spectrum_b, n_fft, max_lag):
+    """
+    Correlación cruzada circular vía FFT: resultado[..., lag] = Σ_t a[t] · b[t + lag]
+
+    Args:
+        spectrum_a, spectrum_b (np.ndarray): Espectros rfft (se difunden entre sí)
+        n_fft (int): Tamaño de la FFT (suficiente para que no haya solapamiento circular)
+        max_lag (int): Rezago máximo en meses
+
+    Returns:
+        np.ndarray: Rezagos -max_lag..max_lag en el último eje
+    """
+    full = np.fft.irfft(np.conj(spectrum_a) * spectrum_b, n=n_fft, axis=-1)
+    return np.concatenate([full[..., n_fft - max_lag:], full[..., :max_lag + 1]], axis=-1)
+
+
+class LeadLagMatrix:
+    """
+    Correlaciones cruzadas de todos los pares de series del panel
+    """
+
+    def __init__(self, panel, transform='change', transform_args=(12,), max_lag=24, min_overlap=36):
+        """
+        Args:
+            panel (MonthlyPanel): Panel alineado del snapshot
+            transform (str): Transformación del panel que se correlaciona (None = niveles)
+            transform_args (tuple): Parámetros de la transformación
+            max_lag (int): Rezago máximo en meses
+            min_overlap (int): Mínimo de meses en común para reportar una correlación
+        """
+        self.keys = list(panel.keys)
+        self._index = {key: row for row, key in enumerate(self.keys)}
+        self.max_lag = max_lag
+        self.lags = np.arange(-max_lag, max_lag + 1)
+
+        values = panel.values if transform is None else panel.transform(transform, *transform_args)
+        valid = ~np.isnan(values)
+        n_series, n_months = values.shape
+
+        # Centrar cada serie en su media mejora la precisión de las sumas de cuadrados
+        counts = valid.sum(axis=1)
+        means = np.divide(np.where(valid, values, 0.0).sum(axis=1), counts,
+                          out=np.zeros(n_series), where=counts > 0)
+        x = np.where(valid, values - means[:, None], 0.0)
+        m = valid.astype(np.float64)
+
+        n_fft = 1 << int(np.ceil(np.log2(max(n_months + max_lag, 1))))
+        spec_x = np.fft.rfft(x, n=n_fft, axis=1)
+        spec_xx = np.fft.rfft(x * x, n=n_fft, axis=1)
+        spec_m = np.fft.rfft(m, n=n_fft, axis=1)
+
+        # corr[i, j, k]: correlación entre la serie i en t y la serie j en t + lags[k]
+        # (un rezago positivo con correlación alta indica que i adelanta a j)
+        self.corr = np.full((n_series, n_series, len(self.lags)), np.nan, dtype=np.float32)
+        self.overlap = np.zeros((n_series, n_series, len(self.lags)), dtype=np.int32)
+        for i in range(n_series):
+            n = np.rint(_xcorr(spec_m[i], spec_m, n_fft, max_lag))
+            sum_i = _xcorr(spec_x[i], spec_m, n_fft, max_lag)
+            sum_j = _xcorr(spec_m[i], spec_x, n_fft, max_lag)
+            sumsq_i = _xcorr(spec_xx[i], spec_m, n_fft, max_lag)
+            sumsq_j = _xcorr(spec_m[i], spec_xx, n_fft, max_lag)
+            cross = _xcorr(spec_x[i], spec_x, n_fft, max_lag)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cov = cross - sum_i * sum_j / n
+                var_i = sumsq_i - sum_i ** 2 / n
+                var_j = sumsq_j - sum_j ** 2 / n
+                corr = cov / np.sqrt(var_i * var_j)
+
+            enough = (n >= min_overlap) & (var_i > 0) & (var_j > 0)
+            self.corr[i] = np.where(enough, np.clip(corr, -1.0, 1.0), np.nan)
+            self.overlap[i] = n
+
+        # Mejor rezago positivo por par (en qué mes adelantado la relación es más fuerte)
+        leads = self.corr[:, :, max_lag + 1:]
+        filled = np.where(np.isnan(leads), -1.0, np.abs(leads))
+        best = np.argmax(filled, axis=2)
+        self.best_lag = best + 1
+        self.best_corr = np.take_along_axis(leads, best[:, :, None], axis=2)[:, :, 0]
+
+        for array in (self.corr, self.overlap, self.best_lag, self.best_corr):
+            array.flags.writeable = False
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def correlation(self, leader, target, lag):
+        """
+        Correlación entre `leader` en t y `target` en t + lag
+        """
+        return float(self.corr[self._index[leader], self._index[target], lag + self.max_lag])
+
+    def matrix_at_lag(self, lag):
+        """
+        Matriz (series × series) de correlaciones a un rezago fijo
+        """
+        return self.corr[:, :, lag + self.max_lag]
+
+    def top_leaders(self, target, n=5, min_abs_corr=0.0):
+        """
+        Series que mejor adelantan a `target`, ordenadas por la correlación absoluta
+        en su mejor rezago positivo
+
+        Args:
+            target (str): Clave de la serie objetivo
+            n (int): Número de series a retornar
+            min_abs_corr (float): Correlación absoluta mínima
+
+        Returns:
+            list: Diccionarios con key, lag (meses de adelanto), corr y overlap
+        """
+        column = self._index[target]
+        corr = self.best_corr[:, column]
+        strength = np.where(np.isnan(corr), -1.0, np.abs(corr))
+        strength[column] = -1.0
+
+        leaders = []
+        for row in np.argsort(-strength, kind='stable')[:n]:
+            if strength[row] < max(min_abs_corr, 0.0) or strength[row] < 0:
+                break
+            lag = int(self.best_lag[row, column])
+            leaders.append({
+                'key': self.keys[row],
+                'lag': lag,
+                'corr': float(corr[row]),
+                'overlap': int(self.overlap[row, column, lag + self.max_lag])
+            })
+        return leaders
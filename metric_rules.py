@@ -0,0 +1,43 @@
+"""
+Reglas de salud por métrica
+Compartidas por el dashboard y por la ingesta (tabla series_summary), de modo que
+la clasificación se calcula una sola vez al guardar los datos. Las alertas se
+evalúan con el motor de reglas de alert_rules.py.
+"""
+
+from config import HEALTH_RULES
+
+HEALTH_EMOJIS = {
+    'good': "🟢",
+    'warning': "🟡",
+    'bad': "🔴",
+    'neutral': "⚪"
+}
+
+
+def classify_health(metric, current_value):
+    """
+    Clasifica el valor actual de una métrica según HEALTH_RULES
+
+    Returns:
+        str: 'good', 'warning', 'bad' o 'neutral' si no hay regla definida
+    """
+    if metric not in HEALTH_RULES:
+        return "neutral"  # Sin regla definida
+
+    rule = HEALTH_RULES[metric]
+
+    if rule['lower_is_better']:
+        if current_value <= rule['good_threshold']:
+            return "good"
+        elif current_value >= rule['bad_threshold']:
+            return "bad"
+        else:
+            return "warning"
+    else:
+        if current_value >= rule['good_threshold']:
+            return "good"
+        elif current_value <= rule['bad_threshold']:
+            return "bad"
+        else:
+            return "warning"
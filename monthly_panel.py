@@ -0,0 +1,206 @@
+"""
+Panel mensual alineado de todas las series
+Alinea cada serie sobre un calendario mensual común como una matriz NumPy
+(series × meses) con máscara de validez, y calcula las transformaciones
+(MoM, YoY, tasas anualizadas, medias móviles, z-scores) para todas las
+series en una sola pasada vectorizada. Un panel corresponde a un snapshot.
+"""
+
+import threading
+import numpy as np
+from collections.abc import Mapping
+from monthly_series import MonthlySeries
+
+
+class MonthlyPanel:
+    """
+    Matriz (series × meses) inmutable con transformaciones memorizadas
+    """
+
+    def __init__(self, series_by_key):
+        """
+        Args:
+            series_by_key (dict): {clave: MonthlySeries}
+        """
+        series_by_key = {key: series for key, series in series_by_key.items() if len(series)}
+        self.keys = list(series_by_key)
+        self._index = {key: row for row, key in enumerate(self.keys)}
+
+        if series_by_key:
+            start = min(int(series.months[0]) for series in series_by_key.values())
+            end = max(int(series.months[-1]) for series in series_by_key.values())
+        else:
+            start, end = 0, -1
+        self.months = np.arange(start, end + 1, dtype=np.int32)
+
+        self.values = np.full((len(self.keys), len(self.months)), np.nan)
+        for row, series in enumerate(series_by_key.values()):
+            self.values[row, series.months - start] = series.values
+        self.mask = ~np.isnan(self.values)
+
+        self.months.flags.writeable = False
+        self.values.flags.writeable = False
+        self.mask.flags.writeable = False
+
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_store(cls, data_dict, keys=None):
+        """
+        Crea el panel a partir del almacén de series; las series anidadas
+        (p. ej. empleo por sector) se incluyen con clave 'grupo/nombre'.
+        Con `keys` solo se leen esas claves del almacén (las ausentes se omiten),
+        así que las demás series no se cargan.
+        """
+        series_by_key = {}
+        for key in (data_dict if keys is None else keys):
+            if key not in data_dict:
+                continue
+            value = data_dict[key]
+            if isinstance(value, Mapping):
+                for name, series in value.items():
+                    series_by_key[f"{key}/{name}"] = series
+            else:
+                series_by_key[key] = value
+        return cls(series_by_key)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def row_index(self, key):
+        """
+        Fila de la serie en las matrices del panel
+        """
+        return self._index[key]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _lagged(self, lag):
+        """
+        Matriz desplazada `lag` meses (NaN donde no hay dato anterior)
+        """
+        lagged = np.full_like(self.values, np.nan)
+        if lag < self.values.shape[1]:
+            lagged[:, lag:] = self.values[:, :-lag]
+        return lagged
+
+    def _rolling_sums(self, matrix, window):
+        """
+        Sumas y conteos de valores válidos en ventanas móviles, vía sumas acumuladas
+        """
+        valid = ~np.isnan(matrix)
+        filled = np.where(valid, matrix, 0.0)
+        n_series, n_months = matrix.shape
+
+        csum = np.zeros((n_series, n_months + 1))
+        ccount = np.zeros((n_series, n_months + 1))
+        np.cumsum(filled, axis=1, out=csum[:, 1:])
+        np.cumsum(valid, axis=1, out=ccount[:, 1:])
+
+        sums = np.full_like(matrix, np.nan)
+        counts = np.zeros_like(matrix)
+        if window <= n_months:
+            sums[:, window - 1:] = csum[:, window:] - csum[:, :-window]
+            counts[:, window - 1:] = ccount[:, window:] - ccount[:, :-window]
+        return sums, counts
+
+    def change(self, lag=1):
+        """
+        Cambio absoluto respecto de `lag` meses antes (1 = MoM, 12 = YoY)
+        """
+        return self.values - self._lagged(lag)
+
+    def pct_change(self, lag=1):
+        """
+        Cambio porcentual respecto de `lag` meses antes
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (self.values / self._lagged(lag) - 1) * 100
+
+    def annualized_rate(self, months=3):
+        """
+        Tasa de crecimiento anualizada de los últimos `months` meses (%)
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return ((self.values / self._lagged(months)) ** (12 / months) - 1) * 100
+
+    def rolling_mean(self, window=12):
+        """
+        Media móvil de `window` meses (NaN si falta algún mes de la ventana)
+        """
+        sums, counts = self._rolling_sums(self.values, window)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(counts == window, sums / window, np.nan)
+
+    def zscore(self, window=None):
+        """
+        Z-score de cada observación frente a la historia completa de su serie,
+        o frente a una ventana móvil de `window` meses si se indica
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if window is None:
+                mean = np.nanmean(self.values, axis=1, keepdims=True)
+                std = np.nanstd(self.values, axis=1, keepdims=True)
+            else:
+                sums, counts = self._rolling_sums(self.values, window)
+                squares, _ = self._rolling_sums(self.values ** 2, window)
+                mean = np.where(counts == window, sums / window, np.nan)
+                std = np.sqrt(np.maximum(squares / window - mean ** 2, 0.0))
+            return np.where(std > 0, (self.values - mean) / std, np.nan)
+
+    def transform(self, name, *args):
+        """
+        Obtiene una transformación de todo el panel, calculándola una sola vez
+
+        Args:
+            name (str): Método de transformación ('change', 'pct_change',
+                'annualized_rate', 'rolling_mean', 'zscore')
+            *args: Parámetros del método (p. ej. el rezago)
+
+        Returns:
+            np.ndarray: Matriz (series × meses) de solo lectura
+        """
+        cache_key = (name, args)
+        with self._lock:
+            if cache_key not in self._cache:
+                matrix = getattr(self, name)(*args)
+                matrix.flags.writeable = False
+                self._cache[cache_key] = matrix
+            return self._cache[cache_key]
+
+    def standard_transforms(self):
+        """
+        Calcula el conjunto estándar de transformaciones para todas las series
+
+        Returns:
+            dict: {nombre: matriz (series × meses)}
+        """
+        return {
+            'mom': self.transform('change', 1),
+            'mom_pct': self.transform('pct_change', 1),
+            'yoy': self.transform('change', 12),
+            'yoy_pct': self.transform('pct_change', 12),
+            'annualized_3m': self.transform('annualized_rate', 3),
+            'annualized_6m': self.transform('annualized_rate', 6),
+            'rolling_mean_12m': self.transform('rolling_mean', 12),
+            'zscore': self.transform('zscore')
+        }
+
+    def series(self, key, name=None, *args):
+        """
+        Extrae una fila del panel (o de una transformación) como MonthlySeries
+
+        Args:
+            key (str): Clave de la serie
+            name (str): Transformación a extraer (None = valores originales)
+            *args: Parámetros de la transformación
+
+        Returns:
+            MonthlySeries: Solo los meses con dato válido
+        """
+        matrix = self.values if name is None else self.transform(name, *args)
+        row = matrix[self.row_index(key)]
+        valid = ~np.isnan(row)
+        return MonthlySeries(self.months[valid], row[valid])
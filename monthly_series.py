@@ -0,0 +1,180 @@
+"""
+Representación compacta de series mensuales
+Cada serie guarda solo dos arreglos NumPy de solo lectura: el ordinal del mes
+(int32, meses desde 1970-01) y el valor (float64). Filtrar por fechas devuelve
+vistas sobre los mismos arreglos; la conversión a pandas se hace únicamente en
+el borde de los gráficos (to_frame).
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def month_ordinal(value):
+    """
+    Convierte una fecha a su ordinal de mes (meses desde enero de 1970)
+    """
+    ts = pd.Timestamp(value)
+    return (ts.year - 1970) * 12 + ts.month - 1
+
+
+def month_ceil_ordinal(value):
+    """
+    Primer ordinal de mes cuyo día 1 es igual o posterior a la fecha
+    """
+    ts = pd.Timestamp(value)
+    ordinal = month_ordinal(ts)
+    return ordinal if ts.day == 1 and ts == ts.normalize() else ordinal + 1
+
+
+def _readonly(array):
+    array.flags.writeable = False
+    return array
+
+
+class MonthlySeries:
+    """
+    Serie mensual inmutable respaldada por arreglos NumPy
+    """
+
+    __slots__ = ('months', 'values')
+
+    def __init__(self, months, values):
+        """
+        Args:
+            months (array-like): Ordinales de mes (ver month_ordinal)
+            values (array-like): Valores de la serie, uno por mes
+        """
+        months = np.array(months, dtype=np.int32)
+        values = np.array(values, dtype=np.float64)
+
+        if len(months) > 1 and np.any(np.diff(months) < 0):
+            order = np.argsort(months, kind='stable')
+            months, values = months[order], values[order]
+
+        self.months = _readonly(months)
+        self.values = _readonly(values)
+
+    @classmethod
+    def _wrap(cls, months, values):
+        """
+        Crea una serie sobre arreglos ya ordenados sin copiarlos (vistas)
+        """
+        series = object.__new__(cls)
+        series.months = months
+        series.values = values
+        return series
+
+    @classmethod
+    def from_dates(cls, dates, values):
+        """
+        Crea una serie a partir de fechas (strings 'YYYY-MM[-DD]', datetime64 o Timestamps)
+        """
+        dates = np.asarray(dates)
+        if dates.dtype.kind in 'OUS':
+            # Los strings de SQLite ('YYYY-MM-DD') se recortan al mes antes de convertir
+            dates = np.array([str(date)[:7] for date in dates], dtype='datetime64[M]')
+        # datetime64[M] se almacena como meses desde 1970-01, el mismo ordinal de month_ordinal
+        return cls(dates.astype('datetime64[M]').astype(np.int64), values)
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Crea una serie a partir de un DataFrame con columnas 'date' y 'value'
+        """
+        if df is None or 'date' not in df:
+            return cls([], [])
+        df = df[df['value'].notna()]
+        return cls.from_dates(pd.to_datetime(df['date']).to_numpy(), df['value'].to_numpy())
+
+    @property
+    def dates(self):
+        """
+        Fechas (primer día de cada mes) como datetime64[ns]
+        """
+        return self.months.astype('datetime64[M]').astype('datetime64[ns]')
+
+    @property
+    def nbytes(self):
+        return self.months.nbytes + self.values.nbytes
+
+    @property
+    def latest_value(self):
+        return float(self.values[-1])
+
+    @property
+    def previous_value(self):
+        return float(self.values[-2]) if len(self.values) > 1 else float(self.values[-1])
+
+    @property
+    def latest_date(self):
+        return pd.Timestamp(self.dates[-1])
+
+    def __len__(self):
+        return len(self.months)
+
+    def __repr__(self):
+        if not len(self):
+            return "MonthlySeries([])"
+        first, last = np.datetime_as_string(self.months[[0, -1]].astype('datetime64[M]'))
+        return f"MonthlySeries({len(self)} meses, {first} a {last})"
+
+    def window(self, start=None, end=None):
+        """
+        Observaciones cuya fecha (día 1 del mes) está dentro de [start, end]
+
+        Returns:
+            MonthlySeries: Vista sobre los mismos arreglos, sin copias
+        """
+        lo = 0 if start is None else np.searchsorted(self.months, month_ceil_ordinal(start), side='left')
+        hi = len(self.months) if end is None else np.searchsorted(self.months, month_ordinal(end), side='right')
+        return MonthlySeries._wrap(self.months[lo:hi], self.values[lo:hi])
+
+    def last_months(self, n):
+        """
+        Observaciones de los últimos n meses respecto del último dato (incluido el mes de corte)
+        """
+        if not len(self):
+            return self
+        lo = np.searchsorted(self.months, self.months[-1] - n, side='left')
+        return MonthlySeries._wrap(self.months[lo:], self.values[lo:])
+
+    def tail(self, n):
+        """
+        Últimas n observaciones (ninguna si n <= 0; [-0:] devolvería la serie completa)
+        """
+        if n <= 0:
+            return MonthlySeries._wrap(self.months[:0], self.values[:0])
+        start = max(len(self.months) - n, 0)
+        return MonthlySeries._wrap(self.months[start:], self.values[start:])
+
+    def in_years(self, years):
+        """
+        Observaciones de los años indicados
+        """
+        mask = np.isin(self.months // 12 + 1970, list(years))
+        return MonthlySeries._wrap(_readonly(self.months[mask]), _readonly(self.values[mask]))
+
+    def take(self, indices):
+        """
+        Observaciones en las posiciones indicadas (ordenadas)
+        """
+        return MonthlySeries._wrap(_readonly(self.months[indices]), _readonly(self.values[indices]))
+
+    def align(self, other):
+        """
+        Alinea dos series sobre los meses que tienen en común
+
+        Returns:
+            tuple: (meses, valores de esta serie, valores de la otra)
+        """
+        months, own_idx, other_idx = np.intersect1d(
+            self.months, other.months, assume_unique=True, return_indices=True
+        )
+        return months, self.values[own_idx], other.values[other_idx]
+
+    def to_frame(self):
+        """
+        Convierte la serie a un DataFrame date/value (solo para dibujar)
+        """
+        return pd.DataFrame({'date': self.dates, 'value': self.values})
@@ -0,0 +1,36 @@
+"""
+Ejecución por lotes en un pool de procesos
+Usado por las etapas de cálculo por serie (descomposición estacional,
+pronósticos) que se ejecutan tras publicar cada snapshot, fuera del renderizado del dashboard.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+def map_in_processes(func, tasks, max_workers=None, min_parallel=8):
+    """
+    Aplica una función a cada tarea, en paralelo si el lote es suficientemente grande
+
+    Args:
+        func (callable): Función de nivel de módulo (debe poder serializarse)
+        tasks (list): Argumento de cada llamada
+        max_workers (int): Procesos del pool (None = número de CPUs)
+        min_parallel (int): Por debajo de este número de tareas se procesa en serie,
+            ya que iniciar el pool cuesta más que el cálculo
+
+    Returns:
+        tuple: (resultados en el orden de las tareas, segundos transcurridos)
+    """
+    started_at = time.perf_counter()
+    workers = max_workers or os.cpu_count() or 1
+
+    if workers == 1 or len(tasks) < min_parallel:
+        results = [func(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(func, tasks, chunksize=chunksize))
+
+    return results, time.perf_counter() - started_at
@@ -0,0 +1,119 @@
+"""
+Señales de recesión calculadas de forma incremental
+Cada señal mantiene solo el estado de su ventana móvil (unos pocos valores),
+de modo que incorporar un mes nuevo cuesta O(1). El estado se persiste junto a
+la serie en SQLite (tabla recession_signal_state) y el historial de la señal en
+la tabla recession_signals; ver LaborMarketDataCollector._update_recession_signals.
+"""
+
+from collections import deque
+
+
+class SahmRule:
+    """
+    Regla de Sahm: promedio de 3 meses de la tasa de desempleo menos el mínimo
+    de ese promedio en los 12 meses anteriores
+    """
+
+    # Meses de datos crudos que determinan el estado (3 + 12 - 1 promedios)
+    lookback = 14
+
+    def __init__(self, config):
+        self.config = config
+        self.recent = deque(maxlen=3)       # Últimas 3 tasas de desempleo
+        self.averages = deque(maxlen=12)    # Promedios de 3 meses de los 12 meses anteriores
+
+    def update(self, value):
+        """
+        Incorpora el siguiente mes y retorna el valor de la señal (None si aún no hay historia)
+        """
+        self.recent.append(value)
+        if len(self.recent) < 3:
+            return None
+
+        average = sum(self.recent) / 3
+        signal = average - min(self.averages) if len(self.averages) == 12 else None
+        self.averages.append(average)
+        return signal
+
+    def get_state(self):
+        return {'recent': list(self.recent), 'averages': list(self.averages)}
+
+    def set_state(self, state):
+        self.recent.extend(state['recent'])
+        self.averages.extend(state['averages'])
+
+
+class AverageChange:
+    """
+    Variación mensual promedio de una serie en los últimos `window` meses
+    (p. ej. nóminas: un promedio negativo indica pérdida neta de empleo)
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.window = config.get('window', 3)
+        self.lookback = self.window + 1
+        self.levels = deque(maxlen=self.window + 1)
+
+    def update(self, value):
+        self.levels.append(value)
+        if len(self.levels) <= self.window:
+            return None
+        return (self.levels[-1] - self.levels[0]) / self.window
+
+    def get_state(self):
+        return {'levels': list(self.levels)}
+
+    def set_state(self, state):
+        self.levels.extend(state['levels'])
+
+
+SIGNAL_TYPES = {
+    'sahm': SahmRule,
+    'average_change': AverageChange
+}
+
+
+def create_signal(config):
+    """
+    Crea el calculador de una señal a partir de su configuración en RECESSION_SIGNALS
+    """
+    return SIGNAL_TYPES[config['type']](config)
+
+
+def is_triggered(config, value):
+    """
+    Indica si el valor de la señal cruza su umbral
+    """
+    if value is None:
+        return False
+    if config['direction'] == 'above':
+        return value >= config['threshold']
+    return value < config['threshold']
+
+
+def trigger_episodes(dates, triggered):
+    """
+    Agrupa los meses activados en episodios continuos
+
+    Args:
+        dates (array-like): Fechas de la señal
+        triggered (array-like): Indicador de activación por mes
+
+    Returns:
+        list: Tuplas (fecha inicial, fecha final) de cada episodio
+    """
+    episodes = []
+    start = None
+    previous = None
+    for date, active in zip(dates, triggered):
+        if active and start is None:
+            start = date
+        elif not active and start is not None:
+            episodes.append((start, previous))
+            start = None
+        previous = date
+    if start is not None:
+        episodes.append((start, previous))
+    return episodes
@@ -0,0 +1,134 @@
+"""
+Descomposición estacional por lotes (estilo X-11)
+Separa cada serie mensual en tendencia, componente estacional y residuo con
+filtros de medias móviles (2×12, estacionales 3×3 y 3×5, Henderson de 13
+términos), implementados con NumPy. Las series se procesan en paralelo en un
+pool de procesos; el estado de cada serie (hash de su entrada) permite
+recalcular solo las series cuya entrada cambió.
+"""
+
+import hashlib
+import numpy as np
+from process_pool import map_in_processes
+
+# Pesos de los filtros de medias móviles
+MA_2X12 = np.array([0.5] + [1.0] * 11 + [0.5]) / 12
+SEASONAL_3X3 = np.array([1, 2, 3, 2, 1]) / 9
+SEASONAL_3X5 = np.array([1, 2, 3, 3, 3, 2, 1]) / 15
+HENDERSON_13 = np.array([-0.01935, -0.02786, 0.0, 0.06549, 0.14736, 0.21434, 0.24006,
+                         0.21434, 0.14736, 0.06549, 0.0, -0.02786, -0.01935])
+
+COMPONENTS = ('trend', 'seasonal', 'residual', 'adjusted')
+
+
+def _moving_average(values, weights):
+    """
+    Media móvil simétrica; en los extremos se renormalizan los pesos disponibles
+    """
+    if len(values) == 0:
+        return values
+    # Tramo central de la convolución completa (válido aunque la serie sea más corta que el filtro)
+    start = (len(weights) - 1) // 2
+    center = slice(start, start + len(values))
+    numerator = np.convolve(values, weights, mode='full')[center]
+    denominator = np.convolve(np.ones_like(values), weights, mode='full')[center]
+    return numerator / denominator
+
+
+def _seasonal_filter(detrended, weights):
+    """
+    Aplica el filtro estacional a cada submuestra del mismo mes calendario
+    """
+    seasonal = np.empty_like(detrended)
+    for month in range(12):
+        seasonal[month::12] = _moving_average(detrended[month::12], weights)
+    return seasonal
+
+
+def _center(seasonal):
+    """
+    Centra los factores estacionales para que sumen cero en cada año
+    """
+    return seasonal - _moving_average(seasonal, MA_2X12)
+
+
+def decompose(values, mode='additive'):
+    """
+    Descompone una serie mensual contigua
+
+    Args:
+        values (np.ndarray): Valores mensuales sin huecos
+        mode (str): 'additive' o 'multiplicative' (requiere valores positivos)
+
+    Returns:
+        dict: Arreglos trend, seasonal, residual y adjusted (en modo multiplicativo
+            seasonal y residual son factores alrededor de 1)
+    """
+    y = np.log(values) if mode == 'multiplicative' else np.asarray(values, dtype=np.float64)
+
+    # Primera pasada: tendencia 2×12 y estacionalidad 3×3
+    trend = _moving_average(y, MA_2X12)
+    seasonal = _center(_seasonal_filter(y - trend, SEASONAL_3X3))
+
+    # Segunda pasada: tendencia Henderson sobre la serie ajustada y estacionalidad 3×5
+    trend = _moving_average(y - seasonal, HENDERSON_13)
+    seasonal = _center(_seasonal_filter(y - trend, SEASONAL_3X5))
+
+    # Tendencia final sobre la serie desestacionalizada
+    adjusted = y - seasonal
+    trend = _moving_average(adjusted, HENDERSON_13)
+    residual = adjusted - trend
+
+    components = {'trend': trend, 'seasonal': seasonal, 'residual': residual, 'adjusted': adjusted}
+    if mode == 'multiplicative':
+        components = {name: np.exp(component) for name, component in components.items()}
+    return components
+
+
+def input_hash(months, values, mode):
+    """
+    Huella de la entrada de una descomposición (para detectar series sin cambios)
+    """
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(months, dtype=np.int32).tobytes())
+    digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    digest.update(mode.encode())
+    return digest.hexdigest()
+
+
+def decompose_series(task):
+    """
+    Descompone una serie (función de nivel de módulo para el pool de procesos)
+
+    Los huecos internos se interpolan linealmente para obtener un calendario
+    contiguo; los componentes solo se retornan para los meses observados.
+
+    Args:
+        task (tuple): (series_id, meses, valores, modo)
+
+    Returns:
+        tuple: (series_id, meses, {componente: valores})
+    """
+    series_id, months, values, mode = task
+    months = np.asarray(months, dtype=np.int32)
+    grid = np.arange(months[0], months[-1] + 1)
+    filled = np.interp(grid, months, values)
+
+    components = decompose(filled, mode)
+    observed = months - months[0]
+    return series_id, months, {name: component[observed] for name, component in components.items()}
+
+
+def decompose_batch(tasks, max_workers=None, min_parallel=8):
+    """
+    Descompone varias series, en paralelo si el lote es suficientemente grande
+
+    Args:
+        tasks (list): Tuplas (series_id, meses, valores, modo)
+        max_workers (int): Procesos del pool (None = número de CPUs)
+        min_parallel (int): Tamaño mínimo del lote para usar el pool
+
+    Returns:
+        tuple: (resultados de decompose_series, segundos transcurridos)
+    """
+    return map_in_processes(decompose_series, tasks, max_workers, min_parallel)
@@ -0,0 +1,96 @@
+"""
+Almacén inmutable de series compartido por todas las sesiones del proceso
+Cada serie es una MonthlySeries respaldada por arreglos NumPy de solo lectura,
+de modo que una única copia del snapshot puede servirse a todas las sesiones sin
+pickling ni copias por sesión; cualquier intento de modificarlas en sitio falla.
+Las series se cargan de forma perezosa: cada una se lee la primera vez que se
+accede a ella y queda memorizada para el resto del snapshot.
+"""
+
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+import pandas as pd
+from monthly_series import MonthlySeries
+
+
+def freeze_series(value):
+    """
+    Convierte una serie cargada (MonthlySeries o DataFrame date/value) a MonthlySeries
+    """
+    if isinstance(value, MonthlySeries):
+        return value
+    return MonthlySeries.from_frame(value)
+
+
+class SeriesStore(Mapping):
+    """
+    Diccionario inmutable y perezoso de series de un snapshot concreto.
+    Ofrece la misma interfaz de lectura que el dict de get_all_labor_data, pero
+    cada entrada se carga (y congela) solo cuando se accede a ella por primera vez.
+    Consultar claves, `in` y len() no cargan ninguna serie.
+    """
+
+    def __init__(self, snapshot_id, loaders, derived=None):
+        """
+        Args:
+            snapshot_id (str): ID del snapshot al que pertenecen las series
+            loaders (dict): {clave: callable sin argumentos que retorna una MonthlySeries
+                (o DataFrame date/value) o un Mapping de ellas (series anidadas)}
+            derived (dict): {clave: (claves de las que depende, función)}; la función
+                recibe las series de sus dependencias y retorna la serie derivada
+        """
+        self.snapshot_id = snapshot_id
+        self._loaders = dict(loaders)
+        # Una serie derivada solo existe si existen todas sus dependencias
+        self._derived = {
+            key: (deps, fn) for key, (deps, fn) in (derived or {}).items()
+            if all(dep in self._loaders for dep in deps)
+        }
+        self._keys = list(self._loaders) + [key for key in self._derived if key not in self._loaders]
+        self._data = {}
+        # Un lock por clave: sesiones concurrentes no cargan dos veces la misma serie
+        # y la carga de una serie no bloquea la de las demás
+        self._locks = {key: threading.Lock() for key in self._keys}
+
+    def _load(self, key):
+        if key in self._loaders:
+            value = self._loaders[key]()
+        else:
+            deps, fn = self._derived[key]
+            value = fn(*(self[dep] for dep in deps))
+
+        if isinstance(value, (MonthlySeries, pd.DataFrame)):
+            return freeze_series(value)
+        # Series anidadas (p. ej. empleo por sector)
+        return MappingProxyType({k: freeze_series(v) for k, v in value.items()})
+
+    def __getitem__(self, key):
+        if key in self._data:
+            return self._data[key]
+        if key not in self._locks:
+            raise KeyError(key)
+
+        with self._locks[key]:
+            if key not in self._data:
+                self._data[key] = self._load(key)
+        return self._data[key]
+
+    def __contains__(self, key):
+        return key in self._locks
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def loaded_keys(self):
+        """
+        Claves cuyas series ya están en memoria
+        """
+        return [key for key in self._keys if key in self._data]
+
+    def __repr__(self):
+        return (f"SeriesStore(snapshot_id={self.snapshot_id!r}, series={self._keys}, "
+                f"loaded={self.loaded_keys()})")
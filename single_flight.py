@@ -0,0 +1,222 @@
+"""
+Coordinación single-flight de actualizaciones desde APIs
+Garantiza que solo una actualización completa se ejecute a la vez, tanto entre
+hilos/sesiones del mismo proceso (lock en memoria) como entre procesos distintos
+(lease en la tabla refresh_lease de SQLite, p. ej. dashboard y update_data.py).
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+import logging
+from config import REFRESH_LEASE_CONFIG
+
+
+class _Flight:
+    """
+    Llamada en curso dentro del proceso; los seguidores esperan su resultado
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+class RefreshLease:
+    """
+    Lease entre procesos almacenado en SQLite con tiempo de expiración
+    """
+
+    def __init__(self, db_path, name, ttl_seconds=None):
+        self.db_path = db_path
+        self.name = name
+        self.ttl_seconds = ttl_seconds or REFRESH_LEASE_CONFIG['ttl_seconds']
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+    def try_acquire(self):
+        """
+        Intenta tomar el lease si está libre o expirado
+
+        Returns:
+            bool: True si el lease quedó a nombre de este proceso
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            # BEGIN IMMEDIATE serializa a los escritores que compiten por el lease
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute(
+                'SELECT owner, expires_at FROM refresh_lease WHERE name = ?', (self.name,)
+            ).fetchone()
+
+            now = time.time()
+            if row and row[1] > now and row[0] != self.owner:
+                conn.rollback()
+                return False
+
+            conn.execute('''
+                INSERT OR REPLACE INTO refresh_lease (name, owner, acquired_at, expires_at)
+                VALUES (?, ?, ?, ?)
+            ''', (self.name, self.owner, now, now + self.ttl_seconds))
+            conn.commit()
+            return True
+        finally:
+            conn.close()
+
+    def renew(self):
+        """
+        Extiende la expiración del lease mientras siga perteneciendo a este proceso
+
+        Returns:
+            bool: True si el lease se renovó
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            cursor = conn.execute(
+                'UPDATE refresh_lease SET expires_at = ? WHERE name = ? AND owner = ?',
+                (time.time() + self.ttl_seconds, self.name, self.owner)
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def start_heartbeat(self, interval=None):
+        """
+        Renueva el lease periódicamente en un hilo de fondo mientras dure la actualización
+
+        Args:
+            interval (float): Segundos entre renovaciones (por defecto REFRESH_LEASE_CONFIG)
+
+        Returns:
+            threading.Event: Evento que detiene el heartbeat al activarse
+        """
+        interval = interval or REFRESH_LEASE_CONFIG['renew_interval_seconds']
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(interval):
+                try:
+                    if not self.renew():
+                        logging.warning(f"Lease '{self.name}' ya no pertenece a este proceso")
+                        return
+                except sqlite3.Error as e:
+                    logging.warning(f"No se pudo renovar el lease '{self.name}': {e}")
+
+        threading.Thread(target=beat, name=f"lease-{self.name}", daemon=True).start()
+        return stop
+
+    def release(self):
+        """
+        Libera el lease si sigue perteneciendo a este proceso
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute('DELETE FROM refresh_lease WHERE name = ? AND owner = ?', (self.name, self.owner))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def is_held(self):
+        """
+        Indica si otro proceso mantiene un lease vigente
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            row = conn.execute(
+                'SELECT expires_at FROM refresh_lease WHERE name = ?', (self.name,)
+            ).fetchone()
+            return bool(row and row[0] > time.time())
+        finally:
+            conn.close()
+
+    def wait_released(self, timeout=None):
+        """
+        Espera a que el lease quede libre
+
+        Returns:
+            bool: True si se liberó antes del timeout
+        """
+        timeout = timeout if timeout is not None else REFRESH_LEASE_CONFIG['wait_timeout_seconds']
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if not self.is_held():
+                return True
+            time.sleep(REFRESH_LEASE_CONFIG['poll_interval_seconds'])
+        return False
+
+
+def run_single_flight(db_path, name, fn, wait=True, still_needed=None):
+    """
+    Ejecuta fn como única actualización en curso para `name`
+
+    Args:
+        db_path (str): Ruta de la base de datos SQLite que guarda el lease
+        name (str): Nombre de la operación (p. ej. 'full_refresh')
+        fn (callable): Operación a ejecutar por el líder
+        wait (bool): Si otro hilo/proceso ya la ejecuta, esperar su resultado;
+            si es False se retorna inmediatamente para seguir sirviendo los datos actuales
+        still_needed (callable): Verificación opcional tras obtener el lease, para no
+            repetir una actualización que otro líder acaba de completar
+
+    Returns:
+        object: Resultado de fn (propio o del líder del mismo proceso), o None si
+            la ejecutó otro proceso o no se esperó
+    """
+    with _flights_lock:
+        flight = _flights.get(name)
+        is_leader = flight is None
+        if is_leader:
+            flight = _Flight()
+            _flights[name] = flight
+
+    # Seguidor dentro del mismo proceso: compartir el resultado del líder
+    if not is_leader:
+        if not wait:
+            logging.info(f"Actualización '{name}' ya en curso en este proceso; se sirven los datos actuales")
+            return None
+        flight.done.wait(REFRESH_LEASE_CONFIG['wait_timeout_seconds'])
+        if flight.error:
+            raise flight.error
+        return flight.result
+
+    try:
+        lease = RefreshLease(db_path, name)
+
+        if not lease.try_acquire():
+            # Otro proceso es el líder: esperar a que termine o seguir con los datos actuales
+            if wait:
+                logging.info(f"Actualización '{name}' en curso en otro proceso; esperando a que termine")
+                lease.wait_released()
+            else:
+                logging.info(f"Actualización '{name}' en curso en otro proceso; se sirven los datos actuales")
+            return None
+
+        try:
+            if still_needed is not None and not still_needed():
+                logging.info(f"Actualización '{name}' ya no es necesaria; otro proceso la completó")
+                return None
+
+            heartbeat = lease.start_heartbeat()
+            try:
+                flight.result = fn()
+            finally:
+                heartbeat.set()
+            return flight.result
+        finally:
+            lease.release()
+
+    except Exception as e:
+        flight.error = e
+        raise
+
+    finally:
+        with _flights_lock:
+            _flights.pop(name, None)
+        flight.done.set()
@@ -0,0 +1,198 @@
+"""
+Perfil de arranque del dashboard
+Mide el tiempo de importación de los módulos (python -X importtime) y las fases
+del primer renderizado, y los compara con el presupuesto STARTUP_BUDGET.
+
+Uso:
+    python startup_profile.py              # Muestra el perfil de importación y de fases
+    python startup_profile.py --check      # Además retorna código 1 si se excede el presupuesto
+    python startup_profile.py --skip-app   # Solo el perfil de importación
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+import logging
+from contextlib import contextmanager
+
+_phases = {}
+_phases_lock = threading.Lock()
+
+
+def record_phase(name, started_at):
+    """
+    Registra la duración de una fase del arranque medida desde started_at
+
+    Solo se guarda la primera medición de cada fase en el proceso (arranque en frío);
+    las ejecuciones posteriores del script de Streamlit no la sobrescriben.
+
+    Args:
+        name (str): Nombre de la fase
+        started_at (float): Valor de time.perf_counter() al inicio de la fase
+
+    Returns:
+        float: Duración en milisegundos
+    """
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    with _phases_lock:
+        if name not in _phases:
+            _phases[name] = elapsed_ms
+            logging.info(f"Arranque - fase '{name}': {elapsed_ms:.0f} ms")
+    return elapsed_ms
+
+
+@contextmanager
+def phase(name):
+    """
+    Mide la duración del bloque como una fase del arranque
+    """
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(name, started_at)
+
+
+def get_phases():
+    """
+    Obtiene las fases registradas en este proceso {nombre: milisegundos}
+    """
+    with _phases_lock:
+        return dict(_phases)
+
+
+def reset_phases():
+    """
+    Borra las fases registradas (para volver a medir un arranque)
+    """
+    with _phases_lock:
+        _phases.clear()
+
+
+def profile_imports(module='dashboard'):
+    """
+    Importa el módulo en un proceso nuevo con -X importtime
+
+    Args:
+        module (str): Módulo a importar
+
+    Returns:
+        list: Diccionarios con module, self_ms, cumulative_ms y depth por cada importación
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        entries.append({
+            'module': name.strip(),
+            'self_ms': int(self_us) / 1000,
+            'cumulative_ms': int(cumulative_us) / 1000,
+            'depth': (len(name) - len(name.lstrip()) - 1) // 2
+        })
+    return entries
+
+
+def profile_phases():
+    """
+    Ejecuta el dashboard una vez con AppTest y obtiene las fases registradas
+
+    Returns:
+        dict: {fase: milisegundos}
+    """
+    from streamlit.testing.v1 import AppTest
+    # El dashboard registra sus fases en el módulo importado, no en __main__
+    import startup_profile
+
+    startup_profile.reset_phases()
+    app = AppTest.from_file(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard.py'),
+                            default_timeout=120)
+    app.run()
+    return startup_profile.get_phases()
+
+
+def check_budget(import_entries, phases, budget):
+    """
+    Compara el perfil de arranque con el presupuesto
+
+    Args:
+        import_entries (list): Resultado de profile_imports
+        phases (dict): Resultado de profile_phases (vacío si no se midieron)
+        budget (dict): Presupuesto con la estructura de STARTUP_BUDGET
+
+    Returns:
+        list: Descripción de cada presupuesto excedido
+    """
+    violations = []
+
+    top_level = [entry for entry in import_entries if entry['depth'] == 0]
+    import_ms = top_level[-1]['cumulative_ms'] if top_level else 0
+    if import_ms > budget['import_ms']:
+        violations.append(f"Importación: {import_ms:.0f} ms (presupuesto {budget['import_ms']} ms)")
+
+    imported = {entry['module'] for entry in import_entries}
+    for module in budget['deferred_modules']:
+        if module in imported:
+            violations.append(f"Módulo diferido importado al arrancar: {module}")
+
+    for name, limit_ms in budget['phases'].items():
+        if name in phases and phases[name] > limit_ms:
+            violations.append(f"Fase '{name}': {phases[name]:.0f} ms (presupuesto {limit_ms} ms)")
+
+    return violations
+
+
+def main():
+    """
+    Función principal del script
+    """
+    import argparse
+    from config import STARTUP_BUDGET
+
+    parser = argparse.ArgumentParser(description='Perfil de arranque del dashboard')
+    parser.add_argument('--module', default='dashboard', help='Módulo cuyo import se perfila')
+    parser.add_argument('--top', type=int, default=15, help='Número de importaciones a mostrar')
+    parser.add_argument('--skip-app', action='store_true', help='No medir las fases del primer renderizado')
+    parser.add_argument('--check', action='store_true', help='Retornar código 1 si se excede el presupuesto')
+    args = parser.parse_args()
+
+    import_entries = profile_imports(args.module)
+
+    print("=" * 60)
+    print(f"IMPORTACIÓN DE '{args.module}'")
+    print("=" * 60)
+    for entry in sorted(import_entries, key=lambda e: e['cumulative_ms'], reverse=True)[:args.top]:
+        print(f"{entry['cumulative_ms']:9.1f} ms  {entry['self_ms']:8.1f} ms  {'  ' * entry['depth']}{entry['module']}")
+
+    phases = {}
+    if not args.skip_app:
+        phases = profile_phases()
+        print("=" * 60)
+        print("FASES DEL PRIMER RENDERIZADO")
+        print("=" * 60)
+        for name, elapsed_ms in phases.items():
+            print(f"{elapsed_ms:9.1f} ms  {name}")
+
+    violations = check_budget(import_entries, phases, STARTUP_BUDGET)
+    print("=" * 60)
+    if violations:
+        print("PRESUPUESTO EXCEDIDO")
+        for violation in violations:
+            print(f"- {violation}")
+    else:
+        print("Presupuesto de arranque cumplido")
+
+    return 1 if args.check and violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@ Script para actualización manual y automática de datos del mercado laboral
 import argparse
 import logging
 import sys
+from collections.abc import Mapping
 from datetime import datetime
 from data_collector import LaborMarketDataCollector
 
@@ -86,6 +87,8 @@ def update_all_data(force_refresh=False, verbose=False):
         
         total_records = 0
         for metric, df in data_dict.items():
+            if isinstance(df, Mapping):  # Series anidadas (p. ej. empleo por sector)
+                continue
             records_count = len(df) if not df.empty else 0
             total_records += records_count
             
@@ -104,6 +107,8 @@ def update_all_data(force_refresh=False, verbose=False):
         
         quality_issues = 0
         for metric, df in data_dict.items():
+            if isinstance(df, Mapping):
+                continue
             if df.empty:
                 logger.warning(f"Métrica {metric} sin datos")
                 quality_issues += 1
@@ -119,12 +124,33 @@ def update_all_data(force_refresh=False, verbose=False):
         else:
             logger.warning(f"Calidad de datos: {quality_issues} problema(s) encontrado(s)")
         
+        # Anomalías detectadas en la ingesta para el último dato de cada métrica
+        from config import SERIES_MAPPING, SECTOR_EMPLOYMENT_SERIES
+        anomalies = collector.get_anomalies()
+        latest_series = []
+        for metric, df in data_dict.items():
+            if isinstance(df, Mapping):  # Empleo por sector: cada sector con su serie de BLS
+                latest_series.extend(
+                    (name, SECTOR_EMPLOYMENT_SERIES.get(name, name), sector_df) for name, sector_df in df.items()
+                )
+            else:
+                latest_series.append((metric, SERIES_MAPPING.get(metric, metric), df))
+        
+        for metric, series_id, df in latest_series:
+            flagged = anomalies.get(series_id)
+            if df.empty or flagged is None:
+                continue
+            if flagged['series'].latest_date == df['date'].max():
+                logger.warning(f"Anomalía en el último dato de {metric}: {flagged['series'].latest_value:.2f} "
+                               f"(z cambio: {flagged['mad_z'][-1]:.1f}, z estacional: {flagged['seasonal_z'][-1]:.1f})")
+        
         # Estadísticas de caché
         logger.info("Verificando estado del caché...")
         
         cache_stats = []
-        from config import SERIES_MAPPING
-        for metric in data_dict.keys():
+        for metric, df in data_dict.items():
+            if isinstance(df, Mapping):
+                continue
             series_id = SERIES_MAPPING.get(metric, metric)
             is_fresh = collector.is_cache_fresh(series_id)
             cache_stats.append((metric, 'FRESCO' if is_fresh else 'OBSOLETO'))
@@ -132,6 +158,20 @@ def update_all_data(force_refresh=False, verbose=False):
         for metric, status in cache_stats:
             logger.info(f"Cache {metric:.<30} {status}")
         
+        # Descomposición estacional (solo de las series cuya entrada cambió)
+        logger.info("Actualizando descomposición estacional...")
+        decomposition = collector.update_decompositions()
+        logger.info(f"Descomposición: {decomposition['computed']} series recalculadas, "
+                    f"{decomposition['skipped']} sin cambios "
+                    f"({decomposition['series_per_second']:.1f} series/s)")
+        
+        # Pronósticos: actualización incremental o reestimación en paralelo
+        logger.info("Actualizando pronósticos...")
+        forecasts = collector.update_forecasts()
+        logger.info(f"Pronósticos: {forecasts['refit']} series reestimadas, "
+                    f"{forecasts['incremental']} actualizadas incrementalmente, "
+                    f"{forecasts['skipped']} sin cambios ({forecasts['series_per_second']:.1f} series/s)")
+        
         logger.info("=" * 60)
         logger.info("ACTUALIZACION COMPLETADA EXITOSAMENTE")
         logger.info(f"Timestamp final: {datetime.now()}")
@@ -175,6 +215,21 @@ def validate_api_keys():
     
     return True
 
+def import_vintages():
+    """
+    Importa el historial de publicaciones de FRED para las consultas as-of
+    """
+    logger = logging.getLogger()
+    
+    try:
+        collector = LaborMarketDataCollector()
+        imported = collector.import_fred_vintages()
+        for series_id, count in imported.items():
+            logger.info(f"Vintages {series_id:.<30} {count} valores")
+        logger.info(f"Vintages importados para {len(imported)} series de FRED")
+    except Exception as e:
+        logger.error(f"Error importando vintages: {e}")
+
 def cleanup_old_data(days_to_keep=30):
     """
     Limpia datos antiguos de la base de datos
@@ -236,7 +291,7 @@ def generate_report():
         # Resumen ejecutivo
         latest_data = {}
         for metric, df in data_dict.items():
-            if not df.empty:
+            if not isinstance(df, Mapping) and not df.empty:
                 latest_data[metric] = {
                     'value': df.iloc[-1]['value'],
                     'date': df.iloc[-1]['date'].strftime('%Y-%m'),
@@ -287,6 +342,7 @@ def main():
     parser.add_argument('--validate', action='store_true', help='Validar conectividad de APIs')
     parser.add_argument('--cleanup', type=int, metavar='DAYS', help='Limpiar datos antiguos (días a conservar)')
     parser.add_argument('--report', action='store_true', help='Generar reporte de estado')
+    parser.add_argument('--vintages', action='store_true', help='Importar historial de publicaciones de FRED (ALFRED)')
     
     args = parser.parse_args()
     
@@ -312,6 +368,11 @@ def main():
             print("ERROR: Fallo en la actualización de datos")
             success = False
     
+    # Importar vintages de FRED si se solicita
+    if success and args.vintages:
+        print("Importando historial de publicaciones de FRED...")
+        import_vintages()
+    
     # Limpiar datos antiguos si se solicita
     if success and args.cleanup:
         print(f"Limpiando datos antiguos (conservando {args.cleanup} días)...")
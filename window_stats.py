@@ -0,0 +1,125 @@
+"""
+Estadísticas de ventanas arbitrarias en tiempo constante
+Sobre el panel mensual alineado se precalculan, una vez por snapshot, sumas
+prefijas (de valores, cuadrados y observaciones válidas) y sparse tables de
+mínimos y máximos. Con ellas la media, desviación estándar, mínimo y máximo
+de cualquier serie en cualquier rango de meses se obtienen en O(1).
+"""
+
+import numpy as np
+from monthly_series import month_ordinal, month_ceil_ordinal
+
+
+class WindowStatsIndex:
+    """
+    Índice de estadísticas por ventana para todas las series de un MonthlyPanel
+    """
+
+    def __init__(self, panel):
+        """
+        Args:
+            panel (MonthlyPanel): Panel alineado del snapshot
+        """
+        self.panel = panel
+        self.start_month = int(panel.months[0]) if len(panel.months) else 0
+        values = panel.values
+        valid = panel.mask
+        n_series, n_months = values.shape
+
+        # Los valores se centran en la media de cada serie para que la suma de
+        # cuadrados no pierda precisión en series de gran magnitud (p. ej. nóminas)
+        counts = valid.sum(axis=1)
+        self._offset = np.divide(np.where(valid, values, 0.0).sum(axis=1), counts,
+                                 out=np.zeros(n_series), where=counts > 0)
+
+        # Sumas prefijas con una columna inicial de ceros: suma(i..j) = c[j+1] - c[i]
+        filled = np.where(valid, values - self._offset[:, None], 0.0)
+        self._sum = np.zeros((n_series, n_months + 1))
+        self._sumsq = np.zeros((n_series, n_months + 1))
+        self._count = np.zeros((n_series, n_months + 1), dtype=np.int64)
+        np.cumsum(filled, axis=1, out=self._sum[:, 1:])
+        np.cumsum(filled ** 2, axis=1, out=self._sumsq[:, 1:])
+        np.cumsum(valid, axis=1, out=self._count[:, 1:])
+
+        # Sparse tables: nivel k guarda el mínimo/máximo de los bloques de 2**k meses
+        self._min_table = [np.where(valid, values, np.inf)]
+        self._max_table = [np.where(valid, values, -np.inf)]
+        span = 1
+        while span * 2 <= n_months:
+            prev_min, prev_max = self._min_table[-1], self._max_table[-1]
+            self._min_table.append(np.minimum(prev_min[:, :-span], prev_min[:, span:]))
+            self._max_table.append(np.maximum(prev_max[:, :-span], prev_max[:, span:]))
+            span *= 2
+
+        # Último mes con dato de cada serie (para ventanas relativas como "últimos 12 meses")
+        has_data = counts > 0
+        last_index = n_months - 1 - np.argmax(valid[:, ::-1], axis=1)
+        self._last_month = np.where(has_data, self.start_month + last_index, -1)
+
+    def __contains__(self, key):
+        return key in self.panel
+
+    def last_month(self, key):
+        """
+        Ordinal del último mes con dato de la serie
+        """
+        return int(self._last_month[self.panel.row_index(key)])
+
+    def stats(self, key, start_month, end_month):
+        """
+        Estadísticas de la serie entre dos ordinales de mes (ambos incluidos), en O(1)
+
+        Returns:
+            dict: count, mean, std (muestral), min y max (NaN si no hay datos)
+        """
+        row = self.panel.row_index(key)
+        n_months = self._sum.shape[1] - 1
+        lo = max(start_month - self.start_month, 0)
+        hi = min(end_month - self.start_month, n_months - 1)
+
+        result = {'count': 0, 'mean': np.nan, 'std': np.nan, 'min': np.nan, 'max': np.nan}
+        if hi < lo:
+            return result
+
+        count = int(self._count[row, hi + 1] - self._count[row, lo])
+        if count == 0:
+            return result
+
+        total = self._sum[row, hi + 1] - self._sum[row, lo]
+        total_sq = self._sumsq[row, hi + 1] - self._sumsq[row, lo]
+        centered_mean = total / count
+
+        # Mínimo/máximo con dos bloques solapados de 2**k meses que cubren [lo, hi]
+        level = (hi - lo + 1).bit_length() - 1
+        right = hi - (1 << level) + 1
+        result.update({
+            'count': count,
+            'mean': self._offset[row] + centered_mean,
+            'std': np.sqrt(max(total_sq - count * centered_mean ** 2, 0.0) / (count - 1)) if count > 1 else np.nan,
+            'min': min(self._min_table[level][row, lo], self._min_table[level][row, right]),
+            'max': max(self._max_table[level][row, lo], self._max_table[level][row, right])
+        })
+        return result
+
+    def stats_for_dates(self, key, start=None, end=None):
+        """
+        Estadísticas de la serie entre dos fechas (mismo criterio que MonthlySeries.window)
+        """
+        start_month = self.start_month if start is None else month_ceil_ordinal(start)
+        end_month = self.last_month(key) if end is None else month_ordinal(end)
+        return self.stats(key, start_month, end_month)
+
+    def stats_for_preset(self, key, preset):
+        """
+        Estadísticas de la serie en una ventana definida como en FILTER_PRESETS
+
+        Args:
+            preset (dict): Con 'months' (últimos N meses), 'year' o 'start_date'/'end_date'
+        """
+        if 'months' in preset:
+            last = self.last_month(key)
+            return self.stats(key, last - preset['months'], last)
+        if 'year' in preset:
+            first = (preset['year'] - 1970) * 12
+            return self.stats(key, first, first + 11)
+        return self.stats_for_dates(key, preset.get('start_date'), preset.get('end_date'))